@@ -0,0 +1,342 @@
+"""
+Usage:
+  build_history.py report [--db=<file>] [--command=<name>] [--window=N] [--threshold=Z] [--last=N]
+  build_history.py run <command> [--db=<file>] -- <args>...
+
+Records the duration of build phases in a local SQLite database and reports trends and
+slowdowns. `generate.py` appends one run per invocation; `run` times any other command,
+e.g. latexmk, as a single phase. `report` exits with status 1 if a phase is flagged, so a
+build script can stop on a slowdown.
+
+Options:
+  --db=<file>          SQLite database with the build history [default: .cache/build_history.sqlite].
+  --command=<name>     Only report runs of this command, e.g. tex, md, mkdocs, check_url.
+  --window=N           Number of previous runs that form the baseline of a phase [default: 10].
+  --threshold=Z        z-score above which the latest run of a phase is flagged [default: 3.0].
+  --last=N             Number of runs shown in the trend column [default: 20].
+
+Examples:
+  python bin/build_history.py report
+  python bin/build_history.py report --command=tex --window=20
+  python bin/build_history.py run pdf -- latexmk -pdf -silent benchmarks.tex
+"""
+
+import atexit
+import os
+import platform
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from cloudmesh.common.console import Console
+
+DEFAULT_HISTORY_DB = ".cache/build_history.sqlite"
+
+# A slowdown must also exceed this fraction of the baseline mean and this many seconds,
+# so that phases taking a few milliseconds with almost no variance are not flagged for noise.
+MIN_RELATIVE_SLOWDOWN = 0.10
+MIN_ABSOLUTE_SLOWDOWN = 0.1
+MIN_BASELINE_RUNS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT NOT NULL,
+    command TEXT NOT NULL,
+    seconds REAL,
+    host TEXT,
+    platform TEXT,
+    python TEXT,
+    cpus INTEGER
+);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    value REAL
+);
+CREATE INDEX IF NOT EXISTS phases_by_name ON phases(name, run_id);
+"""
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def connect(db_path: str = DEFAULT_HISTORY_DB) -> sqlite3.Connection:
+    """
+    Opens the history database at `db_path`, creating it and its tables if needed.
+    """
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+class BuildHistory(object):
+    """
+    Collects the phase timings and metrics of one build run and appends them to the history.
+
+    Example:
+
+        history = BuildHistory("tex")
+        with history.phase("load"):
+            manager = YamlManager(files)
+        history.metric("entries", len(manager))
+        history.save()
+    """
+
+    def __init__(self, command: str, db_path: str = DEFAULT_HISTORY_DB):
+        """
+        Parameters:
+            command (str): name of the build command, used to group runs in the report
+            db_path (str): SQLite database to append to
+        """
+        self.command = command
+        self.db_path = db_path
+        self.started = datetime.now(timezone.utc)
+        self._start = time.perf_counter()
+        self.phases: list[tuple[str, float]] = []
+        self.metrics: dict[str, float] = {}
+        self.saved = False
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Times the body of the `with` block as phase `name`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def metric(self, name: str, value) -> None:
+        """
+        Records a numeric metric of the run such as an entry count or a cache hit rate.
+        """
+        self.metrics[name] = None if value is None else float(value)
+
+    def save(self) -> int | None:
+        """
+        Appends the run to the database. Does nothing if the run was already saved.
+
+        Returns:
+            int or None: id of the run, or None if it could not be written
+        """
+        if self.saved:
+            return None
+        self.saved = True
+        seconds = time.perf_counter() - self._start
+        try:
+            connection = connect(self.db_path)
+            with connection:
+                cursor = connection.execute(
+                    "INSERT INTO runs (started, command, seconds, host, platform, python, cpus)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.started.isoformat(timespec="seconds"),
+                        self.command,
+                        seconds,
+                        socket.gethostname(),
+                        platform.platform(),
+                        platform.python_version(),
+                        os.cpu_count(),
+                    ),
+                )
+                run_id = cursor.lastrowid
+                connection.executemany(
+                    "INSERT INTO phases (run_id, position, name, seconds) VALUES (?, ?, ?, ?)",
+                    [
+                        (run_id, i, name, value)
+                        for i, (name, value) in enumerate(self.phases)
+                    ],
+                )
+                connection.executemany(
+                    "INSERT INTO metrics (run_id, name, value) VALUES (?, ?, ?)",
+                    [(run_id, name, value) for name, value in self.metrics.items()],
+                )
+            connection.close()
+        except sqlite3.Error as e:
+            Console.warning(f"Could not record build history in {self.db_path}: {e}")
+            return None
+        return run_id
+
+    def save_at_exit(self) -> "BuildHistory":
+        """
+        Registers `save` to run when the program exits, including through sys.exit.
+        """
+        atexit.register(self.save)
+        return self
+
+
+def phase_series(
+    connection: sqlite3.Connection, command: str | None = None
+) -> dict[tuple[str, str], list[float]]:
+    """
+    Returns the durations of every (command, phase) in run order, including a "total" phase.
+
+    A phase timed several times in one run, e.g. once per file, counts with its sum.
+    """
+    query = (
+        "SELECT runs.command, phases.name, SUM(phases.seconds) FROM phases"
+        " JOIN runs ON runs.id = phases.run_id"
+    )
+    total_query = "SELECT command, 'total', seconds FROM runs"
+    parameters = ()
+    if command is not None:
+        query += " WHERE runs.command = ?"
+        total_query += " WHERE command = ?"
+        parameters = (command,)
+    query += " GROUP BY runs.id, phases.name ORDER BY runs.id, MIN(phases.position)"
+    total_query += " ORDER BY id"
+
+    series: dict[tuple[str, str], list[float]] = {}
+    for rows in (
+        connection.execute(total_query, parameters),
+        connection.execute(query, parameters),
+    ):
+        for run_command, name, seconds in rows:
+            series.setdefault((run_command, name), []).append(seconds)
+    return series
+
+
+def check_regression(values: list[float], window: int = 10, threshold: float = 3.0) -> dict:
+    """
+    Compares the last value of `values` with the `window` values before it.
+
+    Parameters:
+        values (list[float]): durations of one phase in run order
+        window (int): number of previous runs forming the baseline
+        threshold (float): z-score above which the last value counts as a regression
+    Returns:
+        dict: latest, mean, stdev, z (None if the baseline is too short) and regression (bool)
+    """
+    latest = values[-1]
+    baseline = values[-window - 1 : -1]
+    result = {"latest": latest, "mean": None, "stdev": None, "z": None, "regression": False}
+    if len(baseline) < MIN_BASELINE_RUNS:
+        return result
+
+    mean = statistics.fmean(baseline)
+    stdev = statistics.stdev(baseline)
+    # Guard against a perfectly stable baseline
+    stdev = max(stdev, 0.01 * mean, 1e-6)
+    z = (latest - mean) / stdev
+    result.update(mean=mean, stdev=stdev, z=z)
+    result["regression"] = (
+        z > threshold
+        and latest > mean * (1 + MIN_RELATIVE_SLOWDOWN)
+        and latest - mean > MIN_ABSOLUTE_SLOWDOWN
+    )
+    return result
+
+
+def sparkline(values: list[float]) -> str:
+    """
+    Returns the trend of `values` as a line of block characters.
+    """
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    if high == low:
+        return SPARK_CHARS[0] * len(values)
+    scale = (len(SPARK_CHARS) - 1) / (high - low)
+    return "".join(SPARK_CHARS[round((v - low) * scale)] for v in values)
+
+
+def report(
+    db_path: str = DEFAULT_HISTORY_DB,
+    command: str | None = None,
+    window: int = 10,
+    threshold: float = 3.0,
+    last: int = 20,
+) -> list[tuple[str, str]]:
+    """
+    Prints the trend of every phase and flags phases whose latest run is significantly slower.
+
+    Parameters:
+        db_path (str): history database
+        command (str or None): only report this command
+        window (int): number of previous runs forming the baseline
+        threshold (float): z-score above which a phase is flagged
+        last (int): number of runs shown in the trend column
+    Returns:
+        list[tuple[str, str]]: the (command, phase) pairs flagged as regressions
+    """
+    if not os.path.exists(db_path):
+        Console.warning(f"No build history found in {db_path}")
+        return []
+
+    connection = connect(db_path)
+    series = phase_series(connection, command)
+    connection.close()
+
+    regressions = []
+    print(
+        f"{'command':<10} {'phase':<24} {'runs':>5} {'latest':>9} {'baseline':>17} {'z':>6}  trend"
+    )
+    # Group by command; within a command the total comes first, then the phases in run order
+    for (run_command, name), values in sorted(series.items(), key=lambda item: item[0][0]):
+        result = check_regression(values, window=window, threshold=threshold)
+        if result["mean"] is None:
+            baseline = "-"
+            z = "-"
+        else:
+            baseline = f"{result['mean']:.2f}s ± {result['stdev']:.2f}"
+            z = f"{result['z']:.1f}"
+        flag = "  SLOWER" if result["regression"] else ""
+        print(
+            f"{run_command:<10} {name:<24} {len(values):>5} {result['latest']:>8.2f}s {baseline:>17} {z:>6}"
+            f"  {sparkline(values[-last:])}{flag}"
+        )
+        if result["regression"]:
+            regressions.append((run_command, name))
+
+    for run_command, name in regressions:
+        Console.error(
+            f"Phase '{name}' of '{run_command}' is significantly slower than its last {window} runs"
+        )
+    return regressions
+
+
+def run_command(command: str, arguments: list[str], db_path: str = DEFAULT_HISTORY_DB) -> int:
+    """
+    Runs `arguments` as a subprocess and records its duration as a single phase of `command`.
+
+    Returns:
+        int: exit code of the subprocess
+    """
+    history = BuildHistory(command, db_path=db_path)
+    with history.phase(command):
+        returncode = subprocess.call(arguments)
+    history.metric("returncode", returncode)
+    history.save()
+    return returncode
+
+
+if __name__ == "__main__":
+    from docopt import docopt
+
+    args = docopt(__doc__)
+    if args["report"]:
+        regressions = report(
+            db_path=args["--db"],
+            command=args["--command"],
+            window=int(args["--window"]),
+            threshold=float(args["--threshold"]),
+            last=int(args["--last"]),
+        )
+        sys.exit(1 if regressions else 0)
+    elif args["run"]:
+        sys.exit(run_command(args["<command>"], args["<args>"], db_path=args["--db"]))
@@ -0,0 +1,255 @@
+"""
+Build manifest for incremental runs of `generate.py --incremental`.
+
+For every output format the manifest (default `.cache/manifest-<format>.json`, shared by
+md and mkdocs, which write the same pages) stores
+
+- a digest of the build settings (format, output directory, columns, options) and of
+  the writer modules that contain the templates, and
+- for every entry the digest of its YAML data and the size and mtime of each output
+  file it produced (detail page, LaTeX section, radar charts).
+
+An entry is rebuilt if its data, the settings or the templates changed, or if one of
+its output files is missing or was overwritten since the last build. Outputs of
+entries that no longer exist are deleted. Outputs shared by all entries, such as
+tables and indexes, are always regenerated; they are cheap.
+
+Example:
+
+    manifest = BuildManifest("tex", settings={"columns": columns})
+    outdated = manifest.outdated(records)
+    manifest.remove_stale(records)
+    ... write the outputs of `outdated` ...
+    manifest.update(records)
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+
+from cloudmesh.common.console import Console
+
+from generate_latex import RADAR_BACKENDS
+
+MANIFEST_VERSION = 1
+DEFAULT_MANIFEST_DIR = ".cache"
+DEFAULT_OUTPUT_DIR = "content"
+
+# Output files written per entry, relative to the output directory (generate.py --outdir).
+# {radar} stands for each radar chart format of the radar backend, see RADAR_BACKENDS.
+ENTRY_OUTPUTS = {
+    "md": ["md/benchmarks/{id}.md"],
+    "mkdocs": ["md/benchmarks/{id}.md"],
+    "tex": [
+        "tex/section/{id}.tex",
+        "tex/images/{id}_radar.{radar}",
+    ],
+}
+
+# md and mkdocs write the same pages, so they share one manifest. Building one after the
+# other rebuilds all pages, as the format is part of the settings digest.
+MANIFEST_NAMES = {"md": "md", "mkdocs": "md", "tex": "tex"}
+
+# Modules whose code renders the outputs; a change in any of them rebuilds everything
+TEMPLATE_MODULES = [
+    "generate_latex.py",
+    "radar_vector.py",
+    "md_writer.py",
+    "mkdocs_writer.py",
+    "yaml_manager.py",
+    "citation_cache.py",
+]
+
+
+def entry_digest(entry) -> str:
+    """
+    Returns the SHA-256 of the YAML data of `entry` (a raw entry or a BenchmarkRecord).
+    """
+    data = getattr(entry, "raw", None)
+    if data is None:
+        data = dict(entry)
+    text = json.dumps(dict(data), sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def templates_digest(modules: list[str] = TEMPLATE_MODULES) -> str:
+    """
+    Returns the SHA-256 over the source of the writer modules in bin/.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(os.path.join(directory, module), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def entry_outputs(
+    format_type: str, output_dir: str = DEFAULT_OUTPUT_DIR, radar_backend: str = "matplotlib"
+) -> list[str]:
+    """
+    Returns the output files written per entry of `format_type`, with an {id} placeholder.
+
+    Parameters:
+        format_type (str): output format, one of ENTRY_OUTPUTS
+        output_dir (str): output directory of the build
+        radar_backend (str): radar chart backend, one of RADAR_BACKENDS
+    Returns:
+        list[str]: the paths below `output_dir`
+    """
+    paths = []
+    for path in ENTRY_OUTPUTS[format_type]:
+        path = os.path.normpath(os.path.join(output_dir, path))
+        if "{radar}" in path:
+            paths += [
+                path.replace("{radar}", fmt) for fmt in RADAR_BACKENDS[radar_backend]
+            ]
+        else:
+            paths.append(path)
+    return paths
+
+
+def _file_state(path: str) -> list[int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class BuildManifest(object):
+    """
+    Tracks which entries of one output format are up to date.
+    """
+
+    def __init__(
+        self,
+        format_type: str,
+        settings: dict | None = None,
+        path: str | None = None,
+        output_dir: str = DEFAULT_OUTPUT_DIR,
+        radar_backend: str = "matplotlib",
+    ):
+        """
+        Loads the manifest of `format_type`.
+
+        Parameters:
+            format_type (str): output format, one of ENTRY_OUTPUTS
+            settings (dict or None): build settings that affect every output, e.g. the columns
+            path (str or None): manifest file, defaults to .cache/manifest-<name>.json, see MANIFEST_NAMES
+            output_dir (str): output directory of the build, where the entry outputs are written
+            radar_backend (str): radar chart backend of the tex outputs, see RADAR_BACKENDS
+        """
+        if format_type not in ENTRY_OUTPUTS:
+            raise ValueError(f"No incremental build for format '{format_type}'")
+        self.format_type = format_type
+        self.entry_outputs = entry_outputs(format_type, output_dir, radar_backend)
+        self.path = path or os.path.join(
+            DEFAULT_MANIFEST_DIR, f"manifest-{MANIFEST_NAMES[format_type]}.json"
+        )
+        settings_text = json.dumps(
+            {
+                "format": format_type,
+                "output_dir": os.path.normpath(output_dir),
+                "radar": radar_backend,
+                "settings": settings or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        self.settings_digest = hashlib.sha256(
+            (settings_text + templates_digest()).encode("utf-8")
+        ).hexdigest()
+        self.entries: dict[str, dict] = {}
+
+        previous = self._read()
+        if previous is not None and previous["settings"] == self.settings_digest:
+            self.entries = previous["entries"]
+        self.previous_entries = previous["entries"] if previous is not None else {}
+
+    def _read(self) -> dict | None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return None
+        return manifest
+
+    def outputs(self, entry_id: str) -> list[str]:
+        """
+        Returns the output files written for the entry `entry_id`.
+        """
+        return [path.format(id=entry_id) for path in self.entry_outputs]
+
+    def is_current(self, entry) -> bool:
+        """
+        Returns whether the outputs of `entry` are up to date.
+        """
+        known = self.entries.get(entry["id"])
+        if known is None or known["digest"] != entry_digest(entry):
+            return False
+        return all(
+            _file_state(path) == state for path, state in known["outputs"].items()
+        )
+
+    def outdated(self, entries: list) -> list:
+        """
+        Returns the entries whose outputs have to be regenerated, in their original order.
+        """
+        return [entry for entry in entries if not self.is_current(entry)]
+
+    def remove_stale(self, entries: list) -> list[str]:
+        """
+        Deletes the outputs of entries that were built before but are not in `entries`.
+
+        Returns:
+            list[str]: the deleted files
+        """
+        current = {entry["id"] for entry in entries}
+        removed = []
+        for entry_id, known in self.previous_entries.items():
+            if entry_id in current:
+                continue
+            for path in known["outputs"]:
+                if os.path.exists(path):
+                    os.remove(path)
+                    removed.append(path)
+                    Console.info(f"Removed stale output {path}")
+        return removed
+
+    def update(self, entries: list) -> None:
+        """
+        Records the current data digests and output files of `entries`, after they were written.
+        """
+        self.entries = {}
+        for entry in entries:
+            outputs = {}
+            for path in self.outputs(entry["id"]):
+                state = _file_state(path)
+                if state is not None:
+                    outputs[path] = state
+            self.entries[entry["id"]] = {
+                "digest": entry_digest(entry),
+                "outputs": outputs,
+            }
+
+    def save(self) -> None:
+        """
+        Writes the manifest file.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "format": self.format_type,
+            "settings": self.settings_digest,
+            "entries": self.entries,
+        }
+        tmp_file = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_file, self.path)
@@ -2,6 +2,7 @@ import yaml
 import os
 import sys  # Import sys to handle command-line arguments
 from cloudmesh.common.util import banner
+from yaml_loader import safe_load
 
 
 def green(text: str) -> str:
@@ -97,7 +98,7 @@ def validate_yaml_entries(data_filepath=None, structure_filepath=None) -> bool:
     arbitrary_example = None
     try:
         with open(structure_filepath, "r", encoding="utf-8") as f:
-            structure_data = yaml.safe_load(f)
+            structure_data = safe_load(f)
     except FileNotFoundError:
         print(f"Error: Structure file '{structure_filepath}' not found.")
         return False
@@ -139,7 +140,7 @@ def validate_yaml_entries(data_filepath=None, structure_filepath=None) -> bool:
     # --- Load and process the DATA FILE ---
     try:
         with open(data_filepath, "r", encoding="utf-8") as f:
-            data_to_validate = yaml.safe_load(f)
+            data_to_validate = safe_load(f)
     except FileNotFoundError:
         print(f"Error: Data file '{data_filepath}' not found.")
         return False
@@ -0,0 +1,316 @@
+"""
+Cache of parsed BibTeX citations, keyed by the hash of the citation text.
+
+The same `cite` strings are read by the LaTeX, Markdown and MkDocs writers and by the
+URL checker. `get_citation` parses each distinct string once per run and returns a
+`ParsedCitation` that exposes its label, fields, authors, DOI, URLs and plain-text
+rendering. bibtexparser and pybtex are only run for the attributes that are used.
+
+The default cache lives in memory. `use_persistent_cache` loads it from a pickle file
+(default `.cache/citations.pickle`) and writes it back when the program exits, keeping
+only the citations used in the run and only the parts of them that were computed.
+
+Example:
+
+    citation = get_citation(bibtex)
+    print(citation.label, citation.doi, citation.text)
+"""
+
+import atexit
+import hashlib
+import os
+import pickle
+import re
+import threading
+
+CITATION_CACHE_VERSION = 1
+DEFAULT_CITATION_CACHE = ".cache/citations.pickle"
+
+CITATION_LABEL_PATTERN = re.compile(r"@\w+\{([^,]+),")
+CITATION_URL_PATTERN = re.compile(r"url\s*=\s*\{(.*?)\}")
+CITATION_FIRST_URL_PATTERN = re.compile(r'url\s*=\s*[{"]([^}"]+)[}"]')
+CITATION_AUTHOR_PATTERN = re.compile(r"author\s*=\s*{(.+?)}", re.DOTALL)
+
+_UNSET = object()
+
+
+def citation_label(bib_entry: str) -> str:
+    """
+    Returns the citation label of a BibTeX entry string, or "<unknown>" if not found.
+    """
+    match = CITATION_LABEL_PATTERN.match(bib_entry.strip())
+    return match.group(1) if match else "<unknown>"
+
+
+def _library_versions() -> dict:
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = {}
+    for package in ("bibtexparser", "pybtex"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+class ParsedCitation(object):
+    """
+    One BibTeX citation string and everything derived from it.
+
+    The regex based fields are computed when the citation is created, the bibtexparser
+    entries and the pybtex plain text on first access.
+    """
+
+    __slots__ = (
+        "source",
+        "label",
+        "authors",
+        "url",
+        "urls",
+        "_entries",
+        "_parse_error",
+        "_text",
+    )
+
+    def __init__(self, source: str):
+        """
+        Parameters:
+            source (str): BibTeX citation string
+        """
+        self.source = source
+        self.label = citation_label(source)
+        match = CITATION_AUTHOR_PATTERN.search(source)
+        self.authors = (
+            [a.strip() for a in match.group(1).split(" and ")] if match else None
+        )
+        match = CITATION_FIRST_URL_PATTERN.search(source)
+        self.url = match.group(1) if match else ""
+        self.urls = CITATION_URL_PATTERN.findall(source)
+        self._entries = _UNSET
+        self._parse_error = None
+        self._text = _UNSET
+
+    def _parsed(self) -> tuple[bool, bool]:
+        return self._entries is not _UNSET, self._text is not _UNSET
+
+    def __getstate__(self):
+        # attributes that were never computed are left out and stay lazy after loading
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if getattr(self, name) is not _UNSET
+        }
+
+    def __setstate__(self, state):
+        self._entries = _UNSET
+        self._text = _UNSET
+        self._parse_error = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _parse(self) -> None:
+        import bibtexparser
+
+        try:
+            self._entries = bibtexparser.loads(self.source).entries
+        except Exception as e:
+            self._entries = []
+            self._parse_error = str(e)
+
+    @property
+    def entries(self) -> list[dict]:
+        """
+        Returns the entries parsed by bibtexparser, empty if the string could not be parsed.
+        """
+        if self._entries is _UNSET:
+            self._parse()
+        return self._entries
+
+    @property
+    def parse_error(self) -> str | None:
+        """
+        Returns the bibtexparser error message, or None if the string was parsed.
+        """
+        if self._entries is _UNSET:
+            self._parse()
+        return self._parse_error
+
+    @property
+    def fields(self) -> dict:
+        """
+        Returns the fields of the first entry, or an empty dict. Do not modify the result.
+        """
+        entries = self.entries
+        return entries[0] if entries else {}
+
+    @property
+    def doi(self) -> str:
+        """
+        Returns the DOI field of the first entry, or an empty string.
+        """
+        doi = self.fields.get("doi")
+        return doi.strip() if isinstance(doi, str) else ""
+
+    @property
+    def text(self) -> str:
+        """
+        Returns the citation formatted as plain text with the pybtex "plain" style.
+
+        If the string cannot be formatted the text is "Could not parse citation: <error>".
+        """
+        if self._text is _UNSET:
+            try:
+                from pybtex.database import parse_string
+                from pybtex.plugin import find_plugin
+
+                bib_data = parse_string(self.source, bib_format="bibtex")
+                style = find_plugin("pybtex.style.formatting", "plain")()
+                formatted = next(style.format_entries(bib_data.entries.values()))
+                self._text = re.sub(r"<[^>]+>", " ", str(formatted.text)).strip()
+            except Exception as e:
+                self._text = f"Could not parse citation: {e}"
+        return self._text
+
+
+class CitationCache(object):
+    """
+    Maps the SHA-1 of a citation string to its `ParsedCitation`. Safe to use from several threads.
+    """
+
+    def __init__(self, path: str | None = None):
+        """
+        Creates a cache, loading it from `path` if given and the file exists.
+
+        Parameters:
+            path (str or None): pickle file to load from and save to. None keeps the cache in memory.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._citations: dict[str, ParsedCitation] = {}
+        # keys looked up since loading, and which parts of the loaded citations were parsed
+        self._used: set[str] = set()
+        self._loaded: dict[str, tuple[bool, bool]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path is not None:
+            self.load()
+
+    @staticmethod
+    def _key(source: str) -> str:
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def get(self, source: str) -> ParsedCitation:
+        """
+        Returns the parsed citation for the BibTeX string `source`.
+        """
+        key = self._key(source)
+        with self._lock:
+            self._used.add(key)
+            citation = self._citations.get(key)
+            if citation is None:
+                self.misses += 1
+                citation = ParsedCitation(source)
+                self._citations[key] = citation
+                self._dirty = True
+            else:
+                self.hits += 1
+        return citation
+
+    def __len__(self):
+        return len(self._citations)
+
+    def load(self) -> None:
+        """
+        Loads the citations saved in `path`. Files written with other library versions are ignored.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                record = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return
+        if (
+            not isinstance(record, dict)
+            or record.get("version") != CITATION_CACHE_VERSION
+            or record.get("libraries") != _library_versions()
+        ):
+            return
+        self._citations.update(record["citations"])
+        self._loaded = {key: c._parsed() for key, c in self._citations.items()}
+
+    def save(self) -> None:
+        """
+        Writes the citations used in this run to `path`, if any were added or parsed further
+        since loading. Citations that were not looked up are dropped, unless none were.
+        """
+        if self.path is None:
+            return
+        with self._lock:
+            citations = self._citations
+            if self._used:
+                citations = {key: citations[key] for key in self._used}
+            changed = (
+                self._dirty
+                or len(citations) != len(self._citations)
+                or any(
+                    self._loaded.get(key) != citation._parsed()
+                    for key, citation in citations.items()
+                )
+            )
+            if not changed:
+                return
+            record = {
+                "version": CITATION_CACHE_VERSION,
+                "libraries": _library_versions(),
+                "citations": dict(citations),
+            }
+            self._dirty = False
+            self._loaded = {key: c._parsed() for key, c in citations.items()}
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, self.path)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the fraction of lookups that were served from the cache.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_cache = CitationCache()
+
+
+def get_citation(source: str) -> ParsedCitation:
+    """
+    Returns the parsed citation for the BibTeX string `source` from the default cache.
+    """
+    return _cache.get(source)
+
+
+def citation_cache() -> CitationCache:
+    """
+    Returns the default cache used by `get_citation`.
+    """
+    return _cache
+
+
+def use_persistent_cache(path: str = DEFAULT_CITATION_CACHE) -> CitationCache:
+    """
+    Replaces the default cache by one loaded from `path` that is saved when the program exits.
+
+    Parameters:
+        path (str): pickle file of the cache
+    Returns:
+        CitationCache: the new default cache
+    """
+    global _cache
+    _cache = CitationCache(path)
+    atexit.register(_cache.save)
+    return _cache
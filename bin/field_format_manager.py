@@ -1,4 +1,4 @@
-import yaml
+from yaml_loader import safe_load
 # from pprint import pprint
 
 class FieldFormatManager:
@@ -58,7 +58,7 @@ class FieldFormatManager:
         output = {}
         
         with open(format_filename, 'r') as f:
-            file_contents = yaml.safe_load(f)
+            file_contents = safe_load(f)
         file_contents = file_contents[0]    
 
         file_categories = list(file_contents.keys())
@@ -133,7 +133,7 @@ class FieldFormatManager:
         output = {}
 
         with open(format_filename, 'r') as f:
-            file_contents = yaml.safe_load(f)
+            file_contents = safe_load(f)
         file_contents = file_contents[0]
         file_contents = file_contents.get("ratings")  
 
@@ -1,16 +1,19 @@
 """
 Usage:
   generate.py --files=file1,file2 --check_structure [--structure=<file>]
-  generate.py --files=file1,file2 --check
-  generate.py --files=file1,file2 --check_url [--url=<URL>]
-  generate.py --files=file1,file2 --format=<fmt> --outdir=<dir> [--authortruncation=N] [--columns=col1,col2] [--check] [--noratings] [--required] [--standalone] [--withcitation] [--urlcheck]
+  generate.py --files=file1,file2 --compile-snapshot [--snapshot=<file>] [--parallel] [--nocache]
+  generate.py --files=file1,file2 --list [--nocache]
+  generate.py --files=file1,file2 --check [--parallel] [--nocache] [--snapshot=<file>]
+  generate.py --files=file1,file2 --check_url [--url=<URL>] [--nocache] [--workers=N] [--perhost=N] [--urlttl=HOURS] [--browsers=N]
+  generate.py --files=file1,file2 --format=<fmt> --outdir=<dir> [--authortruncation=N] [--columns=col1,col2] [--check] [--noratings] [--required] [--standalone] [--withcitation] [--urlcheck] [--parallel] [--nocache] [--snapshot=<file>] [--incremental] [--concurrent] [--radar=<backend>] [--composedgrid]
   generate.py --check_log
 
 
 
 Options:
   --files=<file>...           YAML file paths to process (one or more) [default: source/benchmark-addon.yaml].
-  --format=<fmt>              Output file format, tex, md, mkdocs [default: tex].
+  --format=<fmt>              Output file format, tex, md, mkdocs, a comma-separated list of them, or all
+                              for md,mkdocs,tex. The YAML files are loaded once for all formats [default: tex].
   --outdir=<dir>              Output directory [default: ./content/].
   --authortruncation=N        Truncate authors for index pages [default: 9999].
   --columns=<cols>            Subset of columns to include, comma-separated.
@@ -22,13 +25,37 @@ Options:
   --check_url                 Check if URLs exist.
   --check_log                 Check the latex log file by removing unneded content
   --url=<URL>                 URL to check for validity (used with --urlcheck).
+  --workers=N                 Number of URLs checked at the same time with --check_url; 1 checks them
+                              one after the other [default: 8].
+  --perhost=N                 Number of URLs of the same host checked at the same time [default: 2].
+  --urlttl=HOURS              Skip URLs found valid less than HOURS ago and revalidate older ones with
+                              conditional requests, using .cache/url_checks.json [default: 24].
+  --browsers=N                Number of headless Chrome browsers that retry URLs answered with HTTP 403;
+                              0 reports these URLs as invalid [default: 2].
   --structure=<file>          Path to a structure file for validation [default: None].
   --check_structure           Check if YAML entries conform to a reference structure. If no structure file
                               is provided the first element of the first file is used.
+  --parallel                  Parse the YAML files and render the radar charts in process pools using all cores.
+  --nocache                   Do not use the YAML parse cache in .cache/yaml, the citation cache
+                              in .cache/citations.pickle, and the URL check results in .cache/url_checks.json.
+  --list                      List id, date, name, and domain of the entries. Only these fields are parsed.
+  --incremental               Only regenerate the pages, sections, and radar charts of entries whose YAML changed,
+                              and delete those of removed entries. Uses the manifest in .cache/manifest-<fmt>.json;
+                              md and mkdocs share .cache/manifest-md.json.
+  --concurrent                Write tex in a thread next to md and mkdocs when several formats are given.
+  --radar=<backend>           Radar charts of the tex format: matplotlib writes PDF and PNG images, vector
+                              writes TikZ code for LaTeX and SVG images for md and mkdocs without
+                              importing matplotlib [default: matplotlib].
+  --composedgrid              Render each page of the radar chart overview as one composed figure with 5x5
+                              charts (images/radar_grid_<page>.pdf or .tex) instead of including every chart.
+  --compile-snapshot          Compile the YAML files into a single JSON snapshot file.
+  --snapshot=<file>           Snapshot file to write with --compile-snapshot (default .cache/benchmarks-snapshot.json),
+                              or to load instead of parsing the YAML files if it is up to date with --files.
 
 Notes:
-  - --standalone is only valid with --format=tex
-  - --withcitation is only valid with --format=md
+  - --standalone is only valid if --format includes tex
+  - --withcitation is only valid if --format includes md
+  - md and mkdocs write the same detail pages; with both, the format listed last wins
   - Author truncation must be a positive integer
 
 Examples:
@@ -40,14 +67,16 @@ Examples:
 
 """
 
+import atexit
 import os
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import json
 from docopt import docopt
 from yaml_manager import YamlManager
 from md_writer import MarkdownWriter
 from mkdocs_writer import MkdocsWriter
-from generate_latex import GenerateLatex, ALL_COLUMNS
+from generate_latex import GenerateLatex, ALL_COLUMNS, RADAR_BACKENDS, write_stats
 from cloudmesh.common.console import Console
 from check_log import print_latex_log
 from cloudmesh.common.console import Console
@@ -55,6 +84,14 @@ from yaml_manager import find_unicode_chars
 from check_structure import validate_yaml_entries
 from pprint import pprint
 from url_checker import URLChecker
+from url_cache import URLCheckCache
+from yaml_cache import DEFAULT_CACHE_DIR
+from citation_cache import DEFAULT_CITATION_CACHE, citation_cache, use_persistent_cache
+from build_history import BuildHistory
+from build_manifest import BuildManifest
+
+DEFAULT_SNAPSHOT = ".cache/benchmarks-snapshot.json"
+FORMATS = ["md", "mkdocs", "tex"]
 
 VERBOSE = True
 if VERBOSE:
@@ -73,6 +110,24 @@ if __name__ == "__main__":
     format_type = args["--format"] or "tex"
     output_dir = args["--outdir"] or "./content/"
 
+    formats = FORMATS if format_type == "all" else format_type.split(",")
+    for name in formats:
+        if name not in FORMATS:
+            print(f"Error: unknown format '{name}', use {', '.join(FORMATS)} or all")
+            sys.exit(1)
+    format_type = ",".join(formats)
+
+    # Every run is appended to .cache/build_history.sqlite, see bin/build_history.py
+    history_command = next(
+        (
+            name
+            for name in ["list", "compile-snapshot", "check_structure", "check_url", "check"]
+            if args[f"--{name}"]
+        ),
+        format_type,
+    )
+    history = BuildHistory(history_command).save_at_exit()
+
     author_trunc = int(args["--authortruncation"])
 
     files = args["--files"]
@@ -87,14 +142,21 @@ if __name__ == "__main__":
     else:
         columns = columns.split(",")
 
-    if args["--standalone"] and format_type != "tex":
+    if args["--standalone"] and "tex" not in formats:
         print("Error: --standalone is only valid with --format=tex")
         sys.exit(1)
 
-    if args["--withcitation"] and format_type != "md":
+    if args["--withcitation"] and "md" not in formats:
         print("Error: --withcitation is only valid with --format=md")
         sys.exit(1)
 
+    # The tex format writes the radar charts; md and mkdocs link to its web format
+    radar_backend = args["--radar"] or "matplotlib"
+    if radar_backend not in RADAR_BACKENDS:
+        print(f"Error: --radar must be one of {', '.join(RADAR_BACKENDS)}")
+        sys.exit(1)
+    radar_formats = RADAR_BACKENDS[radar_backend]
+
     if author_trunc <= 0:
         print("Error: --authortruncation must be a positive integer")
         sys.exit(1)
@@ -106,8 +168,61 @@ if __name__ == "__main__":
 
     os.makedirs(output_dir, exist_ok=True)
 
-    manager = YamlManager(files)
-    entries = manager.get_flat_dicts()
+    if args["--list"]:
+        cache_dir = None if args["--nocache"] else DEFAULT_CACHE_DIR
+        manager = YamlManager(files, cache_dir=cache_dir, lazy=True)
+        for entry in manager:
+            domain = entry.get("domain") or ""
+            if isinstance(domain, list):
+                domain = ", ".join(map(str, domain))
+            print(f"{entry['id']:<60} {str(entry.get('date', '')):<10} {entry.get('name')} [{domain}]")
+        sys.exit(0)
+
+    if not args["--nocache"]:
+        use_persistent_cache(DEFAULT_CITATION_CACHE)
+
+    def record_cache_metrics():
+        cache = citation_cache()
+        history.metric("citation_cache.hits", cache.hits)
+        history.metric("citation_cache.misses", cache.misses)
+
+    # Registered after history.save, so atexit runs it before the run is saved
+    atexit.register(record_cache_metrics)
+
+    manager = None
+    snapshot = args["--snapshot"]
+    if snapshot and not args["--compile-snapshot"]:
+        try:
+            with history.phase("load"):
+                manager = YamlManager.from_snapshot(snapshot, files=files)
+            Console.info(f"Loaded {len(manager)} entries from snapshot {snapshot}")
+        except (OSError, ValueError, KeyError) as e:
+            Console.warning(f"Not using snapshot {snapshot}: {e}")
+
+    if manager is None:
+        cache_dir = None if args["--nocache"] else DEFAULT_CACHE_DIR
+        with history.phase("load"):
+            manager = YamlManager(files, parallel=args["--parallel"], cache_dir=cache_dir)
+        if manager.parse_cache is not None:
+            history.metric("yaml_cache.hits", manager.parse_cache.hits)
+            history.metric("yaml_cache.misses", manager.parse_cache.misses)
+            if VERBOSE:
+                Console.info(
+                    f"YAML parse cache: {manager.parse_cache.hits} hits, {manager.parse_cache.misses} misses"
+                )
+        if manager.load_errors:
+            history.metric("load_errors", len(manager.load_errors))
+            for path, _ in manager.load_errors:
+                Console.error(f"Could not load '{path}'")
+            sys.exit(1)
+    with history.phase("records"):
+        entries = manager.get_records()
+    history.metric("entries", len(entries))
+
+    if args["--compile-snapshot"]:
+        path = manager.to_snapshot(snapshot or DEFAULT_SNAPSHOT)
+        Console.ok(f"Wrote snapshot of {len(manager)} entries to {path}")
+        sys.exit(0)
 
     if args["--check"]:
 
@@ -116,9 +231,11 @@ if __name__ == "__main__":
                 print(f"Error: file not found: {file}")
                 sys.exit(1)
             Console.info("Checking YAML files for formatting issues...")
-            find_unicode_chars(filename=file)
+            with history.phase("unicode"):
+                find_unicode_chars(filename=file)
 
-        manager.check_required_fields()
+        with history.phase("required_fields"):
+            manager.check_required_fields()
         sys.exit(0)
 
     if args["--check_structure"]:
@@ -142,53 +259,161 @@ if __name__ == "__main__":
 
     if args["--check_url"]:
 
-        checker = URLChecker(entries, verbose=VERBOSE)
+        url_cache = None
+        if not args["--nocache"]:
+            url_cache = URLCheckCache(ttl=float(args["--urlttl"]) * 3600)
+            atexit.register(url_cache.save)
+
+            def record_url_cache_metrics():
+                history.metric("url_cache.hits", url_cache.hits)
+                history.metric("url_cache.revalidated", url_cache.revalidated)
+
+            atexit.register(record_url_cache_metrics)
+        checker = URLChecker(
+            entries, verbose=VERBOSE, cache=url_cache, browsers=int(args["--browsers"])
+        )
 
         if args["--url"]:
             url = args["--url"]
-            if not checker.is_url_valid(url):
+            result = checker.is_url_valid(url)
+            checker.close_browsers()
+            if not result:
                 Console.error(f"URL {url} is not valid.")
                 sys.exit(1)
             Console.ok(f"URL {url} is valid.")
             sys.exit(0)
         else:
             Console.info("Checking URLs ...")
-            checker.check_urls()
+            with history.phase("check_urls"):
+                checker.check_urls(
+                    workers=int(args["--workers"]), per_host=int(args["--perhost"])
+                )
             sys.exit(0)
 
-    if format_type == "md":
-
-        converter = MarkdownWriter(entries, raw_entries=manager.data)
-        converter.write_table(columns=columns)
-        converter.write_individual_entries(columns=columns)
+    def in_outdir(*parts):
+        # a path below --outdir, e.g. content/md/benchmarks for the default ./content/
+        return os.path.normpath(os.path.join(output_dir, *parts))
+
+    def write_md(outdated, changed_ids):
+        converter = MarkdownWriter(
+            entries, raw_entries=manager.data, radar_format=radar_formats[1]
+        )
+        with history.phase("md.table"):
+            converter.write_table(filename=in_outdir("md", "benchmarks.md"), columns=columns)
+        with history.phase("md.entries"):
+            converter.write_individual_entries(
+                output_dir=in_outdir("md", "benchmarks"),
+                columns=columns,
+                changed_ids=changed_ids,
+            )
+
+    def write_mkdocs(outdated, changed_ids):
+        converter = MkdocsWriter(entries, radar_format=radar_formats[1])
+        with history.phase("mkdocs.index"):
+            converter.write_index_md(output_dir=in_outdir("md", "benchmarks"))
+            converter.write_table(
+                filename=in_outdir("md", "benchmarks_table.md"), columns=columns
+            )
+        with history.phase("mkdocs.entries"):
+            converter.write_individual_entries(
+                output_dir=in_outdir("md", "benchmarks"),
+                columns=columns,
+                changed_ids=changed_ids,
+            )
 
-    elif format_type == "mkdocs":
-
-        converter = MkdocsWriter(manager.data)
-        converter.write_index_md()
-        converter.write_table(columns=columns)
-        converter.write_individual_entries(columns=columns)
-        
         # elif format_type == "json":
         output_path = os.path.join(output_dir, "md/benchmarks.json")
-        manager.to_json_file(output_path, indent=2, ensure_ascii=False)
+        with history.phase("mkdocs.json"):
+            manager.to_json_file(output_path, indent=2, ensure_ascii=False)
         Console.ok(f"Wrote JSON output to {output_path}")
-        
 
-    elif format_type == "tex":
-        converter = GenerateLatex(entries)
+    def write_tex(outdated, changed_ids):
+        converter = GenerateLatex(entries, radar_backend=radar_backend)
+
+        images = in_outdir("tex", "images")
 
-        converter.generate_radar_chart_grid()
+        with history.phase("tex.radar_grid"):
+            converter.generate_radar_chart_grid(
+                filename=in_outdir("tex", "radar_grid.tex"),
+                composed=args["--composedgrid"],
+                output_dir=images,
+            )
 
         Console.info("generate radar charts..")
-        converter.generate_radar_charts(fmt="pdf")
-        converter.generate_radar_charts(fmt="png")
+        with history.phase("tex.radar_charts"):
+            radar_errors = converter.generate_radar_charts(
+                fmt=list(radar_formats),
+                output_dir=images,
+                entries=outdated,
+                parallel=args["--parallel"],
+            )
+        if radar_errors:
+            sys.exit(1)
 
         Console.info("Generating LaTeX table...")
-        converter.generate_table()
+        with history.phase("tex.table"):
+            converter.generate_table(filename=in_outdir("tex", "table.tex"))
         Console.info("Generating LaTeX BibTeX...")
-        converter.generate_bibtex()
+        with history.phase("tex.bibtex"):
+            converter.generate_bibtex(filename=in_outdir("tex", "benchmarks.bib"))
         Console.info("Generating section document...")
-        converter.generate_section()
+        with history.phase("tex.sections"):
+            converter.generate_section(outdir=in_outdir("tex", "section"), entries=outdated)
         Console.info("Generating document...")
-        converter.generate_document()
+        with history.phase("tex.document"):
+            converter.generate_document(filename=in_outdir("tex", "benchmarks.tex"))
+
+    writers = {"md": write_md, "mkdocs": write_mkdocs, "tex": write_tex}
+
+    def build(name):
+        """
+        Writes the outputs of the format `name`, only those of changed entries with --incremental.
+        """
+        manifest = None
+        outdated = entries
+        changed_ids = None
+        if args["--incremental"]:
+            settings = {
+                "columns": list(columns),
+                "authortruncation": author_trunc,
+                "standalone": args["--standalone"],
+                "noratings": args["--noratings"],
+                "withcitation": args["--withcitation"],
+            }
+            manifest = BuildManifest(
+                name, settings=settings, output_dir=output_dir, radar_backend=radar_backend
+            )
+            outdated = manifest.outdated(entries)
+            changed_ids = {entry["id"] for entry in outdated}
+            manifest.remove_stale(entries)
+            history.metric(f"{name}.entries.rebuilt", len(outdated))
+            Console.info(
+                f"Incremental {name} build: {len(outdated)} of {len(entries)} entries changed"
+            )
+
+        writers[name](outdated, changed_ids)
+
+        if manifest is not None:
+            manifest.update(entries)
+            manifest.save()
+
+    if args["--concurrent"] and "tex" in formats and len(formats) > 1:
+        # Only tex uses matplotlib, so it gets its own thread. md and mkdocs both write
+        # content/md/benchmarks/<id>.md and therefore run one after the other.
+        groups = [[name for name in formats if name != "tex"], ["tex"]]
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+            futures = [
+                pool.submit(lambda group=group: [build(name) for name in group])
+                for group in groups
+            ]
+            for future in futures:
+                future.result()
+    else:
+        for name in formats:
+            build(name)
+
+    history.metric("files.written", write_stats["written"])
+    history.metric("files.skipped", write_stats["skipped"])
+    Console.info(
+        f"Wrote {write_stats['written']} files, {write_stats['skipped']} were unchanged"
+    )
@@ -2,19 +2,31 @@
 # please do not modify this file
 # it is maintained bt gregor
 #
+import hashlib
+import json
 import os
 import re
 import sys
 import textwrap
+import threading
 from typing import List, Dict, Union, Any, Optional, Tuple
 
 from pybtex.database import parse_string
 from pybtex.plugin import find_plugin
 from pylatexenc.latexencode import unicode_to_latex
 from cloudmesh.common.console import Console
-import bibtexparser
-import numpy as np
-import matplotlib.pyplot as plt
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+from citation_cache import get_citation
+from radar_vector import (
+    RADAR_VECTOR_VERSION,
+    radar_chart_svg,
+    radar_chart_tikz,
+    radar_grid_tikz,
+    wrap_radar_title,
+)
+from yaml_manager import BenchmarkRecord, to_record
 
 
 VERBOSE = True
@@ -338,13 +350,7 @@ def _parse_single_bibtex_entry(entry: str) -> Dict[str, Any]:
     """
     Parses a single BibTeX entry string and returns the first entry dictionary.
     """
-    try:
-        bib_db = bibtexparser.loads(entry)
-        if bib_db.entries:
-            return bib_db.entries[0]
-    except Exception:
-        pass
-    return {}
+    return get_citation(entry).fields
 
 
 def _get_duplicate_key(entry: Dict[str, Any]) -> Optional[Tuple[str, str]]:
@@ -379,10 +385,12 @@ def _get_duplicate_key(entry: Dict[str, Any]) -> Optional[Tuple[str, str]]:
 
 def validate_bibtex_entries(bibtex_str):
     try:
-        bib_database = bibtexparser.loads(bibtex_str)
+        citation = get_citation(bibtex_str)
+        if citation.parse_error is not None:
+            return False, [f"Parsing error: {citation.parse_error}"]
         errors = []
 
-        for entry in bib_database.entries:
+        for entry in citation.entries:
             entry_type = entry.get("ENTRYTYPE", "").lower()
             entry_id = entry.get("ID", "?")
             required = REQUIRED_FIELDS_BY_TYPE.get(entry_type, [])
@@ -410,27 +418,325 @@ def validate_bibtex_entries(bibtex_str):
         return False, [f"Parsing error: {e}"]
 
 
+# Number of files written and left untouched by write_to_file in this run
+write_stats = {"written": 0, "skipped": 0}
+# write_to_file is called from the tex and md threads of generate.py --concurrent
+_write_stats_lock = threading.Lock()
+
+
+def _has_content(filename, content) -> bool:
+    try:
+        with open(filename, "r", encoding="utf-8", newline="") as f:
+            existing = f.read()
+    except (OSError, UnicodeDecodeError):
+        return False
+    # open(..., "w") translates "\n" to os.linesep when writing
+    return existing == content.replace("\n", os.linesep)
+
+
 def write_to_file(content, filename="content/tex/table.tex"):
     """
     Writes the given content to a file based on the path used in filename.
 
+    If the file already has exactly this content it is not touched, so its mtime stays
+    the same and latexmk, mkdocs, and rsync can skip it.
+
     Parameters:
         content (str): The LaTeX content to write.
         filename (str): Pathe and name of the  (default is 'content/tex/table.tex').
     """
     try:
+        if _has_content(filename, content):
+            with _write_stats_lock:
+                write_stats["skipped"] += 1
+            return
+
         output_dir = os.path.dirname(filename)
         os.makedirs(output_dir, exist_ok=True)
 
         with open(filename, "w", encoding="utf-8") as f:
             f.write(content)
 
+        with _write_stats_lock:
+            write_stats["written"] += 1
         Console.ok(f"Successfully wrote content to: {filename}")
 
     except Exception as e:
         Console.error(f"Error writing content to {filename}: {e}")
 
 
+# Radar chart formats for the LaTeX document and for the Markdown and MkDocs pages.
+# "vector" writes TikZ and SVG code from bin/radar_vector.py and does not import matplotlib.
+RADAR_BACKENDS = {
+    "matplotlib": ("pdf", "png"),
+    "vector": ("tex", "svg"),
+}
+
+VECTOR_RADAR_WRITERS = {"tex": radar_chart_tikz, "svg": radar_chart_svg}
+
+
+def _pyplot():
+    """
+    Returns matplotlib.pyplot with the Agg backend, importing it on first use.
+
+    numpy and matplotlib take seconds to import and are only needed for raster and PDF charts.
+    """
+    import matplotlib
+
+    # Charts are only written to files, never shown
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+class RadarChartRenderer:
+    """
+    Draws radar charts into one reusable polar figure per set of rating categories.
+
+    The figure, axes, grid, and tick labels are built the first time a set of categories
+    is drawn. Every further chart only updates the polygon, the radial limit, and the title
+    before it is saved, which avoids most of matplotlib's setup cost. The images are the
+    same as those of a freshly built figure.
+    """
+
+    def __init__(self, font_size=18):
+        self.font_size = font_size
+        self._templates = {}
+
+    def _template(self, labels):
+        template = self._templates.get(labels)
+        if template is None:
+            import numpy as np
+
+            plt = _pyplot()
+            angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
+            angles += angles[:1]
+            fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
+            (line,) = ax.plot(angles, [0.0] * len(angles), color="tab:blue", linewidth=2)
+            (polygon,) = ax.fill(angles, [0.0] * len(angles), color="tab:blue", alpha=0.25)
+
+            ax.set_xticks(angles[:-1])
+            ax.set_xticklabels(labels, fontsize=self.font_size)
+            ax.set_yticklabels([])
+            title = ax.set_title("", y=1.08, fontsize=self.font_size + 2)
+            template = (fig, ax, angles, line, polygon, title)
+            self._templates[labels] = template
+        return template
+
+    def render(self, name, id, ratings, formats, output_dir):
+        """
+        Saves the radar chart of one entry as `output_dir`/`id`_radar.<format> for every format.
+
+        Returns:
+            list[str]: the written files
+        """
+        labels = tuple(ratings.keys())
+        values = list(ratings.values())
+
+        # --- Fix empty chart when all values are zero ---
+        if all(v == 0.0 for v in values):
+            values = [0.01] * len(values)  # tiny baseline so shape is visible
+
+        values += values[:1]  # close the radar loop
+
+        fig, ax, angles, line, polygon, title = self._template(labels)
+        line.set_data(angles, values)
+        polygon.set_xy(list(zip(angles, values)))
+        ax.set_ylim(0, max(1, max(values)))  # ensure grid shows
+        title.set_text("\n".join(wrap_radar_title(name, self.font_size)))
+
+        filenames = []
+        for fmt in formats:
+            filename = f"{output_dir}/{id}_radar.{fmt}"
+            metadata = {"CreationDate": None} if fmt == "pdf" else None
+            fig.savefig(filename, bbox_inches="tight", metadata=metadata)
+            filenames.append(filename)
+        return filenames
+
+    def close(self):
+        plt = _pyplot()
+        for fig, *_ in self._templates.values():
+            plt.close(fig)
+        self._templates = {}
+
+
+# One renderer per font size and process, shared by all charts drawn in it
+_radar_renderers = {}
+
+
+def render_radar_chart(name, id, ratings, fmt, output_dir, font_size):
+    """
+    Renders the radar chart of one entry to `output_dir`/`id`_radar.`fmt`.
+
+    `fmt` may be a list of formats; the figure is then drawn once and saved in each of them.
+    The files only depend on the arguments: PDF files are written without a creation date.
+    The formats "tex" (TikZ) and "svg" are written by bin/radar_vector.py without matplotlib.
+
+    Returns:
+        list[str]: the written files
+    """
+    formats = [fmt] if isinstance(fmt, str) else list(fmt)
+    filenames = []
+    for f in formats:
+        if f in VECTOR_RADAR_WRITERS:
+            filename = f"{output_dir}/{id}_radar.{f}"
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write(VECTOR_RADAR_WRITERS[f](name, ratings, font_size))
+            filenames.append(filename)
+    formats = [f for f in formats if f not in VECTOR_RADAR_WRITERS]
+    if formats:
+        renderer = _radar_renderers.get(font_size)
+        if renderer is None:
+            renderer = _radar_renderers[font_size] = RadarChartRenderer(font_size)
+        filenames += renderer.render(name, id, ratings, formats, output_dir)
+    return filenames
+
+
+def render_radar_grid_page(charts, columns, rows, filename, font_size=7):
+    """
+    Renders the radar charts of one overview page into a single file with columns x rows panels.
+
+    One composed file per page keeps the fonts and resources of the PDF in one place, instead
+    of repeating them in every included chart. A .tex `filename` is written as one TikZ picture.
+
+    Args:
+        charts (list[tuple[str, dict]]): (name, ratings) of every chart, in reading order
+        font_size (int): font size of the category labels; titles are one point larger
+    """
+    fmt = os.path.splitext(filename)[1][1:]
+    if fmt == "tex":
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(radar_grid_tikz(charts, columns))
+        return
+
+    import numpy as np
+
+    plt = _pyplot()
+    fig, axes = plt.subplots(
+        rows,
+        columns,
+        figsize=(2.4 * columns, 2.6 * rows),
+        subplot_kw=dict(polar=True),
+        squeeze=False,
+    )
+    for ax, (name, ratings) in zip(axes.flat, charts):
+        labels = list(ratings.keys())
+        values = list(ratings.values())
+        if all(v == 0.0 for v in values):
+            values = [0.01] * len(values)  # tiny baseline so shape is visible
+        values += values[:1]
+        angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
+        angles += angles[:1]
+
+        ax.plot(angles, values, color="tab:blue", linewidth=1)
+        ax.fill(angles, values, color="tab:blue", alpha=0.25)
+        ax.set_xticks(angles[:-1])
+        ax.set_xticklabels(labels, fontsize=font_size)
+        ax.set_yticklabels([])
+        ax.set_ylim(0, max(1, max(values)))
+        ax.set_title("\n".join(wrap_radar_title(name)), y=1.12, fontsize=font_size + 1)
+    # Panels after the last chart of the page stay empty and are cropped
+    for ax in axes.flat[len(charts) :]:
+        ax.set_visible(False)
+
+    fig.subplots_adjust(wspace=0.9, hspace=0.9)
+    metadata = {"CreationDate": None} if fmt == "pdf" else None
+    fig.savefig(filename, bbox_inches="tight", metadata=metadata)
+    plt.close(fig)
+
+
+# Name of the radar chart manifest in the image directory, see radar_chart_key
+RADAR_MANIFEST = "radar_manifest.json"
+# Increase when render_radar_chart draws differently, so all charts are redrawn
+RADAR_CHART_VERSION = 1
+
+
+def _matplotlib_version():
+    # Read from the package metadata so that cached charts do not need the import
+    from importlib.metadata import version
+
+    return version("matplotlib")
+
+
+def radar_chart_key(name, ratings, font_size, fmt) -> str:
+    """
+    Returns the SHA-256 of everything a radar chart file depends on.
+    """
+    if fmt in VECTOR_RADAR_WRITERS:
+        renderer = f"vector-{RADAR_VECTOR_VERSION}"
+    else:
+        renderer = _matplotlib_version()
+    data = {
+        "version": RADAR_CHART_VERSION,
+        "matplotlib": renderer,
+        "name": name,
+        "ratings": list(ratings.items()),
+        "font_size": font_size,
+        "format": fmt,
+    }
+    return hashlib.sha256(json.dumps(data).encode("utf-8")).hexdigest()
+
+
+def radar_grid_key(charts, columns, rows, fmt) -> str:
+    """
+    Returns the SHA-256 of everything a composed radar grid page depends on.
+    """
+    if fmt in VECTOR_RADAR_WRITERS:
+        renderer = f"vector-{RADAR_VECTOR_VERSION}"
+    else:
+        renderer = _matplotlib_version()
+    data = {
+        "version": RADAR_CHART_VERSION,
+        "matplotlib": renderer,
+        "charts": [[name, list(ratings.items())] for name, ratings in charts],
+        "columns": columns,
+        "rows": rows,
+        "format": fmt,
+    }
+    return hashlib.sha256(json.dumps(data).encode("utf-8")).hexdigest()
+
+
+def _file_state(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _load_radar_manifest(output_dir) -> dict:
+    try:
+        with open(os.path.join(output_dir, RADAR_MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _save_radar_manifest(output_dir, manifest) -> None:
+    # Like write_to_file, an unchanged manifest is not rewritten
+    path = os.path.join(output_dir, RADAR_MANIFEST)
+    text = json.dumps(manifest, indent=1, sort_keys=True)
+    if _has_content(path, text):
+        return
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_file, path)
+
+
+def _render_radar_chart_task(task):
+    """
+    Process pool wrapper of render_radar_chart. Returns (name, filenames, error message or None).
+    """
+    name = task[0]
+    try:
+        return name, render_radar_chart(*task), None
+    except Exception as e:
+        return name, [], f"{type(e).__name__}: {e}"
+
+
 class GenerateLatex:
     """
     Class to generate LaTeX documents from benchmark entries.
@@ -439,18 +745,26 @@ class GenerateLatex:
 
     def __init__(
         self,
-        entries: List[Dict],
+        entries: List[Union[Dict, BenchmarkRecord]],
         tex_file="content/tex/benchmarks.tex",
         bib_file="content/tex/benchmarks.bib",
         table_file="content/tex/table.tex",
+        radar_backend="matplotlib",
     ):
         """
         Initializes the GenerateLatex with a list of entries.
 
         Args:
-            entries (List[Dict]): List of benchmark entries, where each entry is a dictionary.
+            entries (List[Dict]): List of benchmark entries, either BenchmarkRecords or flat dictionaries.
+            radar_backend (str): "matplotlib" includes PDF radar charts, "vector" TikZ code, see RADAR_BACKENDS.
         """
-        self.entries = entries
+        if radar_backend not in RADAR_BACKENDS:
+            raise ValueError(
+                f"Unknown radar backend '{radar_backend}', use {', '.join(RADAR_BACKENDS)}"
+            )
+        self.entries = [to_record(entry) for entry in entries]
+        self.radar_backend = radar_backend
+        self.radar_format = RADAR_BACKENDS[radar_backend][0]
         self.files = []
         # mkdir /content/tex/section
         os.makedirs("content/tex/section", exist_ok=True)
@@ -480,8 +794,7 @@ class GenerateLatex:
         Returns:
             str: The extracted citation label, or "<unknown>" if not found.
         """
-        match = re.match(r"@\w+\{([^,]+),", bib_entry.strip())
-        return match.group(1) if match else "<unknown>"
+        return get_citation(bib_entry).label
 
     @staticmethod
     def extract_cite_url(cite_entry: str) -> str:
@@ -493,8 +806,7 @@ class GenerateLatex:
         Returns:
             str: Citation's URL, or an empty string if not found.
         """
-        match = re.search(r'url\s*=\s*[{"]([^}"]+)[}"]', cite_entry)
-        return match.group(1) if match else ""
+        return get_citation(cite_entry).url
 
     def generate_bibtex(self, filename="content/tex/benchmarks.bib") -> None:
         """
@@ -532,7 +844,8 @@ class GenerateLatex:
                     continue
 
                 cite_entry = cite_entry_raw.strip()
-                label = self.get_citation_label(cite_entry)
+                citation = get_citation(cite_entry)
+                label = citation.label
 
                 valid, errors = validate_bibtex_entries(cite_entry)
                 if not valid:
@@ -541,11 +854,8 @@ class GenerateLatex:
                         Console.error(f"  - {error}")
                     continue
 
-                match = re.search(r"author\s*=\s*{(.+?)}", cite_entry_raw, re.DOTALL)
-                if match:
-                    authors_raw = match.group(1)
-                    authors = [a.strip() for a in authors_raw.split(" and ")]
-
+                authors = citation.authors
+                if authors is not None:
                     if "others" in authors:
                         Console.error(
                             f"Entry '{name}' contains a citation '{label}' that includes others'. Please use full author names."
@@ -602,162 +912,232 @@ class GenerateLatex:
     # RADAR CHART GENERATION
     # #####################################################
 
-    def _generate_single_radar_chart(
-        self, name, id, ratings, fmt, output_dir, font_size
+    def generate_radar_charts(
+        self,
+        fmt="pdf",
+        output_dir="content/tex/images",
+        font_size=18,
+        entries=None,
+        parallel=False,
+        workers=None,
+        cache=True,
     ):
-        """Generates and saves a radar chart for a single entry."""
-        labels = list(ratings.keys())
-        values = list(ratings.values())
-
-        # --- Fix empty chart when all values are zero ---
-        if all(v == 0.0 for v in values):
-            values = [0.01] * len(values)  # tiny baseline so shape is visible
-
-        values += values[:1]  # close the radar loop
-
-        # print("Values", values)
-
-        angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
-        angles += angles[:1]
-
-        fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
-        ax.plot(angles, values, color="tab:blue", linewidth=2)
-        ax.fill(angles, values, color="tab:blue", alpha=0.25)
-
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(labels, fontsize=font_size)
-        ax.set_yticklabels([])
-        ax.set_ylim(0, max(1, max(values)))  # ensure grid shows
-
-        # --- Wrap name if too long ---
-        max_chars_per_line = max(1, int(30 * (font_size / 18)))
-        if len(name) > max_chars_per_line:
-            wrapped_name = "\n".join(textwrap.wrap(name, max_chars_per_line))
-        else:
-            wrapped_name = name
-
-        ax.set_title(wrapped_name, y=1.08, fontsize=font_size + 2)
-
-        filename = f"{output_dir}/{id}_radar.{fmt}"
-        plt.savefig(filename, bbox_inches="tight")
-        plt.close(fig)
+        """
+        Generates one radar chart per entry, for `entries` if given, else for all stored entries.
 
-        Console.ok(f"Saved radar chart for '{name}' as '{filename}'.")
+        With `cache`, a chart is only rendered if its name, ratings, font size, or format changed
+        since it was written, or if the file was modified. The inputs of every chart are kept in
+        `output_dir`/radar_manifest.json.
 
-    # def _generate_single_radar_chart(
-    #     self, name, id, ratings, fmt, output_dir, font_size
-    # ):
-    #     """Generates and saves a radar chart for a single entry."""
-    #     labels = list(ratings.keys())
-    #     values = list(ratings.values())
-    #     values += values[:1]  # close the radar loop
+        Args:
+            fmt (str or list[str]): Format or list of formats. Each figure is built once and saved in every format.
+                tex (TikZ) and svg are written without matplotlib, see RADAR_BACKENDS.
+            parallel (bool): Render the charts in a process pool.
+            workers (int or None): Number of worker processes. None uses all cores.
+            cache (bool): Skip charts whose inputs did not change.
 
-    #     print("Values", values)
+        Returns:
+            list[tuple[str, str]]: (name, error message) of every chart that could not be rendered.
+        """
+        valid_formats = {"pdf", "jpeg", "png", "gif", "tex", "svg"}
+        formats = [f.lower() for f in ([fmt] if isinstance(fmt, str) else fmt)]
+        for f in formats:
+            if f not in valid_formats:
+                print(
+                    f"Unsupported format '{f}'. Supported formats: {', '.join(valid_formats)}"
+                )
+                return []
+        formats = tuple(formats)
 
-    #     angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
-    #     angles += angles[:1]
+        os.makedirs(output_dir, exist_ok=True)
 
-    #     fig, ax = plt.subplots(figsize=(6, 6), subplot_kw=dict(polar=True))
-    #     ax.plot(angles, values, color="tab:blue", linewidth=2)
-    #     ax.fill(angles, values, color="tab:blue", alpha=0.25)
+        manifest = _load_radar_manifest(output_dir) if cache else {}
+        keys = {}
+        skipped = 0
 
-    #     ax.set_xticks(angles[:-1])
-    #     ax.set_xticklabels(labels, fontsize=font_size)
-    #     ax.set_yticklabels([])
+        tasks = []
+        for entry in self.entries if entries is None else map(to_record, entries):
+            name = entry.get("name", "unknown")
+            id = entry.get("id", "unknown")
+            ratings = entry.rating_values
 
-    #     # --- Wrap name if too long ---
-    #     max_chars_per_line = max(1, int(30 * (font_size / 18)))
-    #     if len(name) > max_chars_per_line:
-    #         wrapped_name = "\n".join(textwrap.wrap(name, max_chars_per_line))
-    #     else:
-    #         wrapped_name = name
+            if not ratings:
+                Console.error(f"No ratings found for '{name}', skipping radar chart.")
+                continue
 
-    #     ax.set_title(wrapped_name, y=1.08, fontsize=font_size + 2)
+            # Only the formats whose file is missing or out of date are rendered
+            pending = []
+            for f in formats:
+                filename = f"{output_dir}/{id}_radar.{f}"
+                keys[filename] = radar_chart_key(name, ratings, font_size, f)
+                known = manifest.get(os.path.basename(filename))
+                if (
+                    known is None
+                    or known["key"] != keys[filename]
+                    or known["file"] != _file_state(filename)
+                ):
+                    pending.append(f)
+            skipped += len(formats) - len(pending)
+            if pending:
+                tasks.append((name, id, ratings, tuple(pending), output_dir, font_size))
+
+        if parallel and len(tasks) > 1:
+            workers = workers or os.cpu_count() or 1
+            chunksize = max(1, len(tasks) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(_render_radar_chart_task, tasks, chunksize=chunksize)
+                )
+        else:
+            results = map(_render_radar_chart_task, tasks)
 
-    #     filename = f"{output_dir}/{id}_radar.{fmt}"
-    #     plt.savefig(filename, bbox_inches="tight")
-    #     plt.close(fig)
+        # Report in entry order, and all failures together at the end
+        errors = []
+        for name, filenames, error in results:
+            if error is None:
+                Console.ok(f"Saved radar chart for '{name}' as {', '.join(map(repr, filenames))}.")
+                for filename in filenames:
+                    manifest[os.path.basename(filename)] = {
+                        "key": keys[filename],
+                        "file": _file_state(filename),
+                    }
+            else:
+                errors.append((name, error))
+        if cache:
+            # Forget the charts of entries that no longer exist
+            ids = {entry.get("id", "unknown") for entry in self.entries}
+            for basename in list(manifest):
+                match = re.fullmatch(r"(.+)_radar\.\w+", basename)
+                if match and match.group(1) not in ids:
+                    del manifest[basename]
+            _save_radar_manifest(output_dir, manifest)
+            if skipped:
+                Console.info(f"{skipped} radar charts are up to date.")
+        for name, error in errors:
+            Console.error(f"Could not render radar chart for '{name}': {error}")
+        if errors:
+            Console.error(f"{len(errors)} of {len(tasks)} radar charts failed.")
+        return errors
+
+    def get_radar_graphic(self, entry, width, directory=""):
+        """
+        Returns the LaTeX code that includes the radar chart of `entry` scaled to `width`.
 
-    #     Console.ok(f"Saved radar chart for '{name}' as '{filename}'.")
+        PDF charts are found in the graphicspath; TikZ charts are read with \\input from
+        content/tex/images and need the tikz package.
+        """
+        id = entry.get("id", "unknown")
+        if self.radar_format == "tex":
+            return f"\\resizebox{{{width}}}{{!}}{{\\input{{images/{id}_radar.tex}}}}"
+        return f"\\includegraphics[width={width}]{{{directory}{id}_radar.{self.radar_format}}}"
 
-    def generate_radar_charts(
-        self, fmt="pdf", output_dir="content/tex/images", font_size=18
+    def generate_radar_grid_pages(
+        self, columns=5, rows=5, output_dir="content/tex/images", cache=True
     ):
-        valid_formats = {"pdf", "jpeg", "png", "gif"}
-        fmt = fmt.lower()
-        if fmt not in valid_formats:
-            print(
-                f"Unsupported format '{fmt}'. Supported formats: {', '.join(valid_formats)}"
-            )
-            return
-
-        os.makedirs(output_dir, exist_ok=True)
+        """
+        Renders the radar chart overview as one composed file per page, see render_radar_grid_page.
 
-        for entry in self.entries:
-            name = entry.get("name", "unknown")
-            id = entry.get("id", "unknown")
-            ratings = {}
-
-            for key, value in entry.items():
-                if key.startswith("ratings.") and key.endswith(".rating"):
-                    parts = key.split(".")
-                    if len(parts) == 3:
-                        rating_type = parts[1]
-                        try:
-                            ratings[rating_type] = float(value)
-                        except (TypeError, ValueError):
-                            ratings[rating_type] = 0.0
+        The pages are named radar_grid_<page>.pdf, or .tex for the vector backend. Like the single
+        charts, a page is only rendered again if its charts changed, and pages left over from a
+        longer overview are deleted.
 
-            if not ratings:
-                Console.error(f"No ratings found for '{name}', skipping radar chart.")
-                continue
-
-            self._generate_single_radar_chart(
-                name, id, ratings, fmt, output_dir, font_size
-            )
+        Returns:
+            list[str]: the LaTeX code including each page
+        """
+        charts_per_page = columns * rows
+        charts = [
+            (entry.get("name", "unknown"), entry.rating_values)
+            for entry in self.entries
+            if entry.rating_values
+        ]
+        os.makedirs(output_dir, exist_ok=True)
+        manifest = _load_radar_manifest(output_dir) if cache else {}
+
+        graphics = []
+        filenames = set()
+        for i in range(0, len(charts), charts_per_page):
+            page = charts[i : i + charts_per_page]
+            basename = f"radar_grid_{i // charts_per_page + 1}.{self.radar_format}"
+            filename = f"{output_dir}/{basename}"
+            filenames.add(basename)
+            key = radar_grid_key(page, columns, rows, self.radar_format)
+            known = manifest.get(basename)
+            if known is None or known["key"] != key or known["file"] != _file_state(filename):
+                render_radar_grid_page(page, columns, rows, filename)
+                manifest[basename] = {"key": key, "file": _file_state(filename)}
+                Console.ok(f"Saved radar chart grid page '{filename}'.")
+            if self.radar_format == "tex":
+                graphics.append(f"\\resizebox{{\\textwidth}}{{!}}{{\\input{{images/{basename}}}}}")
+            else:
+                graphics.append(
+                    f"\\includegraphics[width=\\textwidth,height=0.85\\textheight,keepaspectratio]{{images/{basename}}}"
+                )
 
-    def get_radar_filename(self, entry, directory="content/tex/images", fmt="pdf"):
-        if directory is None:
-            directory = "."
-        id = entry.get("id", "unkown")
-        name = f"{directory}/{id}_radar.{fmt}"
-        return name
+        for basename in os.listdir(output_dir):
+            if re.fullmatch(r"radar_grid_\d+\.\w+", basename) and basename not in filenames:
+                os.remove(os.path.join(output_dir, basename))
+                manifest.pop(basename, None)
+                Console.info(f"Removed stale radar chart grid page '{basename}'.")
+        if cache:
+            _save_radar_manifest(output_dir, manifest)
+        return graphics
 
     def generate_radar_chart_grid(
-        self, filename="content/tex/radar_grid.tex", columns=5, rows=5, fmt="pdf"
+        self,
+        filename="content/tex/radar_grid.tex",
+        columns=5,
+        rows=5,
+        composed=False,
+        output_dir="content/tex/images",
     ):
+        """
+        Writes the radar chart overview with `columns` x `rows` charts per page.
+
+        Args:
+            composed (bool): Include one composed file per page instead of every chart on its own.
+                This keeps benchmarks.pdf smaller and faster to compile.
+            output_dir (str): Directory of the composed pages.
+        """
         col_count = max(1, columns)
         row_count = max(1, rows)
         charts_per_page = col_count * row_count
 
-        figure_paths = []
-        for i, entry in enumerate(self.entries):
-            name = entry.get("name", f"Entry_{i+1}")
-
-            chart_filename = self.get_radar_filename(entry, directory="images", fmt=fmt)
-
-            figure_paths.append(chart_filename)
+        if composed:
+            page_graphics = [
+                [graphic]
+                for graphic in self.generate_radar_grid_pages(
+                    col_count, row_count, output_dir=output_dir
+                )
+            ]
+        else:
+            # Adjust width to account for spacing between images
+            width = f"{1/col_count-0.01:.4f}\\textwidth"
+            figure_paths = [
+                self.get_radar_graphic(entry, width, directory="images/")
+                for entry in self.entries
+            ]
+            page_graphics = [
+                figure_paths[i : i + charts_per_page]
+                for i in range(0, len(figure_paths), charts_per_page)
+            ]
 
         pages = []
-        for i in range(0, len(figure_paths), charts_per_page):
+        content = ""
+        for page_number, page_paths in enumerate(page_graphics, 1):
             grid_latex = textwrap.dedent(
                 r"""
                 \begin{figure}[ht!]
                 \centering
             """
             )
-            page_paths = figure_paths[i : i + charts_per_page]
-            for j, path in enumerate(page_paths):
-                # Adjust width to account for spacing between images
-                grid_latex += f"\\includegraphics[width={1/col_count-0.01:.4f}\\textwidth]{{{path}}}\n"
-                if (j + 1) % col_count == 0:
+            for j, graphic in enumerate(page_paths):
+                grid_latex += graphic + "\n"
+                if not composed and (j + 1) % col_count == 0:
                     grid_latex += (
                         r"\\[1ex]" + "\n"
                     )  # Add a small vertical space after each row
 
-            grid_latex += (
-                f"\\caption{{Radar chart overview (page {i // charts_per_page + 1})}}\n"
-            )
+            grid_latex += f"\\caption{{Radar chart overview (page {page_number})}}\n"
             grid_latex += r"\end{figure}" + "\n\n"
             pages.append(grid_latex)
 
@@ -782,7 +1162,14 @@ class GenerateLatex:
 
         content = []
         # add LaTeX preamble to content
-        content.append(LATEX_PREFIX)
+        if self.radar_format == "tex":
+            content.append(
+                LATEX_PREFIX.replace(
+                    "\\usepackage{graphicx}", "\\usepackage{graphicx}\n\\usepackage{tikz}"
+                )
+            )
+        else:
+            content.append(LATEX_PREFIX)
 
         content.append("")
         content.append("\\section{Benchmark Overview Table}\n")
@@ -822,22 +1209,12 @@ class GenerateLatex:
     # ########################################################
 
     def make_latex_ratings_table(self, entry):
-        # Extract ratings entries
-        ratings = {k: v for k, v in entry.items() if k.startswith("ratings.")}
-
-        # Parse into a dict[row][col] = value
-        table_data = {}
-        row_labels = set()
+        # Ratings parsed by the record as dict[row][col] = value
+        table_data = to_record(entry).ratings
+        row_labels = set(table_data)
         col_labels = set()
-
-        for key, value in ratings.items():
-            parts = key.split(".")  # ['ratings', 'dataset', 'rating']
-            if len(parts) != 3:
-                continue
-            _, row, col = parts
-            row_labels.add(row)
-            col_labels.add(col)
-            table_data.setdefault(row, {})[col] = value
+        for columns in table_data.values():
+            col_labels.update(columns)
 
         # Sort for consistent table
         row_labels = sorted(row_labels)
@@ -948,17 +1325,13 @@ class GenerateLatex:
             lines.append("")
             lines.append(r"{\bf Ratings:} ~ \\")
 
-            id = entry.get("id", "unknown")
-            name = entry.get("name", f"unknown_{id}")
-            image = f"{id}_radar.pdf"
-
             lines.append("")
 
             ratings_table = self.make_latex_ratings_table(entry)
             lines.append(ratings_table)
 
             lines.append("")
-            radar_block = f"\\includegraphics[width=0.2\\textwidth]{{{image}}}"
+            radar_block = self.get_radar_graphic(entry, "0.2\\textwidth")
             lines.append(radar_block)
 
         lines.append("}}")
@@ -993,7 +1366,7 @@ class GenerateLatex:
 
         write_to_file(content="\n".join(content), filename=file)
 
-    def generate_section(self, outdir="content/tex/section"):
+    def generate_section(self, outdir="content/tex/section", entries=None):
         """
         Writes a section of the LaTeX document containing the specified entries.
 
@@ -1001,10 +1374,12 @@ class GenerateLatex:
             output_path (str): Base directory for output.
             section_name (str): Name of the section to write.
             selected_columns (List[str]): List of column keys to include in this section.
+            entries (Iterable or None): Entries to write instead of the stored ones, e.g.
+                YamlManager.iter_records(); each section is written as soon as its entry is parsed.
         """
 
-        for entry in self.entries:
-            if not isinstance(entry, dict):
+        for entry in self.entries if entries is None else entries:
+            if not isinstance(entry, Mapping):
                 Console.error(f"Invalid entry format: {entry}. Expected a dictionary.")
                 continue
 
@@ -1041,26 +1416,17 @@ class GenerateLatex:
             content = ""
             url_txt = self.get_url_ref(entry)
             if col == "average_rating":
-                # Calculate the average rating
-                ratings = [
-                    float(value)
-                    for key, value in entry.items()
-                    if key.startswith("ratings.") and key.endswith(".rating") and value not in [None, "", "N/A"]
-                ]
-                if ratings:
-                    avg_rating = sum(ratings) / len(ratings)
+                avg_rating = to_record(entry).average_rating
+                if avg_rating is not None:
                     content = f"\\textbf{{{avg_rating:.2f}}}" if avg_rating >= 4.5 else f"{avg_rating:.2f}"
                 else:
                     content = "N/A"
 
             elif col == "ratings":
-                id = entry.get("id", "unknown")
-                image = f"{id}_radar.pdf"
-
                 content = (
-                    r"\raisebox{-0.5\height}{\includegraphics[width=0.85\linewidth]{"
-                    + image
-                    + "}}"
+                    r"\raisebox{-0.5\height}{"
+                    + self.get_radar_graphic(entry, r"0.85\linewidth")
+                    + "}"
                 )
 
             elif col == "cite":
@@ -1113,12 +1479,7 @@ class GenerateLatex:
 
         # Sort entries by average rating
         def calculate_average_rating(entry):
-            ratings = [
-                float(value)
-                for key, value in entry.items()
-                if key.startswith("ratings.") and key.endswith(".rating") and value not in [None, "", "N/A"]
-            ]
-            return sum(ratings) / len(ratings) if ratings else 0
+            return entry.average_rating or 0
 
         self.entries.sort(key=calculate_average_rating, reverse=True)
 
@@ -1,10 +1,10 @@
 import os
 import re
-from pybtex.database import parse_string
-from pybtex.plugin import find_plugin
 from generate_latex import write_to_file
 from generate_latex import ALL_COLUMNS, DEFAULT_COLUMNS
+from yaml_manager import BenchmarkRecord, to_record
 from cloudmesh.common.console import Console
+from citation_cache import get_citation
 import sys
 
 html = True
@@ -17,10 +17,7 @@ def bibtex_to_text(entry: str) -> str:
             raise TypeError(
                 f"Expected string for BibTeX entry, got {type(entry).__name__}"
             )
-        bib_data = parse_string(entry, bib_format="bibtex")
-        style = find_plugin("pybtex.style.formatting", "plain")()
-        formatted = next(style.format_entries(bib_data.entries.values()))
-        return re.sub(r"<[^>]+>", " ", str(formatted.text)).strip()
+        return get_citation(entry).text
 
     except Exception as e:
         return f"Could not parse citation: {e}"
@@ -40,9 +37,16 @@ class MarkdownWriter:
     Class to write formatted YAML file contents in Markdown format
     """
 
-    def __init__(self, entries: list[dict], raw_entries: list[dict] | None = None):
-        self.entries = entries
+    def __init__(
+        self,
+        entries: list[BenchmarkRecord | dict],
+        raw_entries: list[dict] | None = None,
+        radar_format: str = "png",
+    ):
+        self.entries = [to_record(entry) for entry in entries]
         self.raw_entries = raw_entries
+        # png from the matplotlib radar charts, svg from the vector ones
+        self.radar_format = radar_format
 
     def _escape_md(self, text) -> str:
         if not isinstance(text, str):
@@ -114,7 +118,6 @@ class MarkdownWriter:
         # Write each entry to the table
         for entry in self.entries:
             row = ""
-            ratings_average = 0
 
             # Write each cell to the table
             for col in columns:
@@ -137,20 +140,12 @@ class MarkdownWriter:
                     row += ", ".join(map(self._escape_md, val))
 
                 else:
-                    if col.endswith("rating"):
-                        try:
-                            ratings_average += float(val)
-                        except ValueError:
-                            Console.error(f'Rating entry "{val}" must be a number')
-
                     row += self._escape_md(str(val))
 
                 row += " | "
 
-            # Calculate and add average
-            ratings_average /= 6
             if average_ratings:
-                row += str(round(ratings_average, 3)) + " |"
+                row += str(round(entry.average_rating or 0.0, 3)) + " |"
 
             current_contents += row + "\n"
 
@@ -168,6 +163,7 @@ class MarkdownWriter:
         columns=DEFAULT_COLUMNS,
         author_trunc: int | None = None,
         average_ratings: bool = True,
+        changed_ids: set[str] | None = None,
     ) -> None:
         """
         Writes all entries stored by this writer into individual Markdown documents at `output_dir`/md_tables.
@@ -180,6 +176,7 @@ class MarkdownWriter:
             output_path (str): filepath to write to
             columns (list[str]): subset of columns in the table to include- any columns not in `column_names` will not appear in the table.
             author_trunc (int or None, default=None): maximum number of authors to display (if None, displays all authors). If not None, must be a positive integer
+            changed_ids (set[str] or None, default=None): ids of the entries whose documents are written. None writes all; the index always lists all entries.
         """
 
         index = []
@@ -193,6 +190,13 @@ class MarkdownWriter:
             filename = f"{output_dir}/{id}.md"
             link = f"{id}.md"
 
+            if html:
+                link = f"{id}.html"
+
+            index.append(f"- [{name}]({link})\n")
+            if changed_ids is not None and id not in changed_ids:
+                continue
+
             ratings_header_written = False
             written_rating_categories = []
 
@@ -202,8 +206,6 @@ class MarkdownWriter:
 
             lines.append(f"**Edit:** {edit}\n\n")
 
-            average_rating = 0
-
             for col in columns:
                 val = entry.get(col, "")
                 col_label = self.colunm_label(col)
@@ -227,38 +229,21 @@ class MarkdownWriter:
                             lines.append(f"      {raw_line}\n")
                     lines.append("      ```\n")
 
-                elif col.startswith("ratings"):
+                elif col.startswith("ratings."):
                     if not ratings_header_written:
                         lines.append("**Ratings:**\n\n")
                         ratings_header_written = True
 
-                    if col.endswith("rating"):
-                        try:
-                            average_rating += float(val)
-                        except ValueError:
-                            Console.error(f'The rating "{val}" must be a number')
-
-                    # ###########
-                    # #Flat writing here
-                    # val_str = str(val).replace("\n", " ").replace("['", "").replace("']", "")
-                    # val_str = val_str.replace("', '", ", ").replace("','", ", ").replace("[]", "")
-                    # val_str = val_str.replace("[", " ").replace("]", " ").replace("(", " ").replace(")", " ")
-                    # f.write(f"- **{col_display[9:]}:** {val_str}\n\n")
-
-                    ###########
-                    # Hierarchical writing here (will break if the raw rating dictionary is changed)
-                    category = col.split(".")[1]
-
+                    _, category, aspect = col.split(".", 2)
                     if not category in written_rating_categories:
                         lines.append(f"{category.replace('_', ' ').title()}:\n\n")
                         written_rating_categories.append(category)
 
-                    val_str = val_to_str(val)
+                    val_str = val_to_str(entry.ratings.get(category, {}).get(aspect, ""))
 
                     lines.append(
-                        f"  - **{col.split('.')[2].replace('_', ' ').title()}:** {val_str}\n\n"
+                        f"  - **{aspect.replace('_', ' ').title()}:** {val_str}\n\n"
                     )
-                    ###########
 
                 else:
                     val_str = val_to_str(val)
@@ -267,19 +252,15 @@ class MarkdownWriter:
 
             # write the ratings
             lines.append(
-                f"**Average Rating:** {str(round(average_rating/6, 3))}\n\n"
-            )  # This assumes the new rating system with 6 categories
+                f"**Average Rating:** {str(round(entry.average_rating or 0.0, 3))}\n\n"
+            )
 
             # write the image
-            image_location = f"../../tex/images/{id}_radar.png"
+            image_location = f"../../tex/images/{id}_radar.{self.radar_format}"
             lines.append(
                 f"**Radar Plot:**\n ![{id.replace('_', ' ').title()} radar plot]({image_location})"
             )
 
-            if html:
-                link = f"{id}.html"
-
-            index.append(f"- [{name}]({link})\n")
             write_to_file(content="\n".join(lines), filename=filename)
 
         write_to_file(content="\n".join(index), filename=index_filename)
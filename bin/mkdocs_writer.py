@@ -17,11 +17,10 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Sequence, Tuple
 from urllib.parse import quote
 
-from pybtex.database import parse_string
-from pybtex.plugin import find_plugin
-
 from cloudmesh.common.console import Console
+from citation_cache import get_citation
 from generate_latex import ALL_COLUMNS, DEFAULT_COLUMNS, write_to_file
+from yaml_manager import BenchmarkRecord, to_record
 
 __all__ = ["MkdocsWriter"]
 
@@ -95,7 +94,7 @@ RADAR_TEMPLATE = textwrap.dedent(
     <h3>Radar plot</h3>
 
     <div class="radar-wrap">
-        <img class="radar-img" alt="{alt}" src="../../../tex/images/{image_name}_radar.png" />
+        <img class="radar-img" alt="{alt}" src="../../../tex/images/{image_name}_radar.{image_format}" />
     </div>
     """
 ).strip() + "\n"
@@ -188,10 +187,7 @@ def _bibtex_to_text(entry: str) -> str:
     try:
         if not isinstance(entry, str):
             raise TypeError(f"Expected string for BibTeX entry, got {type(entry).__name__}")
-        bib_data = parse_string(entry, bib_format="bibtex")
-        style = find_plugin("pybtex.style.formatting", "plain")()
-        formatted = next(style.format_entries(bib_data.entries.values()))
-        return re.sub(r"<[^>]+>", " ", str(formatted.text)).strip()
+        return get_citation(entry).text
     except Exception as exc:  # pragma: no cover - defensive
         return f"Could not parse citation: {exc}"
 
@@ -203,9 +199,9 @@ def _bibtex_to_text(entry: str) -> str:
 
 @dataclass
 class BenchmarkEntry:
-    """Value object wrapping a single benchmark for rendering."""
+    """Rendering view of a :class:`BenchmarkRecord`."""
 
-    raw: Dict[str, Any]
+    record: BenchmarkRecord
     id: str = field(init=False)
     name: str = field(init=False)
     date: str = field(init=False)
@@ -216,19 +212,24 @@ class BenchmarkEntry:
     focus: str = field(init=False)
 
     def __post_init__(self) -> None:
-        entry_id = str(self.raw.get("id") or "").strip()
+        entry_id = str(self.record.id or "").strip()
         if not entry_id:
             raise KeyError(
                 "Benchmark entry is missing an 'id'. Ensure YamlManager.clean_string ran before generation."
             )
         self.id = entry_id
-        self.name = str(self.raw.get("name") or self.id).strip()
-        self.date = str(self.raw.get("date") or "").strip()
-        self.domains = _as_list(self.raw.get("domain"))
-        self.metrics = _as_list(self.raw.get("metrics"))
-        self.task_types = _as_list(self.raw.get("task_types"))
-        self.keywords = _as_list(self.raw.get("keywords"))
-        self.focus = _flatten_text(self.raw.get("focus"))
+        self.name = str(self.record.name or self.id).strip()
+        self.date = str(self.record.get("date") or "").strip()
+        self.domains = _as_list(self.record.get("domain"))
+        self.metrics = _as_list(self.record.get("metrics"))
+        self.task_types = _as_list(self.record.get("task_types"))
+        self.keywords = _as_list(self.record.get("keywords"))
+        self.focus = _flatten_text(self.record.get("focus"))
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """Nested entry for the link lists the flat row merges; the flat row if there is none."""
+        return self.record.raw if self.record.raw is not None else self.record.flat
 
     # ------------------------------------------------------------------ cards
 
@@ -274,6 +275,11 @@ class BenchmarkEntry:
             detail_href=_esc(detail_href),
         )
 
+    def ratings_average(self) -> float | None:
+        """Average rating as shown on the card and the detail page."""
+        average = self.record.average_rating
+        return round(average, 3) if average is not None else None
+
     # --------------------------------------------------------------- detail
 
     def render_detail(
@@ -282,6 +288,7 @@ class BenchmarkEntry:
         *,
         average_ratings: bool,
         use_directory_urls: bool,
+        radar_format: str = "png",
     ) -> Tuple[HTML, float | None]:
         """Return the detail page HTML and average rating."""
         ratings_block, ratings_average = self._ratings_block(columns)
@@ -307,7 +314,9 @@ class BenchmarkEntry:
             extra_block=self._extra_block(columns),
             average_block=average_block,
             radar_block=RADAR_TEMPLATE.format(
-                alt=_esc(f"{self.name} radar"), image_name=_esc(self.id)
+                alt=_esc(f"{self.name} radar"),
+                image_name=_esc(self.id),
+                image_format=_esc(radar_format),
             ),
             edit_block=EDIT_LINK_HTML,
         )
@@ -386,7 +395,7 @@ class BenchmarkEntry:
     def _citations_block(self, columns: Sequence[str]) -> HTML:
         if "cite" not in columns:
             return ""
-        citations = _as_list(self.raw.get("cite"))
+        citations = _as_list(self.record.citations)
         if not citations:
             return ""
         rendered: List[str] = [f"<h3>{_esc(_col_label('cite'))}</h3>\n\n"]
@@ -403,18 +412,12 @@ class BenchmarkEntry:
         return "".join(rendered)
 
     def _ratings_block(self, columns: Sequence[str]) -> Tuple[HTML, float | None]:
-        ratings = self.raw.get("ratings")
-        if not isinstance(ratings, dict):
-            return "", self._ratings_average(ratings)
-
         requested = self._requested_rating_aspects(columns)
-        ordered_items = self._ordered_ratings(ratings)
+        ordered_items = self._ordered_ratings(self.record.ratings)
         if not ordered_items:
-            return "", self._ratings_average(ratings)
+            return "", self.ratings_average()
 
         rows: List[str] = []
-        total = 0.0
-        count = 0
         for category, info in ordered_items:
             rating_value = info.get("rating")
             reason_value = info.get("reason")
@@ -426,8 +429,6 @@ class BenchmarkEntry:
                 try:
                     rating_number = float(rating_value)
                     rating_label = f"{rating_number:.2f}"
-                    total += rating_number
-                    count += 1
                 except (ValueError, TypeError):
                     Console.error(f'The rating "{rating_value}" must be a number')
 
@@ -451,7 +452,7 @@ class BenchmarkEntry:
                 + "</div>"
             )
 
-        average = round(total / count, 3) if count else None
+        average = self.ratings_average()
         if not rows:
             return "", average
 
@@ -483,23 +484,6 @@ class BenchmarkEntry:
 
     # ------------------------------------------------------------- rating utils
 
-    def _ratings_average(self, ratings: Any) -> float | None:
-        if not isinstance(ratings, dict):
-            return None
-        total = 0.0
-        count = 0
-        for info in ratings.values():
-            if not isinstance(info, dict):
-                continue
-            rating_value = info.get("rating")
-            if _nonempty(rating_value):
-                try:
-                    total += float(rating_value)
-                    count += 1
-                except (ValueError, TypeError):
-                    Console.error(f'The rating "{rating_value}" must be a number')
-        return round(total / count, 3) if count else None
-
     def _requested_rating_aspects(self, columns: Sequence[str]) -> Dict[str, set]:
         requested: Dict[str, set] = {}
         for column in columns:
@@ -572,22 +556,29 @@ class BenchmarkEntry:
 
 
 class MkdocsWriter:
-    """Generate MkDocs artefacts from raw benchmark entries."""
+    """Generate MkDocs artefacts from raw benchmark entries or records."""
 
     def __init__(
         self,
-        benchmarks: Iterable[Dict[str, Any]] | None,
+        benchmarks: Iterable[Dict[str, Any] | BenchmarkRecord] | None,
         *,
         use_directory_urls: bool = True,
+        radar_format: str = "png",
     ):
         self.use_directory_urls = use_directory_urls
+        # png from the matplotlib radar charts, svg from the vector ones
+        self.radar_format = radar_format
         self.entries: List[BenchmarkEntry] = []
         if benchmarks:
             for raw in benchmarks:
-                try:
-                    self.entries.append(BenchmarkEntry(raw))
-                except Exception as exc:  # pragma: no cover - defensive
-                    raise ValueError(f"Invalid benchmark entry: {exc}") from exc
+                self.entries.append(self._to_entry(raw))
+
+    @staticmethod
+    def _to_entry(raw: Dict[str, Any] | BenchmarkRecord) -> BenchmarkEntry:
+        try:
+            return BenchmarkEntry(to_record(raw, flat=False))
+        except Exception as exc:  # pragma: no cover - defensive
+            raise ValueError(f"Invalid benchmark entry: {exc}") from exc
 
     # ------------------------------------------------------------------ writers
 
@@ -599,12 +590,21 @@ class MkdocsWriter:
         average_ratings: bool = True,
         *,
         filters_js_src: str | None = None,
+        entries: Iterable[Dict[str, Any] | BenchmarkRecord] | None = None,
+        changed_ids: set[str] | None = None,
     ) -> None:
         """
         Write ``cards.md`` and one detail page per benchmark.
 
         ``filters_js_src`` may point to the runtime script if the theme does not
         already include ``assets/js/filters.js``.
+
+        ``entries`` may be an iterator such as ``YamlManager.iter_records()``; each
+        detail page is then written as soon as its entry is parsed instead of the
+        entries held by the writer.
+
+        If ``changed_ids`` is given, only the detail pages of these entries are
+        rendered and written; ``cards.md`` always contains every entry.
         """
 
         valid_columns = _validate_columns(list(columns))
@@ -612,16 +612,22 @@ class MkdocsWriter:
 
         card_lines: List[str] = [INDEX_HEADER_TEMPLATE]
 
-        for entry in self.entries:
-            detail_html, ratings_average = entry.render_detail(
-                valid_columns,
-                average_ratings=average_ratings,
-                use_directory_urls=self.use_directory_urls,
-            )
-            write_to_file(
-                content=detail_html,
-                filename=os.path.join(output_dir, f"{entry.id}.md"),
-            )
+        stream = self.entries if entries is None else map(self._to_entry, entries)
+        for entry in stream:
+            if changed_ids is not None and entry.id not in changed_ids:
+                # the card only needs the average, the detail page is up to date
+                ratings_average = entry.ratings_average()
+            else:
+                detail_html, ratings_average = entry.render_detail(
+                    valid_columns,
+                    average_ratings=average_ratings,
+                    use_directory_urls=self.use_directory_urls,
+                    radar_format=self.radar_format,
+                )
+                write_to_file(
+                    content=detail_html,
+                    filename=os.path.join(output_dir, f"{entry.id}.md"),
+                )
             card_lines.append(entry.card_html(ratings_average, self.use_directory_urls))
 
         card_lines.append(self._index_footer(filters_js_src))
@@ -0,0 +1,263 @@
+"""
+Radar charts written as TikZ or SVG code, without matplotlib.
+
+The charts follow the layout of the matplotlib charts in `generate_latex.py`: the first
+category points to the right, the others follow counterclockwise, one grid circle per
+rating step, and the entry name as title above. They are built from the rating values
+with string templates only, so a chart takes microseconds and neither numpy nor
+matplotlib is imported.
+
+- `radar_chart_tikz` returns a `tikzpicture` for the LaTeX document. It needs
+  `\\usepackage{tikz}` and is included with `\\input`, usually inside `\\resizebox`.
+- `radar_grid_tikz` returns one `tikzpicture` with many charts, for the composed pages
+  of the radar chart overview.
+- `radar_chart_svg` returns a standalone SVG image for the Markdown and MkDocs pages.
+
+Example:
+
+    ratings = {"software": 3.0, "dataset": 4.0, "metrics": 1.0}
+    with open("content/tex/images/x_radar.tex", "w") as f:
+        f.write(radar_chart_tikz("Some benchmark", ratings))
+"""
+
+import html
+import math
+import textwrap
+
+# Increase when the vector charts are drawn differently, so cached charts are redrawn
+RADAR_VECTOR_VERSION = 1
+
+# matplotlib's "tab:blue" and grid gray
+LINE_COLOR = "1F77B4"
+GRID_COLOR = "B0B0B0"
+
+TEX_REPLACEMENTS = {
+    "\\": r"\textbackslash{}",
+    "&": r"\&",
+    "%": r"\%",
+    "$": r"\$",
+    "#": r"\#",
+    "_": r"\_",
+    "{": r"\{",
+    "}": r"\}",
+    "~": r"\textasciitilde{}",
+    "^": r"\textasciicircum{}",
+}
+
+
+def wrap_radar_title(name: str, font_size: int = 18) -> list[str]:
+    """
+    Returns the lines of the chart title, wrapped at about 30 characters for font size 18.
+    """
+    max_chars_per_line = max(1, int(30 * (font_size / 18)))
+    if len(name) > max_chars_per_line:
+        return textwrap.wrap(name, max_chars_per_line)
+    return [name]
+
+
+def _tex_escape(text: str) -> str:
+    return "".join(TEX_REPLACEMENTS.get(ch, ch) for ch in str(text))
+
+
+def _number(value: float) -> str:
+    # Fixed precision keeps the output identical across platforms
+    text = f"{value:.3f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def _axes(ratings: dict) -> tuple[list[str], list[float], list[float], float]:
+    """
+    Returns the labels, the angles in degrees, the values, and the radial limit of a chart.
+    """
+    labels = [str(label) for label in ratings.keys()]
+    values = [float(value) for value in ratings.values()]
+    if all(v == 0.0 for v in values):
+        values = [0.01] * len(values)  # tiny baseline so shape is visible
+    angles = [360.0 * i / len(labels) for i in range(len(labels))]
+    limit = max(1.0, max(values))
+    return labels, angles, values, limit
+
+
+def _grid_steps(limit: float) -> list[float]:
+    # one circle per rating step, the outermost at the limit
+    steps = [float(step) for step in range(1, math.ceil(limit))]
+    return steps + [limit]
+
+
+def _tikz_anchor(angle: float) -> str:
+    x = math.cos(math.radians(angle))
+    y = math.sin(math.radians(angle))
+    if abs(x) < 0.3:
+        return "south" if y > 0 else "north"
+    return "west" if x > 0 else "east"
+
+
+TIKZ_HEADER = [
+    "% Generated by bin/radar_vector.py",
+    "\\begin{tikzpicture}",
+    f"\\definecolor{{radarline}}{{HTML}}{{{LINE_COLOR}}}",
+    f"\\definecolor{{radargrid}}{{HTML}}{{{GRID_COLOR}}}",
+]
+
+# Size of one chart with its labels and title in a grid page, in cm
+TIKZ_CELL_WIDTH = 15.0
+TIKZ_CELL_HEIGHT = 11.0
+
+
+def _tikz_chart(name: str, ratings: dict, font_size: int) -> list[str]:
+    """
+    Returns the TikZ commands that draw one chart centred at the origin.
+    """
+    labels, angles, values, limit = _axes(ratings)
+    radius = 3.0  # cm
+    scale = radius / limit
+
+    lines = []
+    for step in _grid_steps(limit):
+        lines.append(
+            f"\\draw[radargrid, line width=0.4pt] (0,0) circle ({_number(step * scale)});"
+        )
+    for angle in angles:
+        lines.append(
+            f"\\draw[radargrid, line width=0.4pt] (0,0) -- ({_number(angle)}:{_number(radius)});"
+        )
+
+    polygon = " -- ".join(
+        f"({_number(angle)}:{_number(value * scale)})" for angle, value in zip(angles, values)
+    )
+    lines.append(
+        f"\\draw[radarline, line width=1pt, fill=radarline, fill opacity=0.25] {polygon} -- cycle;"
+    )
+
+    for angle, label in zip(angles, labels):
+        lines.append(
+            f"\\node[anchor={_tikz_anchor(angle)}, font=\\large] at "
+            f"({_number(angle)}:{_number(radius + 0.15)}) {{{_tex_escape(label)}}};"
+        )
+
+    title = " \\\\ ".join(_tex_escape(line) for line in wrap_radar_title(name, font_size))
+    lines.append(
+        f"\\node[anchor=south, align=center, font=\\Large] at (0,{_number(radius + 0.9)}) {{{title}}};"
+    )
+    return lines
+
+
+def radar_chart_tikz(name: str, ratings: dict, font_size: int = 18) -> str:
+    """
+    Returns the radar chart of one entry as a TikZ picture.
+
+    Parameters:
+        name (str): entry name, used as title
+        ratings (dict): category -> rating, in drawing order
+        font_size (int): font size of the matplotlib charts, only used to wrap the title
+    Returns:
+        str: a `tikzpicture` environment
+    """
+    lines = TIKZ_HEADER + _tikz_chart(name, ratings, font_size) + ["\\end{tikzpicture}"]
+    return "\n".join(lines) + "\n"
+
+
+def radar_grid_tikz(charts: list[tuple[str, dict]], columns: int = 5, font_size: int = 18) -> str:
+    """
+    Returns one TikZ picture with the charts laid out in rows of `columns`.
+
+    Parameters:
+        charts (list[tuple[str, dict]]): (name, ratings) of every chart, in reading order
+        columns (int): charts per row
+        font_size (int): font size of the matplotlib charts, only used to wrap the titles
+    Returns:
+        str: a `tikzpicture` environment
+    """
+    lines = list(TIKZ_HEADER)
+    for i, (name, ratings) in enumerate(charts):
+        row, column = divmod(i, columns)
+        x = _number(column * TIKZ_CELL_WIDTH)
+        y = _number(-row * TIKZ_CELL_HEIGHT)
+        lines.append(f"\\begin{{scope}}[shift={{({x},{y})}}]")
+        lines += _tikz_chart(name, ratings, font_size)
+        lines.append("\\end{scope}")
+    lines.append("\\end{tikzpicture}")
+    return "\n".join(lines) + "\n"
+
+
+def radar_chart_svg(name: str, ratings: dict, font_size: int = 18) -> str:
+    """
+    Returns the radar chart of one entry as an SVG image.
+
+    Parameters:
+        name (str): entry name, used as title
+        ratings (dict): category -> rating, in drawing order
+        font_size (int): font size of the labels in pixels
+    Returns:
+        str: an `svg` document
+    """
+    labels, angles, values, limit = _axes(ratings)
+    title_lines = wrap_radar_title(name, font_size)
+    title_size = font_size + 2
+
+    radius = 130.0
+    # room for the longest label on both sides, at about 0.6 em per character
+    label_width = 0.6 * font_size * max(len(label) for label in labels)
+    width = round(2 * (radius + 8 + label_width) + 16)
+    top = 12 + len(title_lines) * title_size * 1.2 + 2 * font_size
+    cx = width / 2
+    cy = top + radius
+    height = cy + radius + 2 * font_size
+    scale = radius / limit
+
+    def point(angle, r):
+        return (
+            cx + r * math.cos(math.radians(angle)),
+            cy - r * math.sin(math.radians(angle)),
+        )
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{_number(height)}"'
+        f' viewBox="0 0 {width} {_number(height)}" font-family="DejaVu Sans, sans-serif">',
+        f"<title>{html.escape(name)}</title>",
+        f'<g fill="none" stroke="#{GRID_COLOR}" stroke-width="0.8">',
+    ]
+    for step in _grid_steps(limit):
+        parts.append(
+            f'<circle cx="{_number(cx)}" cy="{_number(cy)}" r="{_number(step * scale)}"/>'
+        )
+    for angle in angles:
+        x, y = point(angle, radius)
+        parts.append(
+            f'<line x1="{_number(cx)}" y1="{_number(cy)}" x2="{_number(x)}" y2="{_number(y)}"/>'
+        )
+    parts.append("</g>")
+
+    points = " ".join(
+        "{},{}".format(*map(_number, point(angle, value * scale)))
+        for angle, value in zip(angles, values)
+    )
+    parts.append(
+        f'<polygon points="{points}" fill="#{LINE_COLOR}" fill-opacity="0.25"'
+        f' stroke="#{LINE_COLOR}" stroke-width="2" stroke-linejoin="round"/>'
+    )
+
+    parts.append(f'<g font-size="{font_size}" fill="#000000">')
+    for angle, label in zip(angles, labels):
+        x, y = point(angle, radius + 8)
+        cos = math.cos(math.radians(angle))
+        sin = math.sin(math.radians(angle))
+        if abs(cos) < 0.3:
+            anchor = "middle"
+            baseline = "auto" if sin > 0 else "hanging"
+        else:
+            anchor = "start" if cos > 0 else "end"
+            baseline = "middle"
+        parts.append(
+            f'<text x="{_number(x)}" y="{_number(y)}" text-anchor="{anchor}"'
+            f' dominant-baseline="{baseline}">{html.escape(label)}</text>'
+        )
+    parts.append("</g>")
+
+    parts.append(f'<text x="{_number(cx)}" y="12" font-size="{title_size}" text-anchor="middle">')
+    for i, line in enumerate(title_lines):
+        dy = f"{title_size * 1.2:g}" if i else "1em"
+        parts.append(f'<tspan x="{_number(cx)}" dy="{dy}">{html.escape(line)}</tspan>')
+    parts.append("</text>")
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
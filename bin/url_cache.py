@@ -0,0 +1,158 @@
+"""
+Persistent results of the URL checks of `generate.py --check_url`.
+
+For every URL that was found valid the cache (default `.cache/url_checks.json`) stores
+the status code, the final URL after redirects, the ETag and Last-Modified headers,
+and the time of the check.
+
+- A URL checked less than `ttl` seconds ago is not requested again.
+- An older URL is revalidated with a conditional request (If-None-Match,
+  If-Modified-Since); a 304 answer confirms it without a body.
+- Invalid URLs are not cached, so that they are checked again on the next run.
+- A URL that refused plain requests but opened in headless Chrome is cached with the
+  method "browser", so Chrome is not started for it again until the TTL expires.
+
+Example:
+
+    cache = URLCheckCache(ttl=24 * 3600)
+    checker = URLChecker(entries, cache=cache)
+    checker.check_urls()
+    cache.save()
+"""
+
+import json
+import os
+import threading
+import time
+
+URL_CACHE_VERSION = 1
+DEFAULT_URL_CACHE = ".cache/url_checks.json"
+DEFAULT_URL_TTL = 24 * 3600
+
+
+class URLCheckCache(object):
+    """
+    Maps URLs to the result of their last successful check. Safe to use from several threads.
+    """
+
+    def __init__(self, path: str | None = DEFAULT_URL_CACHE, ttl: float = DEFAULT_URL_TTL):
+        """
+        Creates a cache, loading it from `path` if given and the file exists.
+
+        Parameters:
+            path (str or None): JSON file to load from and save to. None keeps the cache in memory.
+            ttl (float): seconds after which a result is revalidated
+        """
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.revalidated = 0
+        self._results: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path is not None:
+            self.load()
+
+    def __len__(self):
+        return len(self._results)
+
+    def load(self) -> None:
+        """
+        Loads the results saved in `path`. Files written by another cache version are ignored.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(record, dict) or record.get("version") != URL_CACHE_VERSION:
+            return
+        self._results.update(record.get("urls", {}))
+
+    def save(self) -> None:
+        """
+        Writes the results to `path` if any changed since loading.
+        """
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            record = {"version": URL_CACHE_VERSION, "urls": dict(self._results)}
+            self._dirty = False
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_file = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(record, f, indent=1, sort_keys=True)
+        os.replace(tmp_file, self.path)
+
+    def fresh(self, url: str, now: float | None = None) -> dict | None:
+        """
+        Returns the cached result of `url` if it is younger than the TTL, else None.
+        """
+        result = self._results.get(url)
+        now = time.time() if now is None else now
+        if result is None or now - result["checked"] >= self.ttl:
+            return None
+        with self._lock:
+            self.hits += 1
+        return result
+
+    def validators(self, url: str) -> dict:
+        """
+        Returns the headers of a conditional request for `url`, empty if nothing is cached.
+        """
+        result = self._results.get(url)
+        headers = {}
+        if result is not None:
+            if result.get("etag"):
+                headers["If-None-Match"] = result["etag"]
+            if result.get("last_modified"):
+                headers["If-Modified-Since"] = result["last_modified"]
+        return headers
+
+    def remember(self, url: str, response) -> None:
+        """
+        Stores the successful `response` (a requests.Response) to the check of `url`.
+
+        A 304 answer keeps the validators and final URL of the cached result.
+        """
+        with self._lock:
+            previous = self._results.get(url)
+            if response.status_code == 304 and previous is not None:
+                self.revalidated += 1
+                result = dict(previous)
+                result["checked"] = time.time()
+            else:
+                result = {
+                    "status_code": response.status_code,
+                    "final_url": response.url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "checked": time.time(),
+                }
+            self._results[url] = result
+            self._dirty = True
+
+    def remember_browser(self, url: str, status_code: int) -> None:
+        """
+        Stores that `url` answered plain requests with `status_code` but opened in a browser.
+        """
+        with self._lock:
+            self._results[url] = {
+                "status_code": status_code,
+                "final_url": url,
+                "etag": None,
+                "last_modified": None,
+                "checked": time.time(),
+                "method": "browser",
+            }
+            self._dirty = True
+
+    def forget(self, url: str) -> None:
+        """
+        Removes `url`, e.g. after it was found invalid.
+        """
+        with self._lock:
+            if self._results.pop(url, None) is not None:
+                self._dirty = True
@@ -15,18 +15,25 @@ from requests.exceptions import (
     TooManyRedirects,
     SSLError,
 )
+from requests.adapters import HTTPAdapter
 from collections import OrderedDict
 import codecs
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 
 from field_format_manager import FieldFormatManager
+from url_cache import URLCheckCache
+from yaml_loader import safe_load
+from yaml_manager import to_record
 from cloudmesh.common.util import banner
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
 import html2text  # Import the html2text library for Markdown conversion
 import requests  # Import the requests library for direct HTTP requests
 from pybtex.database import parse_string  # Import parse_string from pybtex
@@ -91,6 +98,17 @@ def http_error_message(code, url=None) -> str:
     else:
         return f"{code}: {explanation}"
 
+
+def _page_ready(driver) -> bool:
+    """
+    Returns whether the page in `driver` has finished loading and is not an anti-bot
+    challenge page such as "Just a moment...", which replaces itself with the real page.
+    """
+    if driver.execute_script("return document.readyState") != "complete":
+        return False
+    return "Just a moment" not in driver.title
+
+
 class SeleniumFetcher:
     """
     A class to fetch HTML content of webpages using Selenium WebDriver.
@@ -200,12 +218,11 @@ class SeleniumFetcher:
     def fetch_page_html(self, url: str, wait_time: int = 10) -> str | None:
         """
         Fetches the HTML content of a webpage using the initialized Selenium WebDriver.
-        Includes a wait mechanism to handle dynamic content or anti-bot pages.
+        Waits until the page is loaded and an anti-bot page is gone, at most `wait_time` seconds.
 
         Args:
             url (str): The URL of the webpage to fetch.
-            wait_time (int): Maximum time in seconds to wait for the page to load
-                             or for specific elements to be present.
+            wait_time (int): Maximum time in seconds to wait for the page to be ready.
 
         Returns:
             str: The HTML content of the page (or None if failed).
@@ -213,35 +230,12 @@ class SeleniumFetcher:
         try:
             self.driver.get(url)
 
-            # Add a short, static sleep first, sometimes this helps with initial anti-bot checks
-            time.sleep(2)
-
-            # Wait until the "Just a moment..." text is no longer present,
-            # or until a common page element (e.g., body) is loaded.
-            # We'll try to wait for the absence of the "Just a moment..." text
-            # or for the presence of the <body> tag, assuming it's the main content.
+            # Poll until the page is loaded and an anti-bot challenge is gone, instead of
+            # sleeping a fixed time first. A page that stays a challenge is returned as is.
             try:
-                # Wait for the element containing "Just a moment..." to disappear
-                WebDriverWait(self.driver, wait_time).until(
-                    EC.invisibility_of_element_located(
-                        (By.XPATH, "//*[contains(text(), 'Just a moment...')]")
-                    )
-                )
-                print(
-                    "Successfully waited for 'Just a moment...' to disappear (if present)."
-                )
-            except Exception:
-                # If the "Just a moment..." element wasn't found or didn't disappear,
-                # we'll still try to wait for the body element to be present.
-                # This handles cases where the "Just a moment..." isn't the issue,
-                # but the page is still loading.
-                print(
-                    "No 'Just a moment...' element found or it persisted. Waiting for body element."
-                )
-                WebDriverWait(self.driver, wait_time).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-                print("Successfully waited for body element to be present.")
+                WebDriverWait(self.driver, wait_time, poll_frequency=0.25).until(_page_ready)
+            except TimeoutException:
+                Console.warning(f"'{url}' was not ready after {wait_time} seconds.")
 
             return self.driver.page_source  # Full HTML of the page
         except Exception as e:
@@ -287,6 +281,113 @@ class SeleniumFetcher:
             self.driver = None  # Set to None to indicate it's closed
 
 
+DEFAULT_BROWSERS = 2
+
+
+class BrowserPool:
+    """
+    Headless Chrome browsers for the URLs that refuse plain requests (HTTP 403), shared
+    by the threads of a URL check.
+
+    A browser is started only when a fetch needs one and none is idle, up to `size`
+    browsers. It is kept for the following fetches until close(). If a browser cannot
+    be started, e.g. because Chrome is not installed, later fetches fail at once with
+    the same error instead of trying again.
+
+    Example:
+
+        pool = BrowserPool(size=2)
+        try:
+            with pool.fetcher() as fetcher:
+                html = fetcher.fetch_page_html(url, wait_time=15)
+        finally:
+            pool.close()
+    """
+
+    def __init__(self, size: int = DEFAULT_BROWSERS, headless: bool = True, factory=None):
+        """
+        Parameters:
+            size (int): maximum number of browsers running at the same time
+            headless (bool): whether the browsers run without a window
+            factory (callable): returns a new fetcher, by default a SeleniumFetcher
+        """
+        self.size = max(1, size)
+        self.factory = factory or (lambda: SeleniumFetcher(headless=headless))
+        self.started = 0
+        self._fetchers = []
+        self._idle = []
+        self._error = None
+        self._condition = threading.Condition()
+
+    def _acquire(self):
+        with self._condition:
+            while True:
+                if self._error is not None:
+                    raise self._error
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._fetchers) < self.size:
+                    self._fetchers.append(None)  # reserves the slot while the browser starts
+                    break
+                self._condition.wait()
+        try:
+            fetcher = self.factory()
+        except Exception as e:
+            with self._condition:
+                self._fetchers.remove(None)
+                self._error = e
+                self._condition.notify_all()
+            raise
+        with self._condition:
+            self._fetchers[self._fetchers.index(None)] = fetcher
+            self.started += 1
+        return fetcher
+
+    def _release(self, fetcher, reuse: bool) -> None:
+        with self._condition:
+            if reuse:
+                self._idle.append(fetcher)
+            else:
+                self._fetchers.remove(fetcher)
+            self._condition.notify()
+        if not reuse:
+            self._quit(fetcher)
+
+    @staticmethod
+    def _quit(fetcher) -> None:
+        try:
+            fetcher.close()
+        except Exception as e:
+            Console.warning(f"Could not close the browser: {e}")
+
+    @contextmanager
+    def fetcher(self):
+        """
+        Lends a browser to the calling thread, waiting if all `size` browsers are busy.
+        A browser that raised an exception is closed instead of being reused.
+        """
+        fetcher = self._acquire()
+        reuse = False
+        try:
+            yield fetcher
+            reuse = True
+        finally:
+            self._release(fetcher, reuse)
+
+    def close(self) -> None:
+        """
+        Closes all browsers. The pool can be used again afterwards and starts new ones.
+        """
+        with self._condition:
+            fetchers = [fetcher for fetcher in self._fetchers if fetcher is not None]
+            # browsers that are still starting keep their slots
+            self._fetchers = [None] * (len(self._fetchers) - len(fetchers))
+            self._idle = []
+            self._error = None
+        for fetcher in fetchers:
+            self._quit(fetcher)
+
+
 def fetch_webpage(url: str, headers: dict = None) -> str:
     """
     Accesses a web page at the given URL and returns its content.
@@ -345,22 +446,119 @@ def fetch_webpage(url: str, headers: dict = None) -> str:
         return error_message
 
 
+class _ThreadOutput(io.TextIOBase):
+    """
+    Replaces sys.stdout while URLs are checked in threads. Every thread that called
+    `start` writes into its own buffer, all other output goes to the original stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def start(self) -> None:
+        self.local.buffer = io.StringIO()
+
+    def stop(self) -> str:
+        buffer = self.local.buffer
+        self.local.buffer = None
+        return buffer.getvalue()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def isatty(self):
+        # keeps the colors of Console when the original stream is a terminal
+        return self.stream.isatty()
+
+    @property
+    def encoding(self):
+        return getattr(self.stream, "encoding", "utf-8")
+
+
+@contextmanager
+def _buffered_stdout():
+    """
+    Installs a _ThreadOutput as sys.stdout for the body of the `with` block.
+    """
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        yield output
+    finally:
+        sys.stdout = output.stream
+
+
+# Connections kept open per host by the session of URLChecker
+URL_POOL_SIZE = 16
+
+
+def url_key(url):
+    """
+    Returns the key under which equivalent URLs are checked only once.
+
+    The key ignores the scheme, a leading "www.", the case of the host, a trailing slash,
+    and the fragment. Path and query keep their case, since they are case-sensitive.
+    doi.org and dx.doi.org links of the same DOI share a key.
+    """
+    if not isinstance(url, str):
+        return url
+    url = url.strip().split("#", 1)[0]
+    host, rest = re.match(r"(?:https?://)?([^/?]*)(.*)", url, flags=re.IGNORECASE).groups()
+    host = re.sub(r"^www\.", "", host.lower())
+    if host == "dx.doi.org":
+        host = "doi.org"
+    return (host + rest).rstrip("/")
+
+
+def _url_host(url) -> str:
+    try:
+        return urlsplit(url).netloc.lower()
+    except (TypeError, ValueError, AttributeError):
+        return ""
+
+
 class URLChecker:
 
-    def __init__(self, entries: list, verbose: bool = False, ignore_check=None):
+    def __init__(
+        self,
+        entries: list,
+        verbose: bool = False,
+        ignore_check=None,
+        cache: URLCheckCache | None = None,
+        browsers: int = DEFAULT_BROWSERS,
+    ):
         """
-        Initializes the URLchecker with a list of flat dictionaries.
-        :param entires: List of dictionaries containing entries with URLs.
+        Initializes the URLchecker with a list of BenchmarkRecords or flat dictionaries.
+        :param entires: List of records containing entries with URLs.
+        :param cache: results of earlier checks; recent valid URLs are skipped, older ones revalidated.
+        :param browsers: number of headless browsers that retry URLs answered with HTTP 403;
+            0 reports these URLs as invalid without a retry.
         """
-        self.entries = entries
+        self.entries = [to_record(entry) for entry in entries]
         self.verbose = verbose
+        self.cache = cache
+        # started on the first 403 and closed at the end of check_urls
+        self.browsers = BrowserPool(size=browsers) if browsers > 0 else None
+        # One session for all checks keeps connections and TLS sessions alive between URLs
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = "Mozilla/5.0"
+        adapter = HTTPAdapter(
+            pool_connections=URL_POOL_SIZE, pool_maxsize=URL_POOL_SIZE
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         if ignore_check is None:
             # read file from source/verified_urls.yaml
             try:
                 with codecs.open(
                     "source/verified_urls.yaml", "r", encoding="utf-8"
                 ) as f:
-                    verified_urls = yaml.safe_load(f)
+                    verified_urls = safe_load(f)
                 self.ignore_check = verified_urls.get("urls", [])
             except FileNotFoundError:
                 Console.error(
@@ -369,11 +567,41 @@ class URLChecker:
                 self.ignore_check = []
         else:
             self.ignore_check = ignore_check
+        self._ignored_keys = {url_key(url) for url in self.ignore_check}
+        # entry name -> [(url, result)] of the last check_urls
+        self.results = OrderedDict()
 
     #############################################################################################
     # URL Checking
     #############################################################################################
 
+    def probe_url(self, url: str, timeout: int = 10) -> requests.Response:
+        """
+        Returns the response to a HEAD request for `url`, following redirects.
+
+        Some servers reject HEAD requests or answer them differently than GET requests.
+        If the HEAD request fails with a 4xx or 5xx status, the URL is requested with a
+        streamed GET instead. Its body is not read: the connection is closed after the
+        headers arrived.
+
+        With a cache, a URL checked before is requested conditionally, so an unchanged
+        resource is answered with 304, and the outcome is recorded in the cache.
+        """
+        headers = self.cache.validators(url) if self.cache is not None else {}
+        response = self.session.head(
+            url, timeout=timeout, allow_redirects=True, headers=headers
+        )
+        response.close()
+        if response.status_code >= 400:
+            response = self.session.get(url, timeout=timeout, stream=True, headers=headers)
+            response.close()
+        if self.cache is not None:
+            if response.status_code < 400:
+                self.cache.remember(url, response)
+            else:
+                self.cache.forget(url)
+        return response
+
     def is_url_valid(
         self, url: str, timeout: int = 10
     ) -> (bool, str, int | None):  # Modified to return (bool, explanation, status_code)
@@ -382,66 +610,57 @@ class URLChecker:
         Returns a tuple: (True if valid, False otherwise), an explanation string, and the HTTP status code (or None if no HTTP error).
         """
         try:
-            if url in self.ignore_check:
+            if url in self.ignore_check or url_key(url) in self._ignored_keys:
                 Console.warning(
                     f"URL '{url}' is in the ignore list, skipping further checks."
                 )
-                return True, "URL is in the ignore list", None  
+                return True, "URL is in the ignore list", None
             if url is None or url == "":
                 error_msg = "URL is empty or None."
                 Console.error(error_msg)
                 return False, error_msg, None
 
-            headers = {"User-Agent": "Mozilla/5.0"}
-            response = requests.get(url, timeout=timeout, headers=headers)
-            status_code = response.status_code
-
-            response.raise_for_status()
-
-            Console.msg(f"URL '{url}' is valid with status code {status_code}.")
-
-            if status_code == 403:
-                if url in self.ignore_check:
-                    Console.warning(
-                        f"URL '{url}' is in the ignore list, skipping further checks."
+            cached = self.cache.fresh(url) if self.cache is not None else None
+            if cached is not None:
+                if cached.get("method") == "browser":
+                    Console.msg(f"URL '{url}' is valid in Chrome (cached).")
+                else:
+                    Console.msg(
+                        f"URL '{url}' is valid with status code {cached['status_code']} (cached)."
                     )
-                    return True, "URL is in the ignore list", status_code
+                return True, "Valid URL (cached)", cached["status_code"]
 
-            if status_code == 403:
-                error_msg = f"Access to '{url}' via requests is forbidden (HTTP 403). Trying Chrome"
+            response = self.probe_url(url, timeout=timeout)
+            status_code = response.status_code
 
-                # Create an instance of the SeleniumFetcher
+            if status_code == 403 and self.browsers is not None:
+                Console.warning(
+                    f"Access to '{url}' via requests is forbidden (HTTP 403). Trying Chrome"
+                )
                 try:
-                    fetcher = SeleniumFetcher(
-                        headless=True
-                    )  # Set to False to see the browser
-
-                    print(f"Attempting to fetch HTML from: {url}")
-                    # Fetch HTML content
-                    html_content = fetcher.fetch_page_html(url, wait_time=15)
-                    if html_content:
-
-                        print(f"Converting fetched HTML to Markdown and printing...")
-                        markdown_content = fetcher._convert_html_to_markdown(
-                            html_content
-                        )
-                        print("\nPage content converted to Markdown!")
-                        print("--- Full Markdown Content (first 1000 chars) ---")
-                        print(
-                            markdown_content[:1000]
-                        )  # Print first 1000 chars of Markdown for brevity in example
-                        print("-----------------------------")
-                        print("Markdown content fetched and printed.")
-                    else:
-                        error_msg = (
-                            f"Failed to fetch HTML content from '{url}' via Selenium."
-                        )
-                        Console.error(error_msg)
-                        return False, error_msg, status_code
+                    with self.browsers.fetcher() as fetcher:
+                        html_content = fetcher.fetch_page_html(url, wait_time=15)
+                        if html_content and self.verbose:
+                            markdown_content = fetcher._convert_html_to_markdown(html_content)
+                            print("--- Markdown Content (first 1000 chars) ---")
+                            print(markdown_content[:1000])
+                            print("-----------------------------")
                 except Exception as e:
                     error_msg = f"Failed to access '{url}' via Selenium: {e}"
                     Console.error(error_msg)
                     return False, error_msg, status_code
+                if not html_content:
+                    error_msg = f"Failed to fetch HTML content from '{url}' via Selenium."
+                    Console.error(error_msg)
+                    return False, error_msg, status_code
+                Console.msg(f"URL '{url}' is valid in Chrome.")
+                if self.cache is not None:
+                    self.cache.remember_browser(url, status_code)
+                return True, "Valid URL", status_code
+
+            response.raise_for_status()
+
+            Console.msg(f"URL '{url}' is valid with status code {status_code}.")
 
             return True, "Valid URL", status_code
 
@@ -494,15 +713,87 @@ class URLChecker:
             Console.error(error_msg)
             return False, error_msg, None
 
-    def check_urls(self, printing_status: bool = True) -> bool:
+    def close_browsers(self) -> None:
+        """
+        Closes the browsers started for URLs answered with HTTP 403.
+        """
+        if self.browsers is not None:
+            self.browsers.close()
+
+    def check_urls_concurrently(
+        self, urls: list, workers: int = 8, per_host: int = 2
+    ) -> dict:
+        """
+        Checks `urls` with is_url_valid in a pool of `workers` threads, with at most
+        `per_host` requests to the same host at a time.
+
+        The output of every check is buffered, so that the caller can print it in order.
+
+        Parameters:
+            urls (list): URLs to check, each once
+            workers (int): number of threads
+            per_host (int): number of concurrent checks per host
+        Returns:
+            dict: url -> (is_valid, explanation, status_code, output)
+        """
+        if workers > URL_POOL_SIZE:
+            adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        host_limits = {}
+        lock = threading.Lock()
+
+        def check(url, output):
+            host = _url_host(url)
+            with lock:
+                limit = host_limits.setdefault(host, threading.Semaphore(per_host))
+            with limit:
+                output.start()
+                try:
+                    result = self.is_url_valid(url)
+                finally:
+                    log = output.stop()
+            return (*result, log)
+
+        # Interleave the hosts so that the threads rarely wait for the same host
+        by_host = OrderedDict()
+        for url in urls:
+            by_host.setdefault(_url_host(url), []).append(url)
+        queues = list(by_host.values())
+        order = []
+        for i in range(max(map(len, queues), default=0)):
+            order.extend(queue[i] for queue in queues if i < len(queue))
+
+        with _buffered_stdout() as output:
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+                futures = {url: pool.submit(check, url, output) for url in order}
+                return {url: futures[url].result() for url in urls}
+
+    def check_urls(
+        self, printing_status: bool = True, workers: int = 1, per_host: int = 2
+    ) -> bool:
         """
         Returns whether all the URLs in the manager's YAML files are valid.
 
         Any field without subfields that ends with "url" is checked.
         The "cite" field's URL is also checked.
 
+        Equivalent URLs, e.g. with and without "www." or a trailing slash, or a DOI on
+        doi.org and dx.doi.org, are checked once (see url_key). The result of every
+        reference is kept in `self.results` by entry name, and the summary names all
+        entries that reference an invalid URL.
+
+        With more than one worker the URLs are checked concurrently first, see
+        check_urls_concurrently. The messages and the summary are then printed in the
+        same order as in a sequential check.
+
+        URLs answered with HTTP 403 are retried in the headless browsers of `self.browsers`,
+        which are started on the first such URL and closed when the check ends.
+
         Parameters:
             printing_status (bool): whether to print statuses
+            workers (int): number of URLs checked at the same time
+            per_host (int): number of URLs of the same host checked at the same time
         Returns:
             bool: True if all URLs are valid, False otherwise
         """
@@ -530,81 +821,101 @@ class URLChecker:
 
         # Collect URLs from the entries to be checked
 
-        for entry in self.entries:  # Use the flat property directly
-            name = entry.get("name")
+        for entry in self.entries:
+            name = entry.name
             if name not in urls_by_name:
                 urls_by_name[name] = []
             banner(f"Checking URLs for entry: '{name}'")
-            for key, value in entry.items():
-                # Handle flat keys with 'url'
-                if key.lower().endswith("url"):
-                    if isinstance(value, str) and value != "":
-                        urls_by_name[name].append(
-                            value
-                        )  # Store the URL under the entry name
-                # Handle BibTeX citation strings which might be directly in a 'cite' key,
-                # or if 'cite' key can contain a list of strings, each being a bibtex entry.
-                # Assuming 'cite' itself is a key in the flattened dict.
-                elif key == "cite":
-                    if isinstance(
-                        value, str
-                    ):  # 'cite' field itself is a string with BibTeX
-                        urls_by_name[name].extend(
-                            re.findall(r"url\s*=\s*\{(.*?)\}", value)
-                        )
-                    elif isinstance(
-                        value, list
-                    ):  # 'cite' field is a list of BibTeX strings
-                        for bib_string in value:
-                            if isinstance(bib_string, str):
-                                urls_by_name[name].extend(
-                                    re.findall(r"url\s*=\s*\{(.*?)\}", bib_string)
-                                )
+            # fields ending in 'url' and url fields of the BibTeX citations, in field order
+            urls_by_name[name].extend(entry.urls)
 
         # pprint(urls_by_name)  # Debug print to see collected URLs
 
+        # Equivalent URLs (see url_key) are checked once, as written at their first occurrence,
+        # and the result applies to every entry that references them
+        unique_urls = OrderedDict()
+        referenced_by = {}
         for name, urls in urls_by_name.items():
-            print()
-            banner(f"Checking URLs for entry '{name}'...")
+            for url in urls:
+                key = url_key(url)
+                unique_urls.setdefault(key, url)
+                names = referenced_by.setdefault(key, [])
+                if name not in names:
+                    names.append(name)
+        unique_urls = list(unique_urls.values())
+        Console.info(
+            f"{sum(map(len, urls_by_name.values()))} URL references, {len(unique_urls)} distinct URLs"
+        )
 
-            if not urls:
-                if printing_status:
-                    msg = f"No URLs found for entry '{name}'"
-                    Console.warning(msg)
-                    error(name, None, msg)
-                continue
+        try:
+            prechecked = {}
+            if workers > 1:
+                Console.info(
+                    f"Checking {len(unique_urls)} URLs with {workers} workers, at most {per_host} per host ..."
+                )
+                prechecked = self.check_urls_concurrently(
+                    unique_urls, workers=workers, per_host=per_host
+                )
 
-            for url in urls:
-                Console.msg(f"  Checking URL: '{url}'")
-                # Check if the URL has already been checked
-                if url in checked_urls:
-                    if checked_urls[url]["is_valid"]:
-                        Console.warning(
-                            f"URL '{url}' duplicated, already checked and is valid."
-                        )
+            for name, urls in urls_by_name.items():
+                print()
+                banner(f"Checking URLs for entry '{name}'...")
+
+                if not urls:
+                    if printing_status:
+                        msg = f"No URLs found for entry '{name}'"
+                        Console.warning(msg)
+                        error(name, None, msg)
+                    continue
+
+                for url in urls:
+                    Console.msg(f"  Checking URL: '{url}'")
+                    key = url_key(url)
+                    # Check if the URL or an equivalent one has already been checked
+                    if key in checked_urls:
+                        checked = checked_urls[key]
+                        same = "" if checked["url"] == url else f" as '{checked['url']}'"
+                        if checked["is_valid"]:
+                            Console.warning(
+                                f"URL '{url}' duplicated, already checked{same} and is valid."
+                            )
+                        else:
+                            Console.warning(
+                                f"URL '{url}' duplicated, already checked{same} and found to be invalid: {checked['explanation']}"
+                            )
+                        continue  # Skip re-checking if already processed
+
+                    if url in prechecked:
+                        is_valid, explanation, status_code, log = prechecked[url]
+                        sys.stdout.write(log)
                     else:
-                        Console.warning(
-                            f"URL '{url}' duplicated, already checked and found to be invalid: {checked_urls[url]['explanation']}"
-                        )
-                    continue  # Skip re-checking if already processed
-
-                is_valid, explanation, status_code = self.is_url_valid(
-                    url
-                )  # Capture status_code
-                checked_urls[url] = {
-                    "is_valid": is_valid,
-                    "explanation": explanation,
-                    "status_code": status_code,
-                }  # Store status_code
-
-                if is_valid:
-                    valid.append(url)
-                else:
-                    msg = f"Invalid URL: '{url}' for entry '{name}' - {explanation}"  # Include explanation here
-                    Console.error(msg)
-                    error(
-                        name, url, explanation, status_code
-                    )  # Pass the status_code to the error function
+                        is_valid, explanation, status_code = self.is_url_valid(
+                            url
+                        )  # Capture status_code
+                    checked_urls[key] = {
+                        "url": url,
+                        "is_valid": is_valid,
+                        "explanation": explanation,
+                        "status_code": status_code,
+                    }  # Store status_code
+
+                    if is_valid:
+                        valid.append(url)
+                    else:
+                        msg = f"Invalid URL: '{url}' for entry '{name}' - {explanation}"  # Include explanation here
+                        Console.error(msg)
+                        error(
+                            name, url, explanation, status_code
+                        )  # Pass the status_code to the error function
+                        issues[-1]["names"] = referenced_by[key]
+        finally:
+            self.close_browsers()
+
+        # The result of every URL reference, by entry
+        self.results = OrderedDict(
+            (name, [(url, checked_urls[url_key(url)]) for url in urls])
+            for name, urls in urls_by_name.items()
+        )
 
         print()
         banner("Summary of URL check errors")
@@ -628,8 +939,13 @@ class URLChecker:
                         "message"
                     ]  # For non-HTTP errors, use the stored message
 
+                names = issue.get("names", [issue["name"]])
+                if len(names) == 1:
+                    subject = f"Entry '{names[0]}' has"
+                else:
+                    subject = "Entries " + ", ".join(f"'{n}'" for n in names) + " have"
                 Console.error(
-                    f"Entry '{issue['name']}' has an issue with URL '{issue['url']}'"
+                    f"{subject} an issue with URL '{issue['url']}'"
                     f"{' (Status: ' + str(issue['status_code']) + ')' if issue['status_code'] else ''}: {error_detail}"
                 )
             print()
@@ -0,0 +1,132 @@
+"""
+Persistent on-disk cache for parsed benchmark YAML files.
+
+Each source file gets one pickle file in the cache directory (default `.cache/yaml`)
+that stores the parsed entries together with the path, size, mtime and SHA-256 of
+the file they were parsed from. A lookup is a hit if size and mtime are unchanged,
+or, if only the mtime changed (e.g. after a git checkout), if the content hash is
+still the same. Anything else is a miss and the caller re-parses the file.
+
+Example:
+
+    cache = YamlParseCache(".cache/yaml")
+    entries, key = cache.lookup("source/benchmark-dune.yaml")
+    if entries is None:
+        entries = parse_yaml_file("source/benchmark-dune.yaml")
+        cache.store(key, entries)
+"""
+
+import hashlib
+import os
+import pickle
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = ".cache/yaml"
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Returns the SHA-256 hex digest of the contents of `file_path`.
+    """
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class YamlParseCache(object):
+    """
+    Stores the parsed entries of YAML files keyed by path, size, mtime and content hash.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """
+        Creates a cache that keeps its files in `cache_dir`.
+
+        Parameters:
+            cache_dir (str): directory for the cache files, created on first store
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_file(self, path: str) -> str:
+        name = hashlib.sha1(path.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.pickle")
+
+    def _read(self, cache_file: str) -> dict | None:
+        try:
+            with open(cache_file, "rb") as f:
+                record = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if not isinstance(record, dict) or record.get("version") != CACHE_VERSION:
+            return None
+        return record
+
+    def _write(self, record: dict) -> None:
+        cache_file = self._cache_file(record["path"])
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so concurrent builds never read a partial pickle
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+
+    def lookup(self, file_path: str) -> tuple[list[dict] | None, dict]:
+        """
+        Returns the cached entries of `file_path`, or None if the file changed since it was cached.
+
+        Parameters:
+            file_path (str): YAML file to look up
+        Returns:
+            (entries or None, key) where key must be passed to `store` after a miss
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        key = {
+            "version": CACHE_VERSION,
+            "path": path,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": None,
+        }
+        record = self._read(self._cache_file(path))
+        if record is None or record["path"] != path or record["size"] != key["size"]:
+            self.misses += 1
+            return None, key
+
+        if record["mtime_ns"] == key["mtime_ns"]:
+            self.hits += 1
+            return record["entries"], key
+
+        # Same size but touched: only the content hash can tell
+        key["sha256"] = file_digest(path)
+        if record["sha256"] == key["sha256"]:
+            record["mtime_ns"] = key["mtime_ns"]
+            self._write(record)
+            self.hits += 1
+            return record["entries"], key
+
+        self.misses += 1
+        return None, key
+
+    def store(self, key: dict, entries: list[dict]) -> None:
+        """
+        Stores the parsed `entries` under the `key` returned by `lookup`.
+
+        Parameters:
+            key (dict): key returned by `lookup` for the file
+            entries (list[dict]): parsed entries of the file
+        """
+        record = dict(key)
+        if record["sha256"] is None:
+            record["sha256"] = file_digest(record["path"])
+        record["entries"] = entries
+        self._write(record)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the fraction of lookups that were served from the cache.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -0,0 +1,179 @@
+"""
+Lazy loading of benchmark YAML files for metadata-only tools.
+
+`scan_yaml_headers` reads a benchmark file as text and parses only the few
+top-level fields listed in HEADER_FIELDS (name, date, domain), skipping the
+large BibTeX `cite` blocks and rating reasons. `LazyEntry` wraps such a header
+and parses the full file only when a field outside the header is accessed.
+
+Example:
+
+    manager = YamlManager(files, lazy=True)
+    for entry in manager:
+        print(entry["id"], entry.get("date"), entry["name"])  # no full parse
+
+    manager[0]["cite"]  # parses the file of the first entry
+"""
+
+import re
+from collections.abc import MutableMapping
+
+from yaml_loader import safe_load
+
+HEADER_FIELDS = ("name", "date", "domain")
+
+# A top-level field of a list item: two spaces of indentation, then the key
+_TOP_LEVEL_KEY = re.compile(r"^  ([A-Za-z_][\w\-]*):")
+
+
+def scan_yaml_headers(text: str, fields=HEADER_FIELDS) -> list[dict] | None:
+    """
+    Returns the header `fields` of every entry in the benchmark YAML `text`.
+
+    Only the lines belonging to the requested top-level fields are parsed.
+    The text must use the layout of the files in source/: a list whose items
+    start with "- " in the first column and whose fields are indented by two
+    spaces. For any other layout None is returned and the caller must parse
+    the whole file.
+
+    Parameters:
+        text (str): contents of a benchmark YAML file
+        fields (tuple[str]): top-level fields to extract
+    Returns:
+        list[dict] or None: one header dict per entry, in file order
+    """
+    chunks: list[list[str]] = []
+    for line in text.splitlines():
+        if line.startswith("- "):
+            chunks.append(["  " + line[2:]])
+        elif chunks:
+            chunks[-1].append(line)
+        elif line.strip() and not line.lstrip().startswith("#"):
+            return None  # content before the first list item
+
+    headers = []
+    for chunk in chunks:
+        selected: list[str] = []
+        keep = False
+        for line in chunk:
+            match = _TOP_LEVEL_KEY.match(line)
+            if match:
+                keep = match.group(1) in fields
+            if keep:
+                selected.append(line[2:])
+        try:
+            header = safe_load("\n".join(selected)) if selected else {}
+        except Exception:
+            return None
+        if header is None:
+            header = {}
+        if not isinstance(header, dict):
+            return None
+        headers.append(header)
+    return headers
+
+
+class LazyYamlFile(object):
+    """
+    Parses a YAML file on first request and hands out its entries by position.
+    """
+
+    __slots__ = ("path", "parse", "_entries")
+
+    def __init__(self, path: str, parse):
+        """
+        Parameters:
+            path (str): YAML file
+            parse (callable): function taking the path and returning the list of entries
+        """
+        self.path = path
+        self.parse = parse
+        self._entries = None
+
+    def entry(self, position: int) -> dict:
+        """
+        Returns the fully parsed entry at `position` in the file.
+        """
+        if self._entries is None:
+            self._entries = self.parse(self.path)
+        return self._entries[position]
+
+
+class LazyEntry(MutableMapping):
+    """
+    Benchmark entry that only knows its header fields until another field is accessed.
+
+    Reading or setting a header field (and "id") does not parse the file.
+    Any other access, iteration, or len() parses the full entry once; afterwards
+    the entry behaves like the plain dict returned by the YAML loader.
+    """
+
+    __slots__ = ("_header", "_fields", "_file", "_position", "_full")
+
+    def __init__(self, header: dict, fields, file: LazyYamlFile, position: int):
+        """
+        Parameters:
+            header (dict): header fields of the entry, as returned by scan_yaml_headers
+            fields (tuple[str]): fields that were scanned; a missing one is known to be absent
+            file (LazyYamlFile): file the entry belongs to
+            position (int): position of the entry in the file
+        """
+        self._header = dict(header)
+        self._fields = set(fields)
+        self._file = file
+        self._position = position
+        self._full = None
+
+    @property
+    def materialized(self) -> bool:
+        """
+        Returns True once the full entry was parsed.
+        """
+        return self._full is not None
+
+    def _materialize(self) -> dict:
+        if self._full is None:
+            full = dict(self._file.entry(self._position))
+            # Values set on the header (e.g. the id) win over the file contents
+            full.update(self._header)
+            self._full = full
+        return self._full
+
+    def __getitem__(self, key):
+        if self._full is None and key in self._fields:
+            return self._header[key]
+        return self._materialize()[key]
+
+    def __contains__(self, key):
+        if self._full is None and key in self._fields:
+            return key in self._header
+        return key in self._materialize()
+
+    def __setitem__(self, key, value):
+        if key in self._fields:
+            self._header[key] = value
+            if self._full is None:
+                return
+        self._materialize()[key] = value
+
+    def __delitem__(self, key):
+        full = self._materialize()
+        self._header.pop(key, None)
+        del full[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __len__(self):
+        return len(self._materialize())
+
+    def __repr__(self):
+        if self._full is None:
+            return f"LazyEntry({self._header!r}, materialized=False)"
+        return f"LazyEntry({self._full!r})"
+
+    def to_dict(self) -> dict:
+        """
+        Returns the full entry as a plain dict.
+        """
+        return dict(self._materialize())
@@ -0,0 +1,36 @@
+"""
+Shared YAML loading for the scripts in bin/.
+
+Uses the libyaml based `yaml.CSafeLoader` when PyYAML was built with libyaml and
+falls back to the pure Python `yaml.SafeLoader` otherwise. Both loaders use the
+same safe constructor, so the parsed data is identical; the C loader is simply
+much faster.
+
+Example:
+
+    from yaml_loader import safe_load
+
+    with open("source/benchmark-dune.yaml", "r", encoding="utf-8") as f:
+        entries = safe_load(f)
+"""
+
+import yaml
+
+try:
+    SafeLoader = yaml.CSafeLoader
+    LIBYAML = True
+except AttributeError:  # PyYAML was built without libyaml
+    SafeLoader = yaml.SafeLoader
+    LIBYAML = False
+
+
+def safe_load(stream):
+    """
+    Parses the first YAML document in `stream` with the fastest available safe loader.
+
+    Parameters:
+        stream (str or file): YAML text or an open file
+    Returns:
+        the parsed Python object
+    """
+    return yaml.load(stream, Loader=SafeLoader)
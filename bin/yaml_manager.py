@@ -23,6 +23,7 @@ flat = manager.get_flat_dicts())
 
 import yaml
 import json
+import os
 import re
 import sys
 import requests
@@ -40,9 +41,15 @@ from requests.exceptions import (
     SSLError,
 )
 from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 import codecs
 
+from citation_cache import get_citation
 from field_format_manager import FieldFormatManager
+from yaml_loader import safe_load
+from yaml_cache import YamlParseCache, file_digest
+from yaml_lazy import HEADER_FIELDS, LazyEntry, LazyYamlFile, scan_yaml_headers
 from cloudmesh.common.util import banner
 
 
@@ -186,6 +193,70 @@ if __name__ == "__main__":
     unicode_alternatives("example_ascii_only.txt")
 
 
+def parse_yaml_file(file_path: str) -> list[dict]:
+    """
+    Parses a benchmark YAML file and returns its list of entries.
+
+    Unlike `YamlManager.load_single_yaml_file` this function never prints or exits,
+    so it can run inside a worker process. Errors are raised to the caller.
+
+    Parameters:
+        file_path (str): filepath to load from
+    Returns:
+        list of benchmark entries for the YAML file
+    Raises:
+        FileNotFoundError: if the file does not exist
+        yaml.YAMLError: if the file contains a YAML syntax error
+        ValueError: if the top level of the file is not a list
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = safe_load(f)
+
+    if content is None:  # Handle empty YAML files
+        return []
+    if isinstance(content, list):
+        return content
+    if isinstance(content, dict):
+        raise ValueError(
+            f'YAML file "{file_path}" is a dictionary, expected a list of entries.'
+        )
+    raise ValueError("Unsupported YAML format. Expected a dict or list of dicts.")
+
+
+def _parse_yaml_file_in_worker(file_path: str) -> tuple[str, list[dict], str | None]:
+    """
+    Process pool wrapper around `parse_yaml_file`.
+
+    Returns a tuple (file_path, entries, error). On failure the entries are empty
+    and error holds a printable message, so a single bad file does not abort the pool.
+    """
+    try:
+        return file_path, parse_yaml_file(file_path), None
+    except FileNotFoundError:
+        return file_path, [], f"File not found: '{file_path}'"
+    except yaml.YAMLError as e:
+        return file_path, [], f'YAML syntax error in "{file_path}": \n{e}'
+    except ValueError as e:
+        return file_path, [], str(e)
+
+
+SNAPSHOT_VERSION = 1
+
+
+def _index_key(value):
+    """
+    Returns a hashable stand-in for `value` that is equal for equal values.
+
+    Lists and dicts from the YAML files are not hashable, so they are converted
+    to tagged tuples and frozensets for use as index keys.
+    """
+    if isinstance(value, list):
+        return ("list", tuple(_index_key(v) for v in value))
+    if isinstance(value, dict):
+        return ("dict", frozenset((k, _index_key(v)) for k, v in value.items()))
+    return value
+
+
 def clean_string(s):
     # Replace spaces with underscores
     s = s.replace(" ", "_")
@@ -194,6 +265,187 @@ def clean_string(s):
     return str(s)
 
 
+def flatten_entry(entry, parent_key="", result=None) -> dict:
+    """
+    Turns `entry` into a single dictionary easily convertable into a table row.
+
+    Values associated with "description" and "condition" are ignored.
+
+    The output varies by `entry`'s datatype:
+    - anything but a `dict` or a `list`: the value of entry is stored under its key.
+    - `dict`: this procedure is applied to all sub-dictionaries. The parent dictionary's key is prepended to all sub-dictionary keys.
+    - `list`: this procedure is applied to all elements of the list
+
+    Parameters:
+        entry (Any): current entry to add to the output
+        parent_key (str): name of parent dictionary's key, used in recursive calls
+        result (dict or None): dictionary to add the flattened fields to, used in recursive calls
+    Returns:
+        dictionary version of `entry`
+    """
+    if result is None:
+        result = {}
+    for key, value in entry.items():
+        if key in ["description", "condition"]:
+            continue
+        new_key = f"{parent_key}.{key}" if parent_key else key
+
+        # dict: use same procedure
+        if isinstance(value, dict):
+            flatten_entry(value, parent_key=new_key, result=result)
+
+        # list: use procedure on each index, if it's a dict. Otherwise, add key/value pair
+        elif isinstance(value, list):
+            for v in value:
+                if isinstance(v, dict):
+                    flatten_entry(v, parent_key=new_key, result=result)
+                else:
+                    # A list of non-dict items is stored once as a whole under new_key
+                    result[new_key] = value
+                    break
+
+        # anything else: add key/value pair as is
+        else:
+            result[new_key] = value
+    return result
+
+
+class BenchmarkRecord(Mapping):
+    """
+    Typed, read-only view of one benchmark shared by the writers.
+
+    The record is a mapping over the flat row (dot-separated keys), so code written
+    against flat dicts keeps working. In addition the fields the writers need are
+    parsed once when the record is built:
+
+    - ratings: category -> {aspect: value}, e.g. ratings["software"]["rating"]
+    - rating_values: category -> float rating (0.0 if not a number), for radar charts
+    - average_rating: mean of the numeric ratings, or None if there are none
+    - citations: list of BibTeX strings, citation_labels: their labels
+    - urls: all URLs of the entry (fields ending in "url" and BibTeX url fields) in field order
+
+    Records are built by `YamlManager.get_records` or `to_record`. A record references the
+    flat row and the raw entry it is built from, such as the memoized rows and loaded entries
+    of a YamlManager, and does not copy them; the parsed fields are stored in addition.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "raw",
+        "flat",
+        "ratings",
+        "rating_values",
+        "average_rating",
+        "citations",
+        "citation_labels",
+        "urls",
+    )
+
+    def __init__(self, flat: dict, raw: dict | None = None):
+        """
+        Parameters:
+            flat (dict): flat row of the entry, see `flatten_entry`
+            raw (dict or None): raw entry as loaded from YAML, if available
+        """
+        self.flat = flat
+        self.raw = raw
+        self.id = flat.get("id")
+        self.name = flat.get("name")
+
+        self.ratings = {}
+        self.rating_values = {}
+        self.citations = []
+        self.urls = []
+        numbers = []
+        for key, value in flat.items():
+            if key.startswith("ratings."):
+                parts = key.split(".")
+                if len(parts) == 3:
+                    _, category, aspect = parts
+                    self.ratings.setdefault(category, {})[aspect] = value
+                    if aspect == "rating":
+                        try:
+                            self.rating_values[category] = float(value)
+                        except (TypeError, ValueError):
+                            self.rating_values[category] = 0.0
+                        if value not in [None, "", "N/A"]:
+                            try:
+                                numbers.append(float(value))
+                            except (TypeError, ValueError):
+                                pass
+
+            if key.lower().endswith("url"):
+                if isinstance(value, str) and value != "":
+                    self.urls.append(value)
+            elif key == "cite":
+                if isinstance(value, str):
+                    self.citations = [value]
+                elif isinstance(value, list):
+                    self.citations = value
+                for bib_string in self.citations:
+                    if isinstance(bib_string, str):
+                        self.urls.extend(get_citation(bib_string).urls)
+
+        self.average_rating = sum(numbers) / len(numbers) if numbers else None
+        self.citation_labels = [
+            get_citation(c).label
+            for c in self.citations
+            if isinstance(c, str) and c.strip().startswith("@")
+        ]
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> "BenchmarkRecord":
+        """
+        Builds a record from a raw entry as loaded from YAML.
+        """
+        return cls(flatten_entry(raw), raw=raw)
+
+    # Mapping interface over the flat row
+
+    def __getitem__(self, key):
+        return self.flat[key]
+
+    def __iter__(self):
+        return iter(self.flat)
+
+    def __len__(self):
+        return len(self.flat)
+
+    def __contains__(self, key):
+        return key in self.flat
+
+    def __repr__(self):
+        return f"BenchmarkRecord(id={self.id!r}, name={self.name!r})"
+
+    def get(self, key, default=None):
+        return self.flat.get(key, default)
+
+    def keys(self):
+        return self.flat.keys()
+
+    def items(self):
+        return self.flat.items()
+
+    def values(self):
+        return self.flat.values()
+
+
+def to_record(entry, flat: bool = True) -> BenchmarkRecord:
+    """
+    Returns `entry` as a BenchmarkRecord.
+
+    Parameters:
+        entry (BenchmarkRecord or dict): a record, a flat row, or a raw entry
+        flat (bool, default=True): whether a dict `entry` is a flat row (True) or a raw entry (False)
+    Returns:
+        BenchmarkRecord: `entry` itself if it already is a record
+    """
+    if isinstance(entry, BenchmarkRecord):
+        return entry
+    return BenchmarkRecord(entry) if flat else BenchmarkRecord.from_raw(entry)
+
+
 class YamlManager(object):
     """
     Loads, stores, and formats the contents of YAML files.
@@ -210,6 +462,10 @@ class YamlManager(object):
         ) = None,  # Made yamls optional for direct instantiation
         overwriting_contents: bool = True,
         printing_syntax_errors: bool = True,
+        parallel: bool = False,
+        workers: int | None = None,
+        cache_dir: str | None = None,
+        lazy: bool = False,
     ):
         """
         Creates a new YamlManager in charge of the contents of `yamls`.
@@ -218,11 +474,29 @@ class YamlManager(object):
             yamls (str or list[str] or None): one or more YAML filepaths to load from. If None, initializes empty.
             overwriting_contents (bool, default=True): True if overwriting existing contents, False if appending to existing contents
             printing_syntax_errors (bool, default=True): whether to print warnings to the console if a YAML syntax error is found
+            parallel (bool, default=False): parse the files in a process pool, see `load`
+            workers (int or None, default=None): number of worker processes. None uses all cores.
+            cache_dir (str or None, default=None): directory of the on-disk parse cache, see `load`
+            lazy (bool, default=False): only parse the header fields until others are accessed, see `load`
         """
         self._yaml_dicts: list[dict] = []  # Initialize internal storage directly
+        self.load_errors: list[tuple[str, str]] = []
+        self.parse_cache: YamlParseCache | None = None
+        self.sources: list[str] = []  # files the current contents were loaded from
+        self._flat_rows: list[dict | None] = []  # memoized flat row per entry, None if stale
+        self._records: dict[int, BenchmarkRecord] = {}  # record by id() of its flat row
+        self._index_by_id: dict[str, dict] = {}
+        self._index_by_name: dict = {}
+        self._attribute_indexes: dict[str, dict] = {}
         if yamls:  # Only load if yamls are provided at init
             self.load(
-                yamls, overwrite=overwriting_contents, verbose=printing_syntax_errors
+                yamls,
+                overwrite=overwriting_contents,
+                verbose=printing_syntax_errors,
+                parallel=parallel,
+                workers=workers,
+                cache_dir=cache_dir,
+                lazy=lazy,
             )
 
     # Add this __iter__ method
@@ -282,7 +556,7 @@ class YamlManager(object):
         """
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = yaml.safe_load(f)
+                content = safe_load(f)
 
             if content is None:  # Handle empty YAML files
                 return []
@@ -314,20 +588,153 @@ class YamlManager(object):
                 Console.error(f'YAML syntax error in "{file_path}": \n{e}')
             return []
 
+    def _load_parallel(
+        self, paths_to_load: list[str], verbose: bool, workers: int | None
+    ) -> list[list[dict] | None]:
+        """
+        Parses `paths_to_load` in a process pool and returns the entries of each path, in order.
+
+        Errors are collected in `self.load_errors` as (path, message) tuples instead of exiting,
+        and the failing file's result is None.
+
+        Parameters:
+            paths_to_load (list[str]): File paths to load from.
+            verbose (bool): Whether to print the collected error messages.
+            workers (int or None): Number of worker processes. None uses all cores.
+        Returns:
+            list: for each path, its list of entries or None if it failed to load
+        """
+        results = []
+        max_workers = min(workers or os.cpu_count() or 1, len(paths_to_load)) or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map yields results in submission order, which keeps the --files order
+            for path, entries, error in executor.map(
+                _parse_yaml_file_in_worker, paths_to_load
+            ):
+                if error is not None:
+                    self.load_errors.append((path, error))
+                    if verbose:
+                        Console.error(error)
+                    results.append(None)
+                    continue
+                results.append(entries)
+        return results
+
+    def _load_serial(
+        self, paths_to_load: list[str], verbose: bool
+    ) -> list[list[dict] | None]:
+        """
+        Parses `paths_to_load` one after the other.
+
+        Errors are handled as in `_load_parallel`: they are collected in `self.load_errors`
+        as (path, message) tuples and the failing file's result is None.
+
+        Parameters:
+            paths_to_load (list[str]): File paths to load from.
+            verbose (bool): Whether to print the collected error messages.
+        Returns:
+            list: for each path, its list of entries or None if it failed to load
+        """
+        results = []
+        for path in paths_to_load:
+            _, entries, error = _parse_yaml_file_in_worker(path)
+            if error is not None:
+                self.load_errors.append((path, error))
+                if verbose:
+                    Console.error(error)
+                results.append(None)
+                continue
+            results.append(entries)
+        return results
+
+    def _load_lazy(
+        self, paths_to_load: list[str], cache_keys: list[dict | None], verbose: bool
+    ) -> list[list[dict] | None]:
+        """
+        Scans the header fields of `paths_to_load` and returns `LazyEntry` objects for them.
+
+        A file is fully parsed the first time a field outside HEADER_FIELDS is accessed on one of
+        its entries; the result is then stored in the parse cache if a cache key is given.
+        Files that do not follow the layout of the benchmark files are parsed right away.
+
+        Parameters:
+            paths_to_load (list[str]): File paths to load from.
+            cache_keys (list[dict or None]): parse cache key of each path, or None
+            verbose (bool): Whether to print error messages.
+        Returns:
+            list: for each path, its list of entries or None if it failed to load
+        """
+        fields = HEADER_FIELDS + ("id",)
+        results = []
+        for path, cache_key in zip(paths_to_load, cache_keys):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    headers = scan_yaml_headers(f.read())
+            except OSError as e:
+                error = f"Error loading '{path}': {e}"
+                self.load_errors.append((path, error))
+                if verbose:
+                    Console.error(error)
+                results.append(None)
+                continue
+
+            if headers is None:
+                results.extend(self._load_serial([path], verbose))
+                continue
+
+            def parse(file_path, cache_key=cache_key):
+                entries = parse_yaml_file(file_path)
+                if cache_key is not None and entries:
+                    self.parse_cache.store(cache_key, entries)
+                return entries
+
+            lazy_file = LazyYamlFile(path, parse)
+            results.append(
+                [
+                    LazyEntry(header, fields, lazy_file, position)
+                    for position, header in enumerate(headers)
+                ]
+            )
+        return results
+
     def load(
-        self, file_paths: str | list[str], overwrite: bool = True, verbose: bool = True
+        self,
+        file_paths: str | list[str],
+        overwrite: bool = True,
+        verbose: bool = True,
+        parallel: bool = False,
+        workers: int | None = None,
+        cache_dir: str | None = None,
+        lazy: bool = False,
     ) -> list[dict]:
         """
         Loads the contents of `file_paths` into this YamlManager.
 
         If `overwrite_existing` is True, any previous contents are overwritten upon load.
-        If a YAML file contains syntax errors, that file is skipped.
-        Raises a FileNotFoundError if any specified file does not exist.
+        A file that does not exist, contains YAML syntax errors, or is not a list of entries
+        is skipped, and the error is collected in `self.load_errors` as a (path, message)
+        tuple. The caller decides whether to stop; generate.py exits with status 1.
+
+        If `parallel` is True, the files are parsed in a process pool. The order of
+        `file_paths` and the handling of errors are the same as in a serial load.
+
+        If `cache_dir` is given, parsed files are kept in a `YamlParseCache` in that
+        directory and only files that changed since the last load are parsed again.
+
+        If `lazy` is True, files that are not in the parse cache are only scanned for the
+        fields in HEADER_FIELDS (name, date, domain) and the entries are `LazyEntry` objects
+        that parse their file when any other field is accessed. This keeps metadata-only
+        tools such as index pages and duplicate checks fast. YAML syntax errors outside the
+        header fields surface when the entry is accessed.
 
         Parameters:
             file_paths (str or list[str]): File path(s) to load from.
             overwrite (bool, default=True): Whether to overwrite the manager's existing contents.
             verbose (bool, default=True): Whether to print error messages for YAML syntax issues.
+            parallel (bool, default=False): Whether to parse the files in a process pool.
+            workers (int or None, default=None): Number of worker processes. None uses all cores.
+            cache_dir (str or None, default=None): Directory of the parse cache. None disables the cache.
+            lazy (bool, default=False): Whether to defer parsing everything but the header fields.
 
         Returns:
             list[dict]: The updated list of YAML dictionaries stored in the manager.
@@ -335,44 +742,108 @@ class YamlManager(object):
         # Normalize file_paths to always be a list
         paths_to_load = [file_paths] if isinstance(file_paths, str) else file_paths
 
+        self.load_errors = []
+        if cache_dir is not None:
+            self.parse_cache = YamlParseCache(cache_dir)
+
+        # Look up every file in the parse cache, only the misses are parsed below
+        results: list[list[dict] | None] = [None] * len(paths_to_load)
+        cache_keys = {}
+        pending = []
+        for i, path in enumerate(paths_to_load):
+            if cache_dir is not None and os.path.isfile(path):
+                entries, cache_keys[i] = self.parse_cache.lookup(path)
+                if entries is not None:
+                    results[i] = entries
+                    continue
+            pending.append(i)
+
+        pending_paths = [paths_to_load[i] for i in pending]
+        if lazy:
+            parsed = self._load_lazy(
+                pending_paths, [cache_keys.get(i) for i in pending], verbose
+            )
+        elif parallel and len(pending_paths) > 1:
+            parsed = self._load_parallel(pending_paths, verbose, workers)
+        else:
+            parsed = self._load_serial(pending_paths, verbose)
+
+        for i, entries in zip(pending, parsed):
+            results[i] = entries
+            # Empty results are not cached: they may come from a syntax error that must be reported again.
+            # Lazy entries store themselves in the cache once they are parsed.
+            if entries and i in cache_keys and not lazy:
+                self.parse_cache.store(cache_keys[i], entries)
+
         newly_loaded_records = []
-        for path in paths_to_load:
-            # Each file's content (which is guaranteed to be a list) is extended
-            # Catching specific errors from _load_single_yaml_file
-            try:
-                newly_loaded_records.extend(self.load_single_yaml_file(path, verbose))
-            except (FileNotFoundError, ValueError) as e:
-                # If sys.exit(1) is called in load_single_yaml_file, these exceptions
-                # might not be reached. But if sys.exit(1) were removed, this catch
-                # would be important for graceful handling.
-                if verbose:
-                    Console.error(f"Error loading '{path}': {e}")
-                # Depending on desired behavior, you might re-raise or just skip.
-                # Given current sys.exit(1) in load_single_yaml_file, this might be redundant
-                # if the program exits immediately. If sys.exit(1) is removed, then this
-                # 'continue' ensures the loop proceeds to next file after an error.
-                continue
+        for entries in results:
+            if entries:
+                newly_loaded_records.extend(entries)
 
+        # Only the flat rows of the new entries need to be computed
         if overwrite:
             self._yaml_dicts = newly_loaded_records
+            self._flat_rows = [None] * len(newly_loaded_records)
+            self.sources = list(paths_to_load)
         else:
             self._yaml_dicts.extend(newly_loaded_records)
+            self._flat_rows.extend([None] * len(newly_loaded_records))
+            self.sources.extend(paths_to_load)
 
         # BUG Fix: self.data is now a property, no need to assign to it.
         # The internal storage is _yaml_dicts.
         # self.data = self._yaml_dicts # This line is removed.
 
-        found = []
+        self._index_entries()
+
+        return self._yaml_dicts  # Or return self.data
+
+    # ---------------------------------------------------------------------------------------------------------
+    # Indexes
+    # ---------------------------------------------------------------------------------------------------------
+
+    def _index_entries(self) -> None:
+        """
+        Assigns the "id" of every entry, reports duplicate names, and rebuilds the lookup indexes.
+
+        The id and name indexes map to the first entry with that id or name.
+        Attribute indexes used by `get_entries` are built on demand and dropped here.
+        """
+        self._index_by_id = {}
+        self._index_by_name = {}
+        self._attribute_indexes = {}
         for entry in self._yaml_dicts:
             key = clean_string(entry.get("name", "unknown")).lower()
-            if key in found:
+            if key in self._index_by_id:
                 Console.error(
                     f"Duplicate entry name found: {key}. Please ensure all entries have unique names."
                 )
-            found.append(key)
+            else:
+                self._index_by_id[key] = entry
             entry["id"] = key
+            self._index_by_name.setdefault(_index_key(entry.get("name")), entry)
 
-        return self._yaml_dicts  # Or return self.data
+    def _attribute_index(self, attribute: str) -> dict:
+        """
+        Returns the index of all entries by the value of `attribute`, building it on first use.
+
+        Plain attributes are read from the raw entries. Dotted attributes such as
+        "ratings.software.rating" are read from the flat rows.
+
+        Parameters:
+            attribute (str): name of the attribute, optionally dot-separated
+        Returns:
+            dict: hashable attribute value -> list of entries with that value
+        """
+        index = self._attribute_indexes.get(attribute)
+        if index is None:
+            index = {}
+            rows = self.get_flat_dicts() if "." in attribute else self._yaml_dicts
+            for entry, row in zip(self._yaml_dicts, rows):
+                value = row.get(attribute)
+                index.setdefault(_index_key(value), []).append(entry)
+            self._attribute_indexes[attribute] = index
+        return index
 
     # ---------------------------------------------------------------------------------------------------------
     # Contents Presentation
@@ -392,53 +863,13 @@ class YamlManager(object):
         """
         return self.data
 
-    def _flatten_dict(self, entry, parent_key="") -> list[dict]:
+    def _flatten_dict(self, entry, parent_key="", result=None) -> dict:
         """
-        Turns `entry` into a list of dictionaries easily convertable into a table.
+        Turns `entry` into a single dictionary easily convertable into a table row.
 
-        Values associated with "description" and "condition" are ignored.
-
-        The output varies by `entry`'s datatype:
-        - anything but a `dict` or a `list`: string value of entry is appended to the output as a dictionary.
-        - `dict`: this procedure is applied to all sub-dictionaries. The parent dictionary's key is appended to all sub-dictionary keys.
-        - `list`: this procedure is applied to all elements of the list
-
-        Parameters:
-            entry (Any): current entry to add to the output
-            parent_key (str): name of parent dictionary's key, used in recursive calls
-        Returns:
-            dictionary version of `entry`
+        See `flatten_entry`.
         """
-
-        result = []
-        for key, value in entry.items():
-            if key in ["description", "condition"]:
-                continue
-            new_key = f"{parent_key}.{key}" if parent_key else key
-
-            # dict: use same procedure
-            if isinstance(value, dict):
-                result.extend(self._flatten_dict(value, parent_key=new_key))
-
-            # list: use procedure on each index, if it's a dict. Otherwise, add key/value pair
-            elif isinstance(value, list):
-                for v in value:
-                    if isinstance(v, dict):
-                        result.extend(self._flatten_dict(v, parent_key=new_key))
-                    else:
-                        # If a list item is not a dict, represent it as new_key: [original_list_values]
-                        # This might be different from what was intended. The original code
-                        # `result.append({new_key: value})` would add the whole list 'value' under 'new_key'
-                        # for *each* non-dict item. It seems more logical to add it once.
-                        # Assuming 'value' here is the full list.
-                        result.append({new_key: value})
-                        break  # Add the whole list once and break for this key, assuming all non-dict list items are treated same.
-                        # If each non-dict item needs its own entry, this logic needs refinement.
-
-            # anything else: append key/value pair as is
-            else:
-                result.append({new_key: value})
-        return result
+        return flatten_entry(entry, parent_key=parent_key, result=result)
 
     def get_flat_dicts(self) -> list[dict]:
         """
@@ -454,47 +885,120 @@ class YamlManager(object):
 
         The 'description' and 'condition' fields are not added.
 
+        Rows are flattened once per entry and memoized until `load` changes the entries.
+        The returned list is new on every call, but the rows are shared: DO NOT MODIFY THE ROWS.
+
         Returns:
             list[dict]: well-formatted entries for table conversion
         """
-        output = []
-        for (
-            yaml_doc
-        ) in (
-            self._yaml_dicts
-        ):  # Iterate over each top-level YAML document (which is a dict or a list)
-
-            # The current structure implies self._yaml_dicts is a list of dicts.
-            # If yaml_doc itself is a list of items (e.g., from a single YAML file like valid_list.yaml),
-            # then you need to iterate over its items.
-            # If each yaml_doc in self._yaml_dicts is meant to be one "row" that's processed,
-            # then the inner loop needs to change.
-
-            # Assuming self._yaml_dicts is a list of benchmark entries, where each entry is a dict:
-            current_row_dict = {}
-            # The structure `for item in yaml:` suggests `yaml` is a list of dicts here.
-            # But if `self._yaml_dicts` is already the list of top-level benchmark entries,
-            # then `yaml` in `for yaml in self._yaml_dicts:` is an individual benchmark entry.
-            # Let's adjust this based on the common structure: a list of benchmark entries,
-            # each being a dictionary that needs flattening.
-
-            # Revised logic for get_flat_dicts
-            # If self._yaml_dicts contains elements like:
-            # [{'name': 'item1', 'details': {'sub1': 'value'}}, {'name': 'item2', ...}]
-            # Each 'yaml_doc' from self._yaml_dicts is one dictionary representing one entry.
-            # This entry needs to be flattened.
-            flattened_entry_parts = self._flatten_dict(
-                yaml_doc
-            )  # Flatten the single dictionary
-
-            # Now, combine the flattened parts into a single dictionary for the row
-            current_row_dict = {}
-            for part in flattened_entry_parts:
-                current_row_dict.update(part)  # Merge dictionaries
-
-            output.append(current_row_dict)
-
-        return output
+        if len(self._flat_rows) != len(self._yaml_dicts):
+            # The raw list was changed from outside the manager, start over
+            self._flat_rows = [None] * len(self._yaml_dicts)
+
+        for i, row in enumerate(self._flat_rows):
+            if row is None:
+                self._flat_rows[i] = self._flatten_dict(self._yaml_dicts[i])
+
+        return list(self._flat_rows)
+
+    def get_records(self) -> list[BenchmarkRecord]:
+        """
+        Returns one BenchmarkRecord per entry, built from the memoized flat rows.
+
+        The records are rebuilt only for entries whose flat row was recomputed.
+
+        Returns:
+            list[BenchmarkRecord]: records in the order of the entries
+        """
+        rows = self.get_flat_dicts()
+        records = []
+        for entry, row in zip(self._yaml_dicts, rows):
+            record = self._records.get(id(row))
+            if record is None or record.flat is not row:
+                record = BenchmarkRecord(row, raw=entry)
+            records.append(record)
+        self._records = {id(record.flat): record for record in records}
+        return records
+
+    def iter_entries(
+        self,
+        file_paths: str | list[str] | None = None,
+        verbose: bool = True,
+        cache_dir: str | None = None,
+    ):
+        """
+        Yields entries one at a time, parsing `file_paths` file by file.
+
+        Unlike `load`, the entries are not stored in the manager, so memory stays flat
+        and the first entry is available as soon as its file is parsed. Files are looked
+        up in (and added to) the parse cache, if the manager has one. Files that fail to
+        load are recorded in `load_errors` as (path, message) tuples and skipped; the list
+        is reset when streaming starts. Ids are assigned and duplicate names reported as
+        in `load`.
+
+        Parameters:
+            file_paths (str or list[str] or None, default=None): File path(s) to stream from.
+                None yields the entries already loaded into the manager.
+            verbose (bool, default=True): Whether to print error messages for YAML syntax issues.
+            cache_dir (str or None, default=None): Directory of the parse cache. None keeps the manager's cache.
+        Yields:
+            dict: one raw entry at a time, in file order
+        """
+        if file_paths is None:
+            yield from self._yaml_dicts
+            return
+
+        paths = [file_paths] if isinstance(file_paths, str) else file_paths
+        if cache_dir is not None:
+            self.parse_cache = YamlParseCache(cache_dir)
+
+        self.load_errors = []
+        seen_ids = set()
+        for path in paths:
+            entries, key = None, None
+            if self.parse_cache is not None and os.path.isfile(path):
+                entries, key = self.parse_cache.lookup(path)
+            if entries is None:
+                entries = self._load_serial([path], verbose)[0]
+                if entries is None:
+                    continue
+                if entries and key is not None:
+                    self.parse_cache.store(key, entries)
+            for entry in entries:
+                entry_id = clean_string(entry.get("name", "unknown")).lower()
+                if entry_id in seen_ids:
+                    Console.error(
+                        f"Duplicate entry name found: {entry_id}. Please ensure all entries have unique names."
+                    )
+                seen_ids.add(entry_id)
+                entry["id"] = entry_id
+                yield entry
+
+    def iter_flat(self, file_paths: str | list[str] | None = None, **kwargs):
+        """
+        Yields the flat version of every entry streamed by `iter_entries`.
+
+        Parameters:
+            file_paths (str or list[str] or None): see `iter_entries`
+            kwargs: passed on to `iter_entries`
+        Yields:
+            dict: one flat row at a time, see `flatten_entry`
+        """
+        for entry in self.iter_entries(file_paths, **kwargs):
+            yield flatten_entry(entry)
+
+    def iter_records(self, file_paths: str | list[str] | None = None, **kwargs):
+        """
+        Yields a BenchmarkRecord for every entry streamed by `iter_entries`.
+
+        Parameters:
+            file_paths (str or list[str] or None): see `iter_entries`
+            kwargs: passed on to `iter_entries`
+        Yields:
+            BenchmarkRecord: one record at a time
+        """
+        for entry in self.iter_entries(file_paths, **kwargs):
+            yield BenchmarkRecord(flatten_entry(entry), raw=entry)
 
     # ---------------------------------------------------------------------------------------------------------
     #  Error Checking
@@ -774,6 +1278,8 @@ class YamlManager(object):
         """
         Returns a list of entries where the attribute equals the value.
 
+        The attribute may be dot-separated to filter by a nested field, e.g. "ratings.software.rating".
+
         Parameters:
             attribute (str): name of the attribute to filter by
             value (Any): value to match for the attribute
@@ -788,11 +1294,8 @@ class YamlManager(object):
             )
             return []  # Return empty list if data is not in expected format
 
-        entries = []
-        for entry in self.data:
-            if entry.get(attribute) == value:
-                entries.append(entry)
-        return entries  # Return the list of found entries
+        # The index is built once per attribute, every further lookup is a dict access
+        return list(self._attribute_index(attribute).get(_index_key(value), []))
 
     def get_by_name(
         self, name: str
@@ -805,10 +1308,18 @@ class YamlManager(object):
         Returns:
             dict or None: first entry with the given name, or None if not found
         """
-        for entry in self.data:
-            if entry.get("name") == name:
-                return entry
-        return None
+        return self._index_by_name.get(_index_key(name))
+
+    def get_by_id(self, id: str) -> dict | None:
+        """
+        Returns the benchmark entry with the given id.
+
+        Parameters:
+            id (str): id of the entry, as assigned by `load`
+        Returns:
+            dict or None: entry with the given id, or None if not found
+        """
+        return self._index_by_id.get(id)
 
     def get_citations(self) -> list[str]:  # Changed return type to list[str]
         """
@@ -838,5 +1349,88 @@ class YamlManager(object):
     ) -> str:
         """Write the raw data as JSON to `path` and return the path."""
         with open(path, "w", encoding="utf-8") as f:
-            json.dump(self._yaml_dicts, f, indent=indent, ensure_ascii=ensure_ascii)
+            json.dump(
+                [dict(entry) for entry in self._yaml_dicts],
+                f,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+            )
+        return path
+
+    # ---------------------------------------------------------------------------------------------------------
+    # Catalogue Snapshot
+    # ---------------------------------------------------------------------------------------------------------
+
+    def to_snapshot(self, path: str) -> str:
+        """
+        Writes a compiled snapshot of the catalogue to `path` and returns the path.
+
+        The snapshot is a single JSON file with the raw entries, the flat entries, the ids,
+        and the SHA-256 of every source file, so `from_snapshot` can restore the manager
+        with one file read instead of parsing every YAML file.
+
+        Parameters:
+            path (str): file to write the snapshot to
+        Returns:
+            str: the path written to
+        """
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "sources": [
+                {"path": os.path.normpath(source), "sha256": file_digest(source)}
+                for source in self.sources
+            ],
+            "ids": [entry.get("id") for entry in self._yaml_dicts],
+            "data": [dict(entry) for entry in self._yaml_dicts],
+            "flat": self.get_flat_dicts(),
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False)
         return path
+
+    @classmethod
+    def from_snapshot(cls, path: str, files: list[str] | None = None) -> "YamlManager":
+        """
+        Creates a YamlManager from a snapshot written by `to_snapshot`.
+
+        If `files` is given, the snapshot must have been compiled from exactly these files
+        and none of them may have changed since, otherwise a ValueError is raised so the
+        caller can fall back to loading the YAML files.
+
+        Parameters:
+            path (str): snapshot file to read
+            files (list[str] or None): YAML files the snapshot is expected to represent
+        Returns:
+            YamlManager: manager holding the snapshot contents
+        Raises:
+            FileNotFoundError: if the snapshot does not exist
+            ValueError: if the snapshot is invalid or out of date
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot format in '{path}'")
+
+        sources = snapshot["sources"]
+        if files is not None:
+            expected = [os.path.normpath(file) for file in files]
+            if [source["path"] for source in sources] != expected:
+                raise ValueError(f"Snapshot '{path}' was compiled from different files")
+            for source in sources:
+                if not os.path.isfile(source["path"]) or file_digest(
+                    source["path"]
+                ) != source["sha256"]:
+                    raise ValueError(
+                        f"Snapshot '{path}' is out of date: '{source['path']}' changed"
+                    )
+
+        manager = cls()
+        manager._yaml_dicts = snapshot["data"]
+        manager._flat_rows = snapshot["flat"]
+        manager.sources = [source["path"] for source in sources]
+        manager._index_entries()
+        return manager
@@ -0,0 +1,42 @@
+"""
+Tests for the build history in bin/build_history.py.
+
+    python -m pytest -q tests/test_build_history.py
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from build_history import BuildHistory, check_regression, connect, phase_series  # noqa: E402
+
+
+def test_runs_are_recorded_per_phase(tmp_path):
+    db_path = str(tmp_path / "history.sqlite")
+    for _ in range(2):
+        history = BuildHistory("tex", db_path=db_path)
+        with history.phase("load"):
+            pass
+        for _ in range(3):
+            with history.phase("unicode"):
+                pass
+        history.metric("entries", 74)
+        assert history.save() is not None
+
+    connection = connect(db_path)
+    series = phase_series(connection, "tex")
+    assert set(series) == {("tex", "total"), ("tex", "load"), ("tex", "unicode")}
+    assert all(len(values) == 2 for values in series.values())
+    assert connection.execute("SELECT COUNT(*) FROM metrics").fetchone() == (2,)
+
+
+def test_check_regression():
+    baseline = [10.0, 10.5, 9.8, 10.2, 10.1]
+    assert not check_regression(baseline + [10.4])["regression"]
+    assert check_regression(baseline + [14.0])["regression"]
+    # too few runs for a baseline
+    assert check_regression([1.0, 9.0])["z"] is None
+    # stable millisecond phases are not flagged
+    assert not check_regression([0.001] * 5 + [0.003])["regression"]
@@ -0,0 +1,73 @@
+"""
+Tests for the incremental build manifest in bin/build_manifest.py.
+
+    python -m pytest -q tests/test_build_manifest.py
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from build_manifest import BuildManifest, entry_outputs  # noqa: E402
+
+
+def write_outputs(entries):
+    for entry in entries:
+        path = f"content/md/benchmarks/{entry['id']}.md"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(entry["name"])
+
+
+def test_incremental_build(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    entries = [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]
+
+    manifest = BuildManifest("md", settings={"columns": ["name"]})
+    assert manifest.outdated(entries) == entries
+    write_outputs(entries)
+    manifest.update(entries)
+    manifest.save()
+
+    # nothing changed
+    manifest = BuildManifest("md", settings={"columns": ["name"]})
+    assert manifest.outdated(entries) == []
+
+    # changed data, and a missing output
+    changed = [{"id": "a", "name": "A2"}, {"id": "b", "name": "B"}]
+    assert manifest.outdated(changed) == [changed[0]]
+    os.remove("content/md/benchmarks/b.md")
+    assert manifest.outdated(entries) == [entries[1]]
+
+    # other settings rebuild everything
+    assert BuildManifest("md", settings={"columns": ["date"]}).outdated(entries) == entries
+
+    # outputs of removed entries are deleted
+    assert manifest.remove_stale(entries[1:]) == ["content/md/benchmarks/a.md"]
+    assert not os.path.exists("content/md/benchmarks/a.md")
+
+
+def test_entry_outputs_follow_outdir_and_radar_backend():
+    assert entry_outputs("md", "./content/") == ["content/md/benchmarks/{id}.md"]
+    assert entry_outputs("tex", "/tmp/out", radar_backend="vector") == [
+        "/tmp/out/tex/section/{id}.tex",
+        "/tmp/out/tex/images/{id}_radar.tex",
+        "/tmp/out/tex/images/{id}_radar.svg",
+    ]
+
+
+def test_md_and_mkdocs_share_the_manifest_of_their_pages(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    entries = [{"id": "a", "name": "A"}]
+
+    manifest = BuildManifest("md")
+    write_outputs(entries)
+    manifest.update(entries)
+    manifest.save()
+
+    # mkdocs overwrites the pages of md, and the other way round
+    mkdocs = BuildManifest("mkdocs")
+    assert mkdocs.path == manifest.path
+    assert mkdocs.outdated(entries) == entries
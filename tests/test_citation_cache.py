@@ -0,0 +1,71 @@
+"""
+Tests for the citation cache in bin/citation_cache.py.
+
+    python -m pytest -q tests/test_citation_cache.py
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from citation_cache import CitationCache  # noqa: E402
+
+BIBTEX = """@article{doe2024,
+  author = {Jane Doe and John Smith},
+  title = {A Benchmark},
+  journal = {Journal},
+  year = {2024},
+  doi = {10.1000/xyz},
+  url = {https://example.org/paper}
+}"""
+
+
+def test_citation_fields():
+    cache = CitationCache()
+    citation = cache.get(BIBTEX)
+    assert citation.label == "doe2024"
+    assert citation.authors == ["Jane Doe", "John Smith"]
+    assert citation.doi == "10.1000/xyz"
+    assert citation.url == "https://example.org/paper"
+    assert citation.urls == ["https://example.org/paper"]
+    assert citation.fields["title"] == "A Benchmark"
+    assert citation.parse_error is None
+    assert citation.text.startswith("Jane Doe and John Smith. A benchmark.")
+
+    assert cache.get(BIBTEX) is citation
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_persistent_cache(tmp_path):
+    path = str(tmp_path / "citations.pickle")
+    cache = CitationCache(path)
+    text = cache.get(BIBTEX).text
+    cache.save()
+
+    restored = CitationCache(path)
+    assert len(restored) == 1
+    citation = restored.get(BIBTEX)
+    assert restored.hits == 1
+    assert citation.text == text
+    assert citation.fields["doi"] == "10.1000/xyz"
+
+
+def test_saved_cache_keeps_only_used_citations(tmp_path):
+    path = str(tmp_path / "citations.pickle")
+    other = BIBTEX.replace("doe2024", "other2024")
+    cache = CitationCache(path)
+    cache.get(BIBTEX).doi
+    cache.get(other)
+    cache.save()
+
+    # nothing was formatted, so the next run formats only on demand
+    restored = CitationCache(path)
+    citation = restored.get(BIBTEX)
+    assert citation._parsed() == (True, False)
+    assert citation.text.startswith("Jane Doe")
+    restored.save()
+
+    # the citation that was not looked up is dropped
+    assert len(CitationCache(path)) == 1
@@ -0,0 +1,140 @@
+"""
+Tests for bin/generate_latex.py.
+
+    python -m pytest -q tests/test_generate_latex.py
+"""
+
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from generate_latex import GenerateLatex, RadarChartRenderer, write_stats, write_to_file  # noqa: E402
+
+
+def test_write_to_file_skips_unchanged_content(tmp_path):
+    filename = str(tmp_path / "out" / "table.tex")
+    written, skipped = write_stats["written"], write_stats["skipped"]
+
+    write_to_file("a\nb\n", filename=filename)
+    os.utime(filename, ns=(1, 1))
+    write_to_file("a\nb\n", filename=filename)
+    assert os.stat(filename).st_mtime_ns == 1
+
+    write_to_file("a\nc\n", filename=filename)
+    assert os.stat(filename).st_mtime_ns != 1
+    with open(filename, encoding="utf-8") as f:
+        assert f.read() == "a\nc\n"
+
+    assert write_stats["written"] - written == 2
+    assert write_stats["skipped"] - skipped == 1
+
+
+def test_parallel_radar_charts_are_deterministic(tmp_path):
+    entries = [
+        {"id": "a", "name": "A", "ratings.software.rating": 3, "ratings.dataset.rating": 4, "ratings.metrics.rating": 1},
+        {"id": "b", "name": "B", "ratings.software.rating": 5, "ratings.dataset.rating": 0, "ratings.metrics.rating": 2},
+    ]
+    generator = GenerateLatex(entries)
+    serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+    formats = ["pdf", "png"]
+    assert generator.generate_radar_charts(fmt=formats, output_dir=str(serial)) == []
+    assert generator.generate_radar_charts(fmt=formats, output_dir=str(parallel), parallel=True, workers=2) == []
+    for name in ["a_radar.pdf", "b_radar.pdf", "a_radar.png", "b_radar.png"]:
+        assert (serial / name).read_bytes() == (parallel / name).read_bytes()
+
+
+def test_radar_chart_errors_are_collected(tmp_path):
+    generator = GenerateLatex([{"id": "a", "name": "A", "ratings.software.rating": 3}])
+    generator.entries[0].rating_values["dataset"] = "broken"
+    errors = generator.generate_radar_charts(fmt="png", output_dir=str(tmp_path), parallel=True)
+    assert [name for name, _ in errors] == ["A"]
+
+
+def test_radar_charts_skip_unchanged_inputs(tmp_path):
+    entries = [
+        {"id": "a", "name": "A", "ratings.software.rating": 3, "ratings.dataset.rating": 4},
+        {"id": "b", "name": "B", "ratings.software.rating": 5, "ratings.dataset.rating": 1},
+    ]
+    output_dir = str(tmp_path)
+
+    def render():
+        GenerateLatex(entries).generate_radar_charts(fmt="png", output_dir=output_dir)
+        return {
+            name: os.stat(tmp_path / f"{name}_radar.png").st_mtime_ns
+            for name in ["a", "b"]
+        }
+
+    first = render()
+    entries[1]["ratings.software.rating"] = 2
+    second = render()
+    assert second["a"] == first["a"]
+    assert second["b"] != first["b"]
+
+    # a file changed by someone else is rendered again
+    os.utime(tmp_path / "a_radar.png", ns=(1, 1))
+    third = render()
+    assert third["a"] != 1
+    assert third["b"] == second["b"]
+
+
+def test_reused_radar_template_matches_fresh_figure(tmp_path):
+    ratings = {"software": 3.0, "dataset": 0.0, "metrics": 5.0}
+    reused, fresh = tmp_path / "reused", tmp_path / "fresh"
+    reused.mkdir()
+    fresh.mkdir()
+
+    renderer = RadarChartRenderer()
+    renderer.render("Other benchmark", "x", {"software": 1.0, "dataset": 2.0, "metrics": 0.0}, ["png"], str(reused))
+    renderer.render("A benchmark", "a", ratings, ["pdf", "png"], str(reused))
+    renderer.close()
+
+    renderer = RadarChartRenderer()
+    renderer.render("A benchmark", "a", ratings, ["pdf", "png"], str(fresh))
+    renderer.close()
+
+    for name in ["a_radar.pdf", "a_radar.png"]:
+        assert (reused / name).read_bytes() == (fresh / name).read_bytes()
+
+
+def test_composed_radar_grid_pages(tmp_path):
+    entries = [
+        {"id": name, "name": name.upper(), "ratings.software.rating": 3, "ratings.dataset.rating": 4}
+        for name in ["a", "b", "c"]
+    ]
+    grid_file = tmp_path / "radar_grid.tex"
+
+    def grid(entries):
+        return GenerateLatex(entries).generate_radar_chart_grid(
+            filename=str(grid_file), columns=2, rows=1, composed=True, output_dir=str(tmp_path)
+        )
+
+    content = grid(entries)
+    assert content.count("\\includegraphics") == 2
+    assert "{images/radar_grid_2.pdf}" in content
+    first = (tmp_path / "radar_grid_1.pdf").stat().st_mtime_ns
+
+    # an unchanged page is not rendered again, a page that is no longer needed is removed
+    content = grid(entries[:2])
+    assert content.count("\\includegraphics") == 1
+    assert (tmp_path / "radar_grid_1.pdf").stat().st_mtime_ns == first
+    assert not (tmp_path / "radar_grid_2.pdf").exists()
+
+
+def test_radar_manifest_is_kept_when_unchanged(tmp_path):
+    entries = [
+        {"id": name, "name": name.upper(), "ratings.software.rating": 3, "ratings.dataset.rating": 4}
+        for name in ["a", "b"]
+    ]
+    manifest = tmp_path / "radar_manifest.json"
+
+    GenerateLatex(entries).generate_radar_charts(fmt="svg", output_dir=str(tmp_path))
+    os.utime(manifest, ns=(1, 1))
+    GenerateLatex(entries).generate_radar_charts(fmt="svg", output_dir=str(tmp_path))
+    assert manifest.stat().st_mtime_ns == 1
+
+    # a removed entry is dropped from the manifest
+    GenerateLatex(entries[:1]).generate_radar_charts(fmt="svg", output_dir=str(tmp_path))
+    assert list(json.loads(manifest.read_text())) == ["a_radar.svg"]
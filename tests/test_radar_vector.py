@@ -0,0 +1,50 @@
+"""
+Tests for the TikZ and SVG radar charts in bin/radar_vector.py.
+
+    python -m pytest -q tests/test_radar_vector.py
+"""
+
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from radar_vector import radar_chart_svg, radar_chart_tikz  # noqa: E402
+
+RATINGS = {"software": 3.0, "dataset": 4.0, "reference_solution": 0.0, "metrics": 5.0}
+
+
+def test_tikz_chart():
+    tikz = radar_chart_tikz("Q&A_bench", RATINGS)
+    assert tikz.startswith("% Generated") and tikz.rstrip().endswith("\\end{tikzpicture}")
+    assert "(0:1.8) -- (90:2.4) -- (180:0) -- (270:3) -- cycle" in tikz
+    assert "{reference\\_solution}" in tikz
+    assert "{Q\\&A\\_bench}" in tikz
+    assert tikz.count("circle (") == 5
+    assert radar_chart_tikz("Q&A_bench", RATINGS) == tikz
+
+
+def test_svg_chart():
+    svg = ET.fromstring(radar_chart_svg("A <b> benchmark", RATINGS))
+    ns = "{http://www.w3.org/2000/svg}"
+    assert svg.find(f"{ns}title").text == "A <b> benchmark"
+    assert len(svg.find(f"{ns}polygon").get("points").split()) == len(RATINGS)
+    labels = [text.text for text in svg.iter(f"{ns}text") if text.get("dominant-baseline")]
+    assert labels == list(RATINGS)
+
+
+def test_vector_charts_do_not_import_matplotlib(tmp_path):
+    script = (
+        "import sys, generate_latex;"
+        "g = generate_latex.GenerateLatex([{'id': 'a', 'name': 'A', 'ratings.software.rating': 3}]);"
+        f"assert g.generate_radar_charts(fmt=['tex', 'svg'], output_dir={str(tmp_path)!r}) == [];"
+        "assert 'matplotlib' not in sys.modules and 'numpy' not in sys.modules"
+    )
+    # GenerateLatex creates content/tex/section in the working directory
+    env = {**os.environ, "PYTHONPATH": os.path.join(ROOT, "bin")}
+    subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env, check=True)
+    assert (tmp_path / "a_radar.tex").exists()
+    assert (tmp_path / "a_radar.svg").exists()
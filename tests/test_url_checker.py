@@ -0,0 +1,232 @@
+"""
+Tests for the URL checker in bin/url_checker.py. No network access is needed:
+the checks are replaced by a fake or run against a local HTTP server.
+
+    python -m pytest -q tests/test_url_checker.py
+"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from url_cache import URLCheckCache  # noqa: E402
+from url_checker import URLChecker, url_key  # noqa: E402
+
+ENTRIES = [
+    {"id": "a", "name": "A", "url": "https://one.org/a", "datasets.url": "https://two.org/a"},
+    {"id": "b", "name": "B", "url": "https://one.org/b", "results.url": "https://one.org/a"},
+    {"id": "c", "name": "C", "url": "https://two.org/broken"},
+]
+
+
+class FakeChecker(URLChecker):
+    def __init__(self, entries):
+        super().__init__(entries, ignore_check=[])
+        self.lock = threading.Lock()
+        self.active = {}
+        self.max_active = {}
+
+    def is_url_valid(self, url, timeout=10):
+        host = url.split("/")[2]
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.max_active[host] = max(self.max_active.get(host, 0), self.active[host])
+        time.sleep(0.05)
+        with self.lock:
+            self.active[host] -= 1
+        print(f"checked {url}")
+        if "broken" in url:
+            return False, "Not Found", 404
+        return True, "Valid URL", 200
+
+
+def test_concurrent_check_prints_like_sequential_check(capsys):
+    sequential = FakeChecker(ENTRIES)
+    assert sequential.check_urls() is False
+    expected = capsys.readouterr().out
+
+    concurrent = FakeChecker(ENTRIES)
+    assert concurrent.check_urls(workers=4, per_host=1) is False
+    output = capsys.readouterr().out
+
+    # the concurrent run only adds one line before the checks
+    lines = [line for line in output.splitlines() if "workers" not in line]
+    assert lines == expected.splitlines()
+    assert concurrent.max_active == {"one.org": 1, "two.org": 1}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+    body = b"x" * 1_000_000
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, send_body):
+        Handler.requests.append((self.command, self.path, self.client_address[1]))
+        if self.path == "/etag" and self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        if self.path == "/nohead" and self.command == "HEAD":
+            self.send_response(405)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            self.send_response(404)
+        elif self.path.startswith("/forbidden"):
+            self.send_response(403)
+        else:
+            self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        if send_body:
+            try:
+                self.wfile.write(self.body)
+            except OSError:
+                pass  # the client closed the connection without reading the body
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    Handler.requests = []
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_probe_uses_head_and_keeps_the_connection(server):
+    base = server
+    checker = URLChecker([], ignore_check=[])
+    assert checker.is_url_valid(f"{base}/a")[0]
+    assert checker.is_url_valid(f"{base}/b")[0]
+    assert checker.is_url_valid(f"{base}/nohead") == (True, "Valid URL", 200)
+    assert checker.is_url_valid(f"{base}/missing")[2] == 404
+
+    methods = [(method, path) for method, path, _ in Handler.requests]
+    assert methods[:4] == [("HEAD", "/a"), ("HEAD", "/b"), ("HEAD", "/nohead"), ("GET", "/nohead")]
+    # the first two requests share one connection
+    assert Handler.requests[0][2] == Handler.requests[1][2]
+
+
+def test_cached_results_are_skipped_and_revalidated(server, tmp_path):
+    path = str(tmp_path / "url_checks.json")
+    cache = URLCheckCache(path, ttl=3600)
+    checker = URLChecker([], ignore_check=[], cache=cache)
+    url = f"{server}/etag"
+
+    assert checker.is_url_valid(url) == (True, "Valid URL", 200)
+    assert checker.is_url_valid(url) == (True, "Valid URL (cached)", 200)
+    assert len(Handler.requests) == 1
+
+    # an expired result is confirmed by a conditional request
+    cache.ttl = 0
+    assert checker.is_url_valid(url) == (True, "Valid URL", 304)
+    assert cache.revalidated == 1
+
+    # invalid URLs are not kept
+    assert not checker.is_url_valid(f"{server}/missing")[0]
+    cache.save()
+    assert list(URLCheckCache(path)._results) == [url]
+
+
+def test_equivalent_urls_are_checked_once(capsys):
+    entries = [
+        {"id": "a", "name": "A", "url": "https://doi.org/10.1/X", "code.url": "https://github.com/o/r/"},
+        {"id": "b", "name": "B", "url": "http://dx.doi.org/10.1/X", "code.url": "https://www.github.com/o/r#readme"},
+        {"id": "c", "name": "C", "url": "https://doi.org/10.1/broken"},
+        {"id": "d", "name": "D", "url": "https://doi.org/10.1/broken/"},
+    ]
+    checker = FakeChecker(entries)
+    checked = []
+    is_url_valid = checker.is_url_valid
+    checker.is_url_valid = lambda url: checked.append(url) or is_url_valid(url)
+
+    assert checker.check_urls() is False
+    assert checked == ["https://doi.org/10.1/X", "https://github.com/o/r/", "https://doi.org/10.1/broken"]
+    assert [result["is_valid"] for _, result in checker.results["B"]] == [True, True]
+    assert [result["status_code"] for _, result in checker.results["D"]] == [404]
+    assert "Entries 'C', 'D' have an issue" in capsys.readouterr().out
+
+
+def test_url_key_keeps_the_case_of_path_and_query():
+    assert url_key("HTTPS://WWW.GitHub.com/Owner/Repo/#readme") == "github.com/Owner/Repo"
+    assert url_key("https://openreview.net/forum?id=hMj6jZ6JWU") != url_key(
+        "https://openreview.net/forum?id=hmj6jz6jwu"
+    )
+    assert url_key("http://dx.doi.org/10.1/X") == url_key("https://doi.org/10.1/X")
+
+
+class FakeFetcher:
+    started = []
+
+    def __init__(self):
+        self.pages = []
+        self.closed = False
+        FakeFetcher.started.append(self)
+
+    def fetch_page_html(self, url, wait_time=10):
+        self.pages.append(url)
+        time.sleep(0.05)
+        return "<html><body>ok</body></html>"
+
+    def close(self):
+        self.closed = True
+
+
+def test_forbidden_urls_are_retried_in_pooled_browsers(server, capsys):
+    entries = [{"id": c, "name": c.upper(), "url": f"{server}/forbidden/{c}"} for c in "abcdef"]
+    checker = URLChecker(entries, ignore_check=[], browsers=2)
+    checker.browsers.factory = FakeFetcher
+    FakeFetcher.started = []
+
+    assert checker.check_urls(workers=4, per_host=4) is True
+    assert 1 <= len(FakeFetcher.started) <= 2
+    assert sum(len(fetcher.pages) for fetcher in FakeFetcher.started) == 6
+    assert all(fetcher.closed for fetcher in FakeFetcher.started)
+
+    # a browser that cannot be started is tried once
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise RuntimeError("Chrome not found")
+
+    checker.browsers.factory = broken
+    assert checker.check_urls(workers=4, per_host=4) is False
+    assert len(attempts) == 1
+    assert checker.results["F"][0][1]["status_code"] == 403
+    assert "Chrome not found" in capsys.readouterr().out
+
+
+def test_browser_results_are_cached(server, tmp_path):
+    cache = URLCheckCache(str(tmp_path / "url_checks.json"), ttl=3600)
+    checker = URLChecker([], ignore_check=[], cache=cache)
+    checker.browsers.factory = FakeFetcher
+    FakeFetcher.started = []
+    url = f"{server}/forbidden/x"
+
+    assert checker.is_url_valid(url) == (True, "Valid URL", 403)
+    assert checker.is_url_valid(url) == (True, "Valid URL (cached)", 403)
+    assert sum(len(fetcher.pages) for fetcher in FakeFetcher.started) == 1
+    assert cache.fresh(url)["method"] == "browser"
@@ -0,0 +1,62 @@
+"""
+Tests for the on-disk YAML parse cache in bin/yaml_cache.py.
+
+    python -m pytest -q tests/test_yaml_cache.py
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from yaml_cache import YamlParseCache  # noqa: E402
+from yaml_manager import YamlManager  # noqa: E402
+
+
+def _write(path, name):
+    path.write_text(f'- name: "{name}"\n  domain:\n  - Physics\n', encoding="utf-8")
+
+
+def test_lookup_miss_store_hit(tmp_path):
+    source = tmp_path / "benchmark-a.yaml"
+    _write(source, "A")
+    cache = YamlParseCache(str(tmp_path / "cache"))
+
+    entries, key = cache.lookup(str(source))
+    assert entries is None
+    cache.store(key, [{"name": "A"}])
+
+    entries, _ = cache.lookup(str(source))
+    assert entries == [{"name": "A"}]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_touched_file_with_same_content_is_a_hit(tmp_path):
+    source = tmp_path / "benchmark-a.yaml"
+    _write(source, "A")
+    cache = YamlParseCache(str(tmp_path / "cache"))
+    _, key = cache.lookup(str(source))
+    cache.store(key, [{"name": "A"}])
+
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    entries, _ = cache.lookup(str(source))
+    assert entries == [{"name": "A"}]
+
+
+def test_manager_reparses_only_changed_files(tmp_path):
+    a = tmp_path / "benchmark-a.yaml"
+    b = tmp_path / "benchmark-b.yaml"
+    _write(a, "A")
+    _write(b, "B")
+    cache_dir = str(tmp_path / "cache")
+    YamlManager([str(a), str(b)], cache_dir=cache_dir)
+
+    _write(b, "Bee")
+    stat = os.stat(b)
+    os.utime(b, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    manager = YamlManager([str(a), str(b)], cache_dir=cache_dir)
+
+    assert [entry["name"] for entry in manager] == ["A", "Bee"]
+    assert (manager.parse_cache.hits, manager.parse_cache.misses) == (1, 1)
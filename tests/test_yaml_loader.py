@@ -0,0 +1,50 @@
+"""
+Checks that the shared loader in bin/yaml_loader.py parses every file under
+source/ exactly like the pure Python yaml.SafeLoader.
+
+Run from the repository root:
+
+    python -m pytest -q tests/test_yaml_loader.py
+"""
+
+import glob
+import os
+import sys
+
+import pytest
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+import yaml_loader  # noqa: E402
+
+SOURCE_FILES = sorted(
+    glob.glob(os.path.join(ROOT, "source", "**", "*.yaml"), recursive=True)
+)
+
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def test_source_files_found():
+    assert SOURCE_FILES
+
+
+@pytest.mark.skipif(not yaml_loader.LIBYAML, reason="PyYAML built without libyaml")
+def test_uses_libyaml_loader():
+    assert yaml_loader.SafeLoader is yaml.CSafeLoader
+
+
+@pytest.mark.parametrize(
+    "path", SOURCE_FILES, ids=lambda p: os.path.relpath(p, ROOT)
+)
+def test_parity_with_pure_python_loader(path):
+    text = _read(path)
+    expected = yaml.load(text, Loader=yaml.SafeLoader)
+    actual = yaml_loader.safe_load(text)
+    assert actual == expected
+    # == treats 1 and 1.0 or True and 1 as equal, so compare the types as well
+    assert repr(actual) == repr(expected)
@@ -0,0 +1,168 @@
+"""
+Tests for YamlManager in bin/yaml_manager.py.
+
+    python -m pytest -q tests/test_yaml_manager.py
+"""
+
+import glob
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "bin"))
+
+from yaml_manager import BenchmarkRecord, YamlManager  # noqa: E402
+
+SOURCE_FILES = sorted(glob.glob(os.path.join(ROOT, "source", "benchmark-*.yaml")))
+
+
+def test_snapshot_round_trip(tmp_path):
+    manager = YamlManager(SOURCE_FILES)
+    path = manager.to_snapshot(str(tmp_path / "snapshot.json"))
+
+    restored = YamlManager.from_snapshot(path, files=SOURCE_FILES)
+    assert restored.data == manager.data
+    assert restored.get_flat_dicts() == manager.get_flat_dicts()
+
+
+def test_snapshot_rejects_changed_sources(tmp_path):
+    source = tmp_path / "benchmark-a.yaml"
+    source.write_text('- name: "A"\n', encoding="utf-8")
+    path = YamlManager([str(source)]).to_snapshot(str(tmp_path / "snapshot.json"))
+
+    source.write_text('- name: "B"\n', encoding="utf-8")
+    with pytest.raises(ValueError):
+        YamlManager.from_snapshot(path, files=[str(source)])
+
+
+def test_flatten_dict_returns_single_dict():
+    entry = {
+        "name": "A",
+        "description": "ignored",
+        "ratings": {"software": {"rating": 3, "reason": "ok"}},
+        "keywords": ["x", "y"],
+        "datasets": {"links": [{"name": "d", "url": "u"}]},
+    }
+    assert YamlManager()._flatten_dict(entry) == {
+        "name": "A",
+        "ratings.software.rating": 3,
+        "ratings.software.reason": "ok",
+        "keywords": ["x", "y"],
+        "datasets.links.name": "d",
+        "datasets.links.url": "u",
+    }
+
+
+def test_flat_rows_are_memoized_until_load():
+    manager = YamlManager(SOURCE_FILES[:2])
+    first = manager.flat
+    assert manager.flat[0] is first[0]
+
+    manager.load(SOURCE_FILES[2:3], overwrite=False)
+    assert manager.flat[0] is first[0]
+    assert len(manager.flat) == len(manager) == 3
+
+    manager.load(SOURCE_FILES[:1])
+    assert manager.flat[0] is not first[0]
+    assert manager.flat[0] == first[0]
+
+
+def test_indexes():
+    manager = YamlManager(SOURCE_FILES)
+    first = manager[0]
+    assert manager.get_by_name(first["name"]) is first
+    assert manager.get_by_id(first["id"]) is first
+    assert manager.get_by_name("no such benchmark") is None
+
+    domain = first["domain"]
+    expected = [entry for entry in manager if entry.get("domain") == domain]
+    assert manager.get_entries("domain", domain) == expected
+
+    rating = manager.flat[0]["ratings.software.rating"]
+    expected = [
+        entry
+        for entry, row in zip(manager, manager.flat)
+        if row.get("ratings.software.rating") == rating
+    ]
+    assert manager.get_entries("ratings.software.rating", rating) == expected
+
+
+def test_lazy_entries_parse_only_on_demand():
+    eager = YamlManager(SOURCE_FILES)
+    lazy = YamlManager(SOURCE_FILES, lazy=True)
+
+    assert [(e["id"], e.get("date"), e["name"]) for e in lazy] == [
+        (e["id"], e.get("date"), e["name"]) for e in eager
+    ]
+    assert not any(entry.materialized for entry in lazy)
+
+    assert lazy[0]["cite"] == eager[0]["cite"]
+    assert lazy[0].materialized
+    assert lazy.data == eager.data
+
+
+def test_records_parse_ratings_and_urls():
+    record = BenchmarkRecord.from_raw(
+        {
+            "id": "a",
+            "name": "A",
+            "url": "https://example.org",
+            "ratings": {
+                "software": {"rating": 4, "reason": "ok"},
+                "dataset": {"rating": "N/A", "reason": ""},
+            },
+            "cite": ["@misc{a2024,\n  url={https://example.org/paper}\n}"],
+        }
+    )
+    assert record["ratings.software.rating"] == 4
+    assert record.ratings["software"] == {"rating": 4, "reason": "ok"}
+    assert record.rating_values == {"software": 4.0, "dataset": 0.0}
+    assert record.average_rating == 4.0
+    assert record.citation_labels == ["a2024"]
+    assert record.urls == ["https://example.org", "https://example.org/paper"]
+
+    manager = YamlManager(SOURCE_FILES[:3])
+    records = manager.get_records()
+    assert [dict(r) for r in records] == manager.get_flat_dicts()
+    assert manager.get_records()[0] is records[0]
+
+
+def test_iter_entries_streams_without_storing():
+    manager = YamlManager()
+    stream = manager.iter_entries(SOURCE_FILES[:3])
+    first = next(stream)
+    assert len(manager) == 0
+    entries = [first] + list(stream)
+    assert entries == YamlManager(SOURCE_FILES[:3]).data
+    assert [r.id for r in manager.iter_records(SOURCE_FILES[:3])] == [
+        e["id"] for e in entries
+    ]
+
+
+def test_iter_entries_records_load_errors(tmp_path):
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("name: not a list\n", encoding="utf-8")
+    missing = str(tmp_path / "missing.yaml")
+    manager = YamlManager()
+    manager.load_errors = [("old.yaml", "from an earlier load")]
+
+    entries = list(manager.iter_entries([missing, str(broken), SOURCE_FILES[0]], verbose=False))
+    assert entries == YamlManager(SOURCE_FILES[:1]).data
+    assert [path for path, _ in manager.load_errors] == [missing, str(broken)]
+    assert all(message for _, message in manager.load_errors)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_load_collects_errors_and_keeps_order(tmp_path, parallel):
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("- name: [unclosed\n", encoding="utf-8")
+    files = [SOURCE_FILES[2], str(broken), SOURCE_FILES[0], SOURCE_FILES[1]]
+
+    manager = YamlManager(files, parallel=parallel)
+    expected = YamlManager(files[:1] + files[2:]).data
+    assert [entry["id"] for entry in manager.data] == [entry["id"] for entry in expected]
+    assert manager.data == expected
+    assert [path for path, _ in manager.load_errors] == [str(broken)]
+    assert "YAML syntax error" in manager.load_errors[0][1]